@@ -0,0 +1,69 @@
+"""add_pagination_checkpoints
+
+Revision ID: 5a7d2c91e3b4
+Revises: 4fe052547c61
+Create Date: 2026-10-17 09:12:31.504812
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5a7d2c91e3b4"
+down_revision: Union[str, Sequence[str], None] = "4fe052547c61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "pagination_checkpoints",
+        sa.Column("fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("endpoint", sa.String(), nullable=False),
+        sa.Column("params", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("run_id", sa.String(), nullable=False),
+        sa.Column(
+            "completed_pages",
+            postgresql.ARRAY(sa.Integer()),
+            server_default="{}",
+            nullable=False,
+        ),
+        sa.Column("last_index", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("fingerprint"),
+    )
+
+    op.execute(
+        """
+        CREATE TRIGGER set_updated_at_pagination_checkpoints
+        BEFORE UPDATE ON pagination_checkpoints
+        FOR EACH ROW
+        EXECUTE FUNCTION set_updated_at();
+    """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS set_updated_at_pagination_checkpoints "
+        "ON pagination_checkpoints"
+    )
+    op.drop_table("pagination_checkpoints")
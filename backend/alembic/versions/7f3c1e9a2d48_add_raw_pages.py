@@ -0,0 +1,73 @@
+"""add_raw_pages
+
+Revision ID: 7f3c1e9a2d48
+Revises: e2b9a4d7f015
+Create Date: 2026-10-17 15:22:41.604913
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7f3c1e9a2d48"
+down_revision: Union[str, Sequence[str], None] = "e2b9a4d7f015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "raw_pages",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("entity", sa.String(), nullable=False),
+        sa.Column("run_id", sa.String(), nullable=False),
+        sa.Column("endpoint", sa.String(), nullable=True),
+        sa.Column("params", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("record_count", sa.Integer(), nullable=False),
+        sa.Column("payload", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_raw_pages_entity_run",
+        "raw_pages",
+        ["entity", "run_id", "id"],
+        unique=False,
+    )
+
+    # Raw pages are large, repetitive JSON; lz4 compresses them faster than
+    # the default pglz.
+    op.execute("ALTER TABLE raw_pages ALTER COLUMN payload SET COMPRESSION lz4")
+
+    op.execute(
+        """
+        CREATE TRIGGER set_updated_at_raw_pages
+        BEFORE UPDATE ON raw_pages
+        FOR EACH ROW
+        EXECUTE FUNCTION set_updated_at();
+    """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER IF EXISTS set_updated_at_raw_pages ON raw_pages")
+    op.drop_index("idx_raw_pages_entity_run", table_name="raw_pages")
+    op.drop_table("raw_pages")
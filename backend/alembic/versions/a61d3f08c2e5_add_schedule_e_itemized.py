@@ -0,0 +1,95 @@
+"""add_schedule_e_itemized
+
+Revision ID: a61d3f08c2e5
+Revises: 7f3c1e9a2d48
+Create Date: 2026-10-17 16:48:12.271035
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a61d3f08c2e5"
+down_revision: Union[str, Sequence[str], None] = "7f3c1e9a2d48"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    support_oppose_enum = postgresql.ENUM(
+        "S", "O", name="support_oppose_enum", create_type=False
+    )
+    op.create_table(
+        "schedule_e_itemized",
+        sa.Column("sub_id", sa.String(), nullable=False),
+        sa.Column("cycle", sa.Integer(), nullable=False),
+        sa.Column("committee_id", sa.String(), nullable=True),
+        sa.Column("candidate_id", sa.String(), nullable=True),
+        sa.Column("candidate_name", sa.String(), nullable=True),
+        sa.Column("support_oppose_indicator", support_oppose_enum, nullable=True),
+        sa.Column("expenditure_date", sa.Date(), nullable=True),
+        sa.Column("dissemination_date", sa.Date(), nullable=True),
+        sa.Column("expenditure_amount", sa.Numeric(14, 2), nullable=True),
+        sa.Column("payee_name", sa.String(), nullable=True),
+        sa.Column("expenditure_description", sa.Text(), nullable=True),
+        sa.Column("memo_code", sa.String(length=1), nullable=True),
+        sa.Column("memoed_subtotal", sa.Boolean(), nullable=True),
+        sa.Column("amendment_indicator", sa.String(length=1), nullable=True),
+        sa.Column("file_number", sa.Integer(), nullable=True),
+        sa.Column("image_number", sa.String(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("sub_id", "cycle"),
+        postgresql_partition_by="LIST (cycle)",
+    )
+    op.create_index(
+        "idx_schedule_e_itemized_candidate",
+        "schedule_e_itemized",
+        ["candidate_id", "cycle"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_schedule_e_itemized_committee",
+        "schedule_e_itemized",
+        ["committee_id"],
+        unique=False,
+    )
+
+    # Per-cycle partitions are created by the ingestor before it writes a
+    # cycle. No default partition: once one held a cycle's rows, that
+    # cycle's partition could no longer be created.
+
+    op.execute(
+        """
+        CREATE TRIGGER set_updated_at_schedule_e_itemized
+        BEFORE UPDATE ON schedule_e_itemized
+        FOR EACH ROW
+        EXECUTE FUNCTION set_updated_at();
+    """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS set_updated_at_schedule_e_itemized "
+        "ON schedule_e_itemized"
+    )
+    # Dropping the parent drops every partition with it.
+    op.drop_table("schedule_e_itemized")
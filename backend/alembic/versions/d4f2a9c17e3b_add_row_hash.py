@@ -0,0 +1,44 @@
+"""add_row_hash
+
+Revision ID: d4f2a9c17e3b
+Revises: a61d3f08c2e5
+Create Date: 2026-10-17 19:05:41.518220
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4f2a9c17e3b"
+down_revision: Union[str, Sequence[str], None] = "a61d3f08c2e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Ingested tables that skip unchanged rows by content hash. Adding the
+# column to the partitioned schedule_e_itemized parent adds it to every
+# partition.
+HASHED_TABLES = (
+    "candidates",
+    "committees",
+    "inside_totals_by_candidate",
+    "schedule_e_totals_by_candidate",
+    "schedule_e_itemized",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table_name in HASHED_TABLES:
+        op.add_column(
+            table_name, sa.Column("row_hash", sa.LargeBinary(), nullable=True)
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in reversed(HASHED_TABLES):
+        op.drop_column(table_name, "row_hash")
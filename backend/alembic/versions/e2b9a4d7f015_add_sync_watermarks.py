@@ -0,0 +1,60 @@
+"""add_sync_watermarks
+
+Revision ID: e2b9a4d7f015
+Revises: c84e1f0b6d27
+Create Date: 2026-10-17 14:05:52.338170
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e2b9a4d7f015"
+down_revision: Union[str, Sequence[str], None] = "c84e1f0b6d27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "sync_watermarks",
+        sa.Column("entity", sa.String(), nullable=False),
+        sa.Column("field", sa.String(), nullable=False),
+        sa.Column("high_water", sa.Date(), nullable=False),
+        sa.Column("run_id", sa.String(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("entity"),
+    )
+
+    op.execute(
+        """
+        CREATE TRIGGER set_updated_at_sync_watermarks
+        BEFORE UPDATE ON sync_watermarks
+        FOR EACH ROW
+        EXECUTE FUNCTION set_updated_at();
+    """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "DROP TRIGGER IF EXISTS set_updated_at_sync_watermarks ON sync_watermarks"
+    )
+    op.drop_table("sync_watermarks")
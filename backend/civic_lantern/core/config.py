@@ -17,6 +17,13 @@ class Settings(BaseSettings):
     DATABASE_URL_ASYNC: str
     TEST_DATABASE_URL_ASYNC: str
     FEC_API_KEY: str | None = None
+    FEC_API_KEYS: str | None = None
+    FEC_CACHE_DIR: str | None = None
+    FEC_CACHE_TTL_SECONDS: int = 24 * 3600
+    FEC_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    TRANSFORM_WORKERS: int = 0
+    TRANSFORM_POOL_MIN_RECORDS: int = 1000
+    UPSERT_WORKERS: int = 1
     ALLOWED_ORIGINS: str = "http://localhost:3000"
 
     model_config = ConfigDict(
@@ -30,6 +37,13 @@ class Settings(BaseSettings):
         origins = self.ALLOWED_ORIGINS.split(",")
         return [origin.strip() for origin in origins if origin.strip()]
 
+    @property
+    def fec_api_keys_list(self) -> list[str]:
+        if self.FEC_API_KEYS:
+            keys = self.FEC_API_KEYS.split(",")
+            return [key.strip() for key in keys if key.strip()]
+        return [self.FEC_API_KEY] if self.FEC_API_KEY else []
+
 
 @lru_cache()
 def get_settings() -> Settings:
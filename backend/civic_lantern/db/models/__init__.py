@@ -4,7 +4,12 @@ from .committee import Committee
 from .inside_totals_by_candidate import InsideTotalsByCandidate
 from .mv_candidate_spending_summary import MvCandidateSpendingSummary
 from .mv_election_spending_summary import MvElectionSpendingSummary
+from .page_dead_letter import PageDeadLetter
+from .pagination_checkpoint import PaginationCheckpoint
+from .raw_page import RawPage
+from .schedule_e_itemized import ScheduleEItemized
 from .schedule_e_totals_by_candidate import ScheduleETotalsByCandidate
+from .sync_watermark import SyncWatermark
 
 __all__ = [
     "Base",
@@ -13,6 +18,11 @@ __all__ = [
     "Committee",
     "InsideTotalsByCandidate",
     "ScheduleETotalsByCandidate",
+    "ScheduleEItemized",
     "MvCandidateSpendingSummary",
     "MvElectionSpendingSummary",
+    "PageDeadLetter",
+    "PaginationCheckpoint",
+    "RawPage",
+    "SyncWatermark",
 ]
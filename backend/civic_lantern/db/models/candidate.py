@@ -13,10 +13,10 @@ from sqlalchemy.dialects.postgresql import ARRAY
 
 from civic_lantern.db.models.base import Base, enum_values_callable
 from civic_lantern.db.models.enums import OfficeTypeEnum
-from civic_lantern.db.models.mixins import TimestampMixin
+from civic_lantern.db.models.mixins import ContentHashMixin, TimestampMixin
 
 
-class Candidate(Base, TimestampMixin):
+class Candidate(Base, TimestampMixin, ContentHashMixin):
     __tablename__ = "candidates"
     __table_args__ = (
         Index("idx_candidates_state_office", "state", "office"),
@@ -4,10 +4,10 @@ from sqlalchemy.dialects.postgresql import ARRAY
 
 from civic_lantern.db.models.base import Base, enum_values_callable
 from civic_lantern.db.models.enums import CommitteeTypeEnum
-from civic_lantern.db.models.mixins import TimestampMixin
+from civic_lantern.db.models.mixins import ContentHashMixin, TimestampMixin
 
 
-class Committee(Base, TimestampMixin):
+class Committee(Base, TimestampMixin, ContentHashMixin):
     __tablename__ = "committees"
 
     committee_id = Column(String, primary_key=True, nullable=False)
@@ -2,10 +2,10 @@ from sqlalchemy import Column, ForeignKey, Integer, Numeric, String
 from sqlalchemy.orm import relationship
 
 from civic_lantern.db.models.base import Base
-from civic_lantern.db.models.mixins import TimestampMixin
+from civic_lantern.db.models.mixins import ContentHashMixin, TimestampMixin
 
 
-class InsideTotalsByCandidate(Base, TimestampMixin):
+class InsideTotalsByCandidate(Base, TimestampMixin, ContentHashMixin):
     __tablename__ = "inside_totals_by_candidate"
 
     candidate_id = Column(
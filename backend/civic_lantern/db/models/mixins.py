@@ -1,4 +1,4 @@
-from sqlalchemy import DDL, Column, DateTime, event, func
+from sqlalchemy import DDL, Column, DateTime, LargeBinary, event, func
 from sqlalchemy.orm import declarative_mixin
 
 CREATE_FUNC_DDL = DDL("""
@@ -42,3 +42,14 @@ class TimestampMixin:
         event.listen(
             cls.__table__, "after_create", trigger_ddl.execute_if(dialect="postgresql")
         )
+
+
+class ContentHashMixin:
+    """Digest of the row's ingested columns, written by BaseService upserts.
+
+    Lets re-syncs skip rows whose content hasn't changed without sending
+    them to Postgres. NULL (rows written before the column existed) never
+    matches, so those rows are rewritten once.
+    """
+
+    row_hash = Column(LargeBinary, nullable=True)
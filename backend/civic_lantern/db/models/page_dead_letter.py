@@ -0,0 +1,33 @@
+from sqlalchemy import Column, DateTime, Integer, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+
+from civic_lantern.db.models.base import Base
+from civic_lantern.db.models.mixins import TimestampMixin
+
+
+class PageDeadLetter(Base, TimestampMixin):
+    """A page that still failed after pagination's second retry pass."""
+
+    __tablename__ = "page_dead_letters"
+    __table_args__ = (UniqueConstraint("fingerprint", "page"),)
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    # Registry name of the ingestor that owns the query.
+    entity = Column(String, nullable=False)
+    run_id = Column(String, nullable=False)
+    # Same query fingerprint as pagination_checkpoints.
+    fingerprint = Column(String(64), nullable=False)
+    endpoint = Column(String, nullable=False)
+    params = Column(JSONB, nullable=False)
+    page = Column(Integer, nullable=False)
+    error = Column(Text, nullable=False)
+    attempts = Column(Integer, nullable=False, server_default="1")
+    resolved_at = Column(DateTime(timezone=True))
+
+    def __repr__(self) -> str:
+        return (
+            f"<PageDeadLetter("
+            f"entity='{self.entity}', "
+            f"page={self.page}, "
+            f"attempts={self.attempts})>"
+        )
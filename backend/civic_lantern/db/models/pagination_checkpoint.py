@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+
+from civic_lantern.db.models.base import Base
+from civic_lantern.db.models.mixins import TimestampMixin
+
+
+class PaginationCheckpoint(Base, TimestampMixin):
+    """Progress of one paginated FEC query, so interrupted runs can resume."""
+
+    __tablename__ = "pagination_checkpoints"
+
+    # sha256 of the endpoint URL and its query params (minus api_key/page).
+    fingerprint = Column(String(64), primary_key=True)
+    endpoint = Column(String, nullable=False)
+    params = Column(JSONB, nullable=False)
+    run_id = Column(String, nullable=False)
+    completed_pages = Column(ARRAY(Integer), nullable=False, server_default="{}")
+    # Keyset cursor for endpoints paginated by last_indexes.
+    last_index = Column(JSONB)
+
+    def __repr__(self) -> str:
+        return (
+            f"<PaginationCheckpoint("
+            f"endpoint='{self.endpoint}', "
+            f"run_id='{self.run_id}', "
+            f"pages={len(self.completed_pages or [])})>"
+        )
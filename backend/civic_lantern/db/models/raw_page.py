@@ -0,0 +1,34 @@
+from sqlalchemy import BigInteger, Column, Index, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+
+from civic_lantern.db.models.base import Base
+from civic_lantern.db.models.mixins import TimestampMixin
+
+
+class RawPage(Base, TimestampMixin):
+    """Raw FEC records as fetched by one ingestor run, kept for replay.
+
+    payload is stored with lz4 TOAST compression (set in the migration).
+    """
+
+    __tablename__ = "raw_pages"
+    __table_args__ = (Index("idx_raw_pages_entity_run", "entity", "run_id", "id"),)
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    # Registry name of the ingestor that fetched the page.
+    entity = Column(String, nullable=False)
+    run_id = Column(String, nullable=False)
+    # FEC API path the ingestor reads, e.g. "/candidates/".
+    endpoint = Column(String)
+    # The run's fetch kwargs, e.g. {"cycle": 2024}.
+    params = Column(JSONB, nullable=False)
+    record_count = Column(Integer, nullable=False)
+    payload = Column(JSONB, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<RawPage("
+            f"entity='{self.entity}', "
+            f"run_id='{self.run_id}', "
+            f"records={self.record_count})>"
+        )
@@ -0,0 +1,61 @@
+from sqlalchemy import Boolean, Column, Date, Index, Integer, Numeric, String, Text
+from sqlalchemy import Enum as SQLEnum
+
+from civic_lantern.db.models.base import Base, enum_values_callable
+from civic_lantern.db.models.enums import SupportOpposeEnum
+from civic_lantern.db.models.mixins import ContentHashMixin, TimestampMixin
+
+
+class ScheduleEItemized(Base, TimestampMixin, ContentHashMixin):
+    """One itemized independent expenditure from /schedules/schedule_e/.
+
+    LIST-partitioned by cycle; ScheduleEItemizedService.ensure_partitions()
+    creates each cycle's partition (schedule_e_itemized_<cycle>) on demand.
+    There is no default partition, so rows for a cycle must have its
+    partition before they are inserted.
+    candidate_id carries no FK: filers report candidates the FEC has not
+    registered, and itemized rows are kept regardless.
+    """
+
+    __tablename__ = "schedule_e_itemized"
+    __table_args__ = (
+        Index("idx_schedule_e_itemized_candidate", "candidate_id", "cycle"),
+        Index("idx_schedule_e_itemized_committee", "committee_id"),
+        {"postgresql_partition_by": "LIST (cycle)"},
+    )
+
+    # FEC's unique transaction ID.
+    sub_id = Column(String, primary_key=True)
+    cycle = Column(Integer, primary_key=True)
+
+    committee_id = Column(String)
+    candidate_id = Column(String)
+    candidate_name = Column(String)
+    support_oppose_indicator = Column(
+        SQLEnum(
+            SupportOpposeEnum,
+            name="support_oppose_enum",
+            values_callable=enum_values_callable,
+            create_type=False,
+        ),
+    )
+
+    expenditure_date = Column(Date)
+    dissemination_date = Column(Date)
+    expenditure_amount = Column(Numeric(14, 2))
+    payee_name = Column(String)
+    expenditure_description = Column(Text)
+
+    memo_code = Column(String(1))
+    memoed_subtotal = Column(Boolean)
+    amendment_indicator = Column(String(1))
+    file_number = Column(Integer)
+    image_number = Column(String)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ScheduleEItemized("
+            f"sub_id='{self.sub_id}', "
+            f"candidate_id='{self.candidate_id}', "
+            f"amount={self.expenditure_amount})>"
+        )
@@ -4,10 +4,10 @@ from sqlalchemy.orm import relationship
 
 from civic_lantern.db.models.base import Base, enum_values_callable
 from civic_lantern.db.models.enums import SupportOpposeEnum
-from civic_lantern.db.models.mixins import TimestampMixin
+from civic_lantern.db.models.mixins import ContentHashMixin, TimestampMixin
 
 
-class ScheduleETotalsByCandidate(Base, TimestampMixin):
+class ScheduleETotalsByCandidate(Base, TimestampMixin, ContentHashMixin):
     __tablename__ = "schedule_e_totals_by_candidate"
 
     candidate_id = Column(
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Date, String
+
+from civic_lantern.db.models.base import Base
+from civic_lantern.db.models.mixins import TimestampMixin
+
+
+class SyncWatermark(Base, TimestampMixin):
+    """Latest change date an entity has been incrementally synced through."""
+
+    __tablename__ = "sync_watermarks"
+
+    # Registry name of the ingestor, e.g. "candidates", suffixed with the
+    # cycle for cycle-scoped ingestors, e.g. "schedule_e_itemized:2024".
+    entity = Column(String, primary_key=True)
+    # Record field the mark tracks, e.g. "last_file_date".
+    field = Column(String, nullable=False)
+    high_water = Column(Date, nullable=False)
+    run_id = Column(String, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<SyncWatermark("
+            f"entity='{self.entity}', "
+            f"{self.field}={self.high_water})>"
+        )
@@ -1,40 +1,214 @@
+import asyncio
+import json
 import logging
+import time
+import uuid
 from abc import ABC, abstractmethod
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from contextlib import aclosing
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from civic_lantern.services.data.base import BaseService
+from civic_lantern.core.config import get_settings
+from civic_lantern.jobs.transform_pool import TransformPool
+from civic_lantern.services.data.base import BaseService, merge_stats
+from civic_lantern.services.data.page_dead_letter import PageDeadLetterService
+from civic_lantern.services.data.pagination_checkpoint import (
+    PaginationCheckpointService,
+)
+from civic_lantern.services.data.raw_page import RawPageService
+from civic_lantern.services.data.sync_watermark import SyncWatermarkService
 from civic_lantern.services.fec_client import FECClient
+from civic_lantern.services.fec_exceptions import FECAPIError
 
 # FEC operates on the US/Eastern filing calendar
 FEC_TIMEZONE = ZoneInfo("America/New_York")
 
 
+def field_value(record: Any, name: str) -> Any:
+    """Read a field off a transformed record: a schema instance or a row dict."""
+    if isinstance(record, dict):
+        return record.get(name)
+    return getattr(record, name, None)
+
+
 class BaseIngestor(ABC):
     """Base class for FEC data ingestion.
 
     Defines the shared fetch → transform → upsert workflow.
     Subclasses implement entity_name, fetch, transform, and create_service
     to plug in their specific FEC endpoint, Pydantic schema, and DB service.
+
+    Ingestors whose transform is record-local (no cross-page aggregation)
+    can set ``pipelined = True`` and override fetch_pages() to stream pages
+    through a bounded queue, transforming and upserting while fetching
+    continues. Pipelined runs checkpoint each upserted page, so a run that
+    dies part-way resumes where it stopped; fetch_pages() overrides should
+    pass ``checkpoints=self.checkpoints`` to the client's iter_* method.
+
+    fetch()/fetch_pages() overrides should also pass
+    ``dead_letters=self.dead_letters`` so pages that fail permanently are
+    stored for retry_dead_letters().
+
+    Ingestors that set ``watermark_field`` support ``run(incremental=True)``:
+    fetch()/fetch_pages() receive ``since`` (the stored high-water mark, or
+    None on the first sync) and should request only records changed since
+    then. The mark advances to the newest upserted value once the run
+    succeeds without row errors or dead-lettered pages, partitions or
+    ranges: records behind a fetch failure would otherwise be skipped by
+    every later incremental run.
+
+    ``run(land=True)`` also stores every raw page handed to transform() in
+    raw_pages, and replay() re-runs transform + upsert from those pages
+    without calling the API.
+
+    Ingestors that set ``transformer`` (the module-level function their
+    transform() delegates to) are transformed in the worker processes of
+    the TransformPool they are given, keeping validation off the event loop.
+
+    transform() passes the service's table columns to the transformer, so
+    records come back as row dicts that upsert_batch() writes as-is rather
+    than dumping and filtering every model again. Hooks that inspect
+    records should read them with field_value().
     """
 
-    def __init__(self, client: FECClient, session: AsyncSession):
+    # Registry names of ingestors that must finish before this one starts.
+    depends_on: tuple[str, ...] = ()
+    # fetch() takes a single `cycle`; multi-cycle backfills fan out per cycle.
+    cycle_scoped: bool = False
+    # Load through the COPY-based bulk upsert unless run(bulk=False).
+    bulk: bool = False
+    # Run fetch → transform → upsert as concurrent stages. Only safe when
+    # transform() can be applied to arbitrary chunks of the raw records.
+    pipelined: bool = False
+    # Max raw pages buffered between fetch and upsert before fetch blocks.
+    pipeline_queue_size: int = 8
+    # Raw records accumulated before each transform + upsert round.
+    pipeline_chunk_size: int = 1000
+    # Checkpoints older than this are discarded instead of resumed from.
+    checkpoint_ttl: timedelta = timedelta(hours=24)
+    # Change-date field on transformed records that incremental sync tracks.
+    watermark_field: Optional[str] = None
+    # FEC API path this ingestor reads; tags the raw pages it lands.
+    endpoint: Optional[str] = None
+    # Picklable equivalent of transform(), called as
+    # transformer(raw_data, **transformer_kwargs()) in TransformPool workers.
+    # Wrap in staticmethod(). None always transforms on the event loop.
+    transformer: Optional[Callable[..., list]] = None
+
+    def __init__(
+        self,
+        client: FECClient,
+        session: AsyncSession,
+        transform_pool: Optional[TransformPool] = None,
+    ):
         self.client = client
         self.session = session
+        self.transform_pool = transform_pool
+        self.upsert_workers = get_settings().UPSERT_WORKERS
+        self.checkpoints: Optional[PaginationCheckpointService] = None
+        self.dead_letters: Optional[PageDeadLetterService] = None
+        self.high_water: Optional[date] = None
+        self.landing: Optional[RawPageService] = None
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
     async def run(
         self,
         **kwargs: Any,
     ) -> Optional[Dict[str, Any]]:
-        """Execute the ingestion pipeline: fetch → transform → upsert."""
+        """Execute the ingestion pipeline: fetch → transform → upsert.
+
+        Pass pipelined=True/False and bulk=True/False (load through the
+        service's COPY-based bulk upsert) to override the class defaults.
+        Pipelined runs resume from pagination checkpoints unless resume=False;
+        run_id tags the checkpoints they write. incremental=True syncs only
+        records changed since the entity's watermark (see watermark_field;
+        cycle-scoped ingestors keep one per cycle). land=True stores the raw
+        pages in raw_pages for replay().
+        """
         self.logger.info(f"Syncing {self.entity_name}")
 
-        raw_data = await self.fetch(**kwargs)
-        transformed = self.transform(raw_data)
+        bulk = kwargs.pop("bulk", self.bulk)
+        run_id = kwargs.pop("run_id", None) or uuid.uuid4().hex
+        resume = kwargs.pop("resume", True)
+        incremental = kwargs.pop("incremental", False)
+        land = kwargs.pop("land", False)
+        self.dead_letters = PageDeadLetterService(
+            db=self.session, entity=self.entity_name, run_id=run_id
+        )
+        self.landing = (
+            RawPageService(
+                db=self.session,
+                entity=self.entity_name,
+                run_id=run_id,
+                endpoint=self.endpoint,
+                params=kwargs,
+            )
+            if land
+            else None
+        )
+        self.high_water = None
+
+        if incremental:
+            if not self.watermark_field:
+                raise ValueError(
+                    f"{self.entity_name} does not support incremental sync"
+                )
+            watermarks = SyncWatermarkService(db=self.session)
+            watermark_key = self._watermark_key(kwargs)
+            kwargs["since"] = await watermarks.get_high_water(watermark_key)
+            self.logger.info(
+                f"Incremental {self.entity_name} sync since {kwargs['since']}"
+                if kwargs["since"]
+                else f"No {self.entity_name} watermark yet; running a full sync"
+            )
+
+        if kwargs.pop("pipelined", self.pipelined):
+            stats = await self._run_pipelined(
+                bulk=bulk, run_id=run_id, resume=resume, **kwargs
+            )
+        else:
+            stats = await self._run_sequential(bulk=bulk, **kwargs)
+
+        fetch_failures = self.dead_letters.recorded
+        if stats and fetch_failures:
+            stats["dead_lettered"] = fetch_failures
+
+        if incremental and self.high_water:
+            if stats and stats["errors"]:
+                self.logger.warning(
+                    f"Not advancing {self.entity_name} watermark: "
+                    f"{stats['errors']} rows failed to upsert"
+                )
+            elif fetch_failures:
+                self.logger.warning(
+                    f"Not advancing {self.entity_name} watermark: "
+                    f"{fetch_failures} pages failed to fetch"
+                )
+            else:
+                await watermarks.advance(
+                    watermark_key, self.watermark_field, self.high_water, run_id
+                )
+                self.logger.info(
+                    f"{self.entity_name} watermark advanced to {self.high_water}"
+                )
+        return stats
+
+    async def _run_sequential(
+        self, bulk: bool = False, **kwargs: Any
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch everything, then transform and upsert it in one pass."""
+        try:
+            raw_data = await self.fetch(**kwargs)
+        finally:
+            await self.dead_letters.flush()
+        if self.landing:
+            for start in range(0, len(raw_data), self.pipeline_chunk_size):
+                self.landing.record(raw_data[start : start + self.pipeline_chunk_size])
+            await self.landing.flush()
+        transformed = await self.before_upsert(await self._transform(raw_data))
 
         if not transformed:
             self.logger.info(f"No {self.entity_name} found to ingest.")
@@ -42,7 +216,10 @@ class BaseIngestor(ABC):
 
         service = self.create_service()
         try:
-            stats = await service.upsert_batch(transformed)
+            stats = await service.upsert_batch(
+                transformed, bulk=bulk, workers=self.upsert_workers
+            )
+            self._track_high_water(transformed)
             self.logger.info(
                 f"{self.entity_name} complete: "
                 f"{stats['inserted']} inserted, "
@@ -56,6 +233,393 @@ class BaseIngestor(ABC):
             )
             raise
 
+    async def _run_pipelined(
+        self,
+        bulk: bool = False,
+        run_id: Optional[str] = None,
+        resume: bool = True,
+        **kwargs: Any,
+    ) -> Optional[Dict[str, Any]]:
+        """Overlap fetching with transform + upsert via a bounded page queue.
+
+        A producer task streams pages from fetch_pages() into the queue; this
+        coroutine drains it, transforming and upserting every
+        pipeline_chunk_size records. When the DB falls behind, the full queue
+        blocks the producer. Per-stage busy time and throughput are returned
+        under stats["pipeline"].
+
+        Each queued page carries the checkpoint position at which it was
+        handed out, and checkpoints are committed up to a chunk's last page
+        only after that chunk is upserted, so pages still sitting in the
+        queue when the process dies are fetched again on resume.
+        """
+        self.checkpoints = (
+            PaginationCheckpointService(
+                db=self.session,
+                run_id=run_id or uuid.uuid4().hex,
+                ttl=self.checkpoint_ttl,
+            )
+            if resume
+            else None
+        )
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.pipeline_queue_size)
+        stages = {
+            name: {"records": 0, "seconds": 0.0}
+            for name in ("fetch", "transform", "upsert")
+        }
+        started = time.perf_counter()
+
+        async def produce() -> None:
+            fetch = stages["fetch"]
+            try:
+                mark = time.perf_counter()
+                async for page in self.fetch_pages(**kwargs):
+                    fetch["seconds"] += time.perf_counter() - mark
+                    fetch["records"] += len(page)
+                    position = self.checkpoints.position() if self.checkpoints else 0
+                    await queue.put((page, position))
+                    mark = time.perf_counter()
+                fetch["seconds"] += time.perf_counter() - mark
+            finally:
+                # No sentinel once cancelled: the consumer is gone, and a
+                # full queue would block this put forever.
+                if not asyncio.current_task().cancelling():
+                    await queue.put(None)
+
+        service = self.create_service()
+        stats: Dict[str, Any] = {
+            "inserted": 0,
+            "updated": 0,
+            "errors": 0,
+            "failed_ids": [],
+        }
+
+        async def flush(raw_chunk: List[Dict[str, Any]]) -> None:
+            if self.landing:
+                await self.landing.flush()
+            mark = time.perf_counter()
+            transformed = await self._transform(raw_chunk)
+            stages["transform"]["seconds"] += time.perf_counter() - mark
+            stages["transform"]["records"] += len(transformed)
+            if not transformed:
+                return
+
+            mark = time.perf_counter()
+            transformed = await self.before_upsert(transformed)
+            merge_stats(
+                stats,
+                await service.upsert_batch(
+                    transformed, bulk=bulk, workers=self.upsert_workers
+                ),
+            )
+            self._track_high_water(transformed)
+            stages["upsert"]["seconds"] += time.perf_counter() - mark
+            stages["upsert"]["records"] += len(transformed)
+
+        producer = asyncio.create_task(produce())
+        try:
+            buffer: List[Dict[str, Any]] = []
+            position = 0
+            while (item := await queue.get()) is not None:
+                page, position = item
+                buffer.extend(page)
+                if self.landing:
+                    self.landing.record(page)
+                if len(buffer) >= self.pipeline_chunk_size:
+                    await flush(buffer)
+                    await self._commit_checkpoints(position)
+                    buffer = []
+            if buffer:
+                await flush(buffer)
+            await self._commit_checkpoints(position)
+            # Surface fetch errors only after the data already queued landed.
+            await producer
+            if self.checkpoints:
+                await self.checkpoints.finish()
+        except Exception as e:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            self.logger.error(
+                f"{self.entity_name} ingestion failed: {e}", exc_info=True
+            )
+            raise
+        finally:
+            # Pages that failed before a fetch error are still worth keeping.
+            if self.dead_letters:
+                await self.dead_letters.flush()
+
+        if not stages["transform"]["records"]:
+            self.logger.info(f"No {self.entity_name} found to ingest.")
+            return None
+
+        for stage in stages.values():
+            seconds = stage["seconds"]
+            stage["records_per_sec"] = (
+                round(stage["records"] / seconds, 1) if seconds else None
+            )
+        stats["pipeline"] = {
+            **stages,
+            "wall_seconds": round(time.perf_counter() - started, 3),
+        }
+
+        self.logger.info(
+            f"{self.entity_name} complete: "
+            f"{stats['inserted']} inserted, "
+            f"{stats['updated']} updated, "
+            f"{stats['errors']} errors "
+            f"(fetch {stages['fetch']['records_per_sec']}/s, "
+            f"transform {stages['transform']['records_per_sec']}/s, "
+            f"upsert {stages['upsert']['records_per_sec']}/s)"
+        )
+        return stats
+
+    async def retry_dead_letters(
+        self, letters: List[Any], bulk: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Re-fetch dead-lettered pages and upsert what comes back.
+
+        Pipelined ingestors have record-local transforms, so only the failed
+        pages are fetched; a page-1 letter stands for a partition or keyset
+        range that failed as a whole and is re-run in full. Others aggregate
+        across pages, so each failed query is re-run, transformed and
+        upserted on its own rather than upserting partial totals. Letters
+        whose data lands are marked resolved; pages failing again are
+        recorded again with their attempt count bumped.
+        """
+        service = PageDeadLetterService(db=self.session, entity=self.entity_name)
+        raw_data: List[Dict[str, Any]] = []
+        recovered: List[Any] = []
+        stats: Optional[Dict[str, Any]] = None
+
+        async def upsert(raw: List[Dict[str, Any]]) -> None:
+            nonlocal stats
+            transformed = await self.before_upsert(await self._transform(raw))
+            if not transformed:
+                return
+            batch_stats = await self.create_service().upsert_batch(
+                transformed, bulk=bulk, workers=self.upsert_workers
+            )
+            if stats is None:
+                stats = batch_stats
+            else:
+                merge_stats(stats, batch_stats)
+
+        queries: Dict[str, List[Any]] = {}
+        for letter in letters:
+            queries.setdefault(letter.fingerprint, []).append(letter)
+
+        for group in queries.values():
+            endpoint, params = group[0].endpoint, group[0].params
+            if self.pipelined:
+                for letter in group:
+                    try:
+                        if letter.page == 1:
+                            raw_data.extend(
+                                await self.client._paginate(
+                                    endpoint, params, dead_letters=service
+                                )
+                            )
+                        else:
+                            raw_data.extend(
+                                await self.client.get_page(
+                                    endpoint, params, letter.page
+                                )
+                            )
+                        recovered.append(letter)
+                    except FECAPIError as e:
+                        self.logger.warning(
+                            f"Dead letter page {letter.page} failed again: {e}"
+                        )
+                        service.record(endpoint, params, letter.page, e)
+            else:
+                try:
+                    query_data = await self.client._paginate(
+                        endpoint, params, dead_letters=service
+                    )
+                except FECAPIError as e:
+                    self.logger.warning(f"Dead-lettered query failed again: {e}")
+                    for letter in group:
+                        service.record(endpoint, params, letter.page, e)
+                    continue
+                await upsert(query_data)
+                await service.mark_resolved([letter.id for letter in group])
+                recovered.extend(group)
+
+        if self.pipelined:
+            await upsert(raw_data)
+            await service.mark_resolved([letter.id for letter in recovered])
+        await service.flush()
+        self.logger.info(
+            f"{self.entity_name}: recovered {len(recovered)}/{len(letters)} "
+            f"dead-lettered pages"
+        )
+        return stats
+
+    async def replay(
+        self, run_id: Optional[str] = None, bulk: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Re-run transform + upsert from landed raw pages, without the API.
+
+        Replays run_id, or every landed run of this entity oldest first so
+        newer data wins. A run's pages are grouped by the params they were
+        fetched with (a manager batch lands every cycle under one run_id),
+        and before_replay() gets each group's params ahead of its
+        transform. Pipelined ingestors transform in chunks as pages stream
+        back; others transform each group's records together, since their
+        transforms aggregate across pages.
+        """
+        landing = RawPageService(db=self.session)
+        run_ids = [run_id] if run_id else await landing.get_run_ids(self.entity_name)
+        service = self.create_service()
+        stats: Optional[Dict[str, Any]] = None
+
+        async def upsert(
+            params: Dict[str, Any], raw_data: List[Dict[str, Any]]
+        ) -> None:
+            nonlocal stats
+            self.before_replay(params)
+            transformed = await self.before_upsert(await self._transform(raw_data))
+            if not transformed:
+                return
+            batch_stats = await service.upsert_batch(
+                transformed, bulk=bulk, workers=self.upsert_workers
+            )
+            if stats is None:
+                stats = batch_stats
+            else:
+                merge_stats(stats, batch_stats)
+
+        for replayed in run_ids:
+            groups: Dict[str, Tuple[Dict[str, Any], List[Dict[str, Any]]]] = {}
+            async for pages in landing.iter_pages(self.entity_name, replayed):
+                for params, page in pages:
+                    key = json.dumps(params, sort_keys=True)
+                    groups.setdefault(key, (params, []))[1].extend(page)
+                if not self.pipelined:
+                    continue
+                for params, raw_data in groups.values():
+                    if len(raw_data) >= self.pipeline_chunk_size:
+                        await upsert(params, raw_data[:])
+                        raw_data.clear()
+            for params, raw_data in groups.values():
+                if raw_data:
+                    await upsert(params, raw_data)
+
+        if stats is None:
+            self.logger.info(f"No landed {self.entity_name} pages to replay.")
+        else:
+            self.logger.info(
+                f"{self.entity_name} replayed {len(run_ids)} run(s): "
+                f"{stats['inserted']} inserted, "
+                f"{stats['updated']} updated, "
+                f"{stats['errors']} errors"
+            )
+        return stats
+
+    async def _transform(self, raw_data: List[Dict[str, Any]]) -> list:
+        """transform(), run in the transform pool when one is available.
+
+        Pipelined (record-local) transforms are split across workers, so
+        records are deduplicated on the service's conflict key afterwards,
+        keeping the last, as a single transform() call would.
+        """
+        if self.transform_pool is None or self.transformer is None:
+            return self.transform(raw_data)
+        records = await self.transform_pool.run(
+            self.transformer,
+            raw_data,
+            split=self.pipelined,
+            **self.transformer_kwargs(),
+        )
+        if not self.pipelined:
+            return records
+        keys = self.create_service().index_elements
+        unique = {
+            tuple(field_value(record, k) for k in keys): record for record in records
+        }
+        return list(unique.values())
+
+    def transformer_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments transform() passes to its transformer.
+
+        columns asks for row dicts shaped for the service's table.
+        """
+        return {"columns": self.create_service().columns}
+
+    def _watermark_key(self, kwargs: Dict[str, Any]) -> str:
+        """Cycle-scoped ingestors keep one watermark per cycle."""
+        if self.cycle_scoped and kwargs.get("cycle") is not None:
+            return f"{self.entity_name}:{kwargs['cycle']}"
+        return self.entity_name
+
+    def _track_high_water(self, records: list) -> None:
+        """Raise high_water to the newest watermark_field value upserted."""
+        if not self.watermark_field:
+            return
+        values = [
+            value
+            for record in records
+            if (value := field_value(record, self.watermark_field)) is not None
+        ]
+        if values:
+            newest = max(values)
+            if self.high_water is None or newest > self.high_water:
+                self.high_water = newest
+
+    async def _until_watermark(
+        self,
+        pages: AsyncIterator[List[Dict[str, Any]]],
+        since: Optional[date],
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stop a newest-first page stream at the first page older than since.
+
+        A guard on top of the API's min_* filter: once a whole page predates
+        the watermark, everything after it (sorted by change date,
+        descending) has been seen already, so the remaining pages are
+        dropped instead of fetched.
+        """
+        async with aclosing(pages):
+            async for page in pages:
+                if (
+                    since is not None
+                    and page
+                    and all(
+                        (record.get(self.watermark_field) or "") < since.isoformat()
+                        for record in page
+                    )
+                ):
+                    self.logger.info(
+                        f"Reached already-synced {self.entity_name}; stopping early"
+                    )
+                    return
+                yield page
+
+    async def _commit_checkpoints(self, position: int) -> None:
+        if self.checkpoints:
+            await self.checkpoints.commit(upto=position)
+
+    async def before_upsert(self, records: list) -> list:
+        """Hook run on transformed records just before they are upserted.
+
+        Override to resolve dependencies or filter rows. Default: no-op.
+        """
+        return records
+
+    def before_replay(self, params: Dict[str, Any]) -> None:
+        """Hook run before each replayed batch, with the kwargs it was fetched with.
+
+        Override to restore per-run state transform() relies on, as
+        fetch_pages() would set it. Default: no-op.
+        """
+
+    async def fetch_pages(self, **kwargs: Any) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream raw data page by page for pipelined runs.
+
+        Defaults to a single page holding everything fetch() returns.
+        Override to stream from one of FECClient's iter_* methods.
+        """
+        yield await self.fetch(**kwargs)
+
     @property
     @abstractmethod
     def entity_name(self) -> str:
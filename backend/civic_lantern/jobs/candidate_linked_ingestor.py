@@ -0,0 +1,93 @@
+from typing import Any, Dict, Literal, Optional
+
+from civic_lantern.jobs.base_ingestor import BaseIngestor, field_value
+from civic_lantern.services.data.candidate import CandidateService
+from civic_lantern.utils.transformers import transform_candidates
+
+MissingCandidatePolicy = Literal["backfill", "drop"]
+
+
+class CandidateLinkedIngestor(BaseIngestor):
+    """Base for ingestors whose rows carry an FK to candidates.candidate_id.
+
+    Before upserting, every referenced candidate_id is checked against the
+    candidates table in one query, so batches never hit the FK error path.
+    Missing candidates are handled per missing_candidate_policy:
+
+    - "backfill": look them up on /candidates/ in batched ID queries and
+      insert them first; rows for IDs the FEC doesn't return are dropped.
+    - "drop": discard rows that reference them.
+    """
+
+    depends_on = ("candidates",)
+    cycle_scoped = True
+    missing_candidate_policy: MissingCandidatePolicy = "backfill"
+
+    async def run(
+        self,
+        missing_candidates: Optional[MissingCandidatePolicy] = None,
+        **kwargs: Any,
+    ) -> Optional[Dict[str, Any]]:
+        """Run the pipeline, optionally overriding missing_candidate_policy."""
+        if missing_candidates:
+            self.missing_candidate_policy = missing_candidates
+        return await super().run(**kwargs)
+
+    async def replay(
+        self,
+        run_id: Optional[str] = None,
+        bulk: bool = False,
+        missing_candidates: MissingCandidatePolicy = "drop",
+    ) -> Optional[Dict[str, Any]]:
+        """Replay landed pages; drops rows for unknown candidates by default.
+
+        Backfilling would call the API, which replay exists to avoid.
+        """
+        self.missing_candidate_policy = missing_candidates
+        return await super().replay(run_id=run_id, bulk=bulk)
+
+    async def before_upsert(self, records: list) -> list:
+        """Resolve missing candidate FKs by backfilling or dropping rows."""
+        if not records:
+            return records
+
+        candidate_service = CandidateService(db=self.session)
+        referenced = {field_value(record, "candidate_id") for record in records}
+        missing = referenced - await candidate_service.get_existing_ids(referenced)
+        if not missing:
+            return records
+
+        if self.missing_candidate_policy == "backfill":
+            missing -= await self._backfill_candidates(candidate_service, missing)
+
+        if missing:
+            kept = [
+                record
+                for record in records
+                if field_value(record, "candidate_id") not in missing
+            ]
+            self.logger.warning(
+                f"Dropping {len(records) - len(kept)} {self.entity_name} rows "
+                f"for {len(missing)} unknown candidate(s)."
+            )
+            return kept
+
+        return records
+
+    async def _backfill_candidates(
+        self, candidate_service: CandidateService, candidate_ids: set[str]
+    ) -> set[str]:
+        """Fetch and insert missing candidates. Returns the IDs now present."""
+        self.logger.info(
+            f"Backfilling {len(candidate_ids)} candidate(s) referenced by "
+            f"{self.entity_name}."
+        )
+        raw = await self.client.get_candidates_by_ids(sorted(candidate_ids))
+        candidates = [
+            c for c in transform_candidates(raw) if c.candidate_id in candidate_ids
+        ]
+        if not candidates:
+            return set()
+
+        stats = await candidate_service.upsert_batch(candidates)
+        return {c.candidate_id for c in candidates} - set(stats["failed_ids"])
@@ -19,7 +19,9 @@ async def ingest(
         entities: Optional list of entity names to ingest.
             If None, runs all registered entities in dependency order.
         **kwargs: Additional params forwarded to each ingestor's fetch()
-            (e.g. cycle=2024 for spending ingestors).
+            (e.g. cycle=2024 for spending ingestors), or to
+            IngestionManager.ingest_batch() (e.g. cycles=range(1980, 2028, 2)
+            to backfill every cycle in one job).
 
     Returns:
         Dict mapping entity names to their ingestion stats (or error info).
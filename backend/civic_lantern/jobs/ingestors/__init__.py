@@ -6,15 +6,18 @@ from civic_lantern.jobs.ingestors.committees import CommitteeIngestor
 from civic_lantern.jobs.ingestors.inside_totals_by_candidate import (
     InsideTotalsByCandidateIngestor,
 )
+from civic_lantern.jobs.ingestors.schedule_e_itemized import ScheduleEItemizedIngestor
 from civic_lantern.jobs.ingestors.schedule_e_totals_by_candidate import (
     ScheduleETotalsByCandidateIngestor,
 )
 
-# Ordered by FK dependencies — parents before children.
-# ingest_all() executes these top to bottom.
+# Ordered by FK dependencies — parents before children. IngestionManager
+# schedules these as a DAG from each ingestor's depends_on; this order only
+# breaks ties between ingestors that are ready at the same time.
 INGESTOR_REGISTRY: dict[str, Type[BaseIngestor]] = {
     "committees": CommitteeIngestor,
     "candidates": CandidateIngestor,
     "inside_totals_by_candidate": InsideTotalsByCandidateIngestor,
     "schedule_e_totals_by_candidate": ScheduleETotalsByCandidateIngestor,
+    "schedule_e_itemized": ScheduleEItemizedIngestor,
 }
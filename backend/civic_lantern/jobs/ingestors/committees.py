@@ -1,4 +1,5 @@
-from typing import Any, Dict, List, Optional
+from datetime import date
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from civic_lantern.jobs.base_ingestor import BaseIngestor
 from civic_lantern.services.data.committee import CommitteeService
@@ -9,27 +10,63 @@ class CommitteeIngestor(BaseIngestor):
     """Ingests committee data from the FEC API."""
 
     entity_name = "committees"
+    endpoint = "/committees/"
+    transformer = staticmethod(transform_committees)
+    pipelined = True
+    watermark_field = "last_file_date"
 
     async def fetch(
         self,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        since: Optional[date] = None,
         **kwargs: Any,
     ) -> List[Dict[str, Any]]:
         """Fetch committees from FEC API.
 
-        Pass start_date/end_date to filter by first file date.
+        Pass start_date/end_date to filter by first file date, or since to
+        fetch only records filed on or after that date (incremental sync).
         Omitting both returns all committees.
         """
+        params = self._build_params(start_date, end_date, since, **kwargs)
+        return await self.client.get_committees(
+            dead_letters=self.dead_letters, **params
+        )
+
+    async def fetch_pages(
+        self,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        since: Optional[date] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream committee pages from FEC API for pipelined runs."""
+        params = self._build_params(start_date, end_date, since, **kwargs)
+        pages = self.client.iter_committees(
+            checkpoints=self.checkpoints, dead_letters=self.dead_letters, **params
+        )
+        async for page in self._until_watermark(pages, since):
+            yield page
+
+    def _build_params(
+        self,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        since: Optional[date] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
         if start_date or end_date:
             start_date, end_date = self._resolve_dates(start_date, end_date)
             kwargs["min_first_file_date"] = start_date
             kwargs["max_first_file_date"] = end_date
-        return await self.client.get_committees(**kwargs)
+        if since:
+            kwargs["min_last_file_date"] = since.isoformat()
+            kwargs.setdefault("sort", "-last_file_date")
+        return kwargs
 
     def transform(self, raw_data: List[Dict[str, Any]]) -> list:
         """Validate raw committee dicts through CommitteeIn schema."""
-        return transform_committees(raw_data)
+        return transform_committees(raw_data, **self.transformer_kwargs())
 
     def create_service(self) -> CommitteeService:
         """Return a CommitteeService wired to the current DB session."""
@@ -1,17 +1,31 @@
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from graphlib import CycleError, TopologicalSorter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from sqlalchemy import text
 
 from civic_lantern.db.session import AsyncSessionLocal
+from civic_lantern.jobs.bulk_loader import BulkFileLoader
 from civic_lantern.jobs.ingestors import INGESTOR_REGISTRY
+from civic_lantern.jobs.transform_pool import TransformPool
+from civic_lantern.services.data.base import merge_stats
+from civic_lantern.services.data.page_dead_letter import PageDeadLetterService
+from civic_lantern.services.data.pagination_checkpoint import (
+    PaginationCheckpointService,
+)
+from civic_lantern.services.data.schedule_e_itemized import ScheduleEItemizedService
 from civic_lantern.services.fec_client import FECClient
 
 logger = logging.getLogger(__name__)
 
 
 class IngestionManager:
-    """Owns the shared FECClient lifecycle and routes to ingestors.
+    """Owns the shared FECClient and TransformPool; routes to ingestors.
 
     Usage::
 
@@ -19,17 +33,27 @@ class IngestionManager:
             await manager.ingest_batch()                             # all entities
             await manager.ingest_batch(["candidates"])              # subset
             await manager.ingest("candidates", start_date=...)  # single entity
+            await manager.replay(["candidates"])                # from raw_pages, no API
+            await manager.load_bulk_files("data/fec_bulk")      # cn/cm zip files
     """
 
     def __init__(self) -> None:
         self._client: Optional[FECClient] = None
+        self._transform_pool: Optional[TransformPool] = None
+        # Per-entity start/finish times from the most recent ingest_batch().
+        self.last_run_timings: Dict[str, Dict[str, Any]] = {}
+        # Tags the pagination checkpoints written by the most recent batch.
+        self.last_run_id: Optional[str] = None
 
     async def __aenter__(self) -> "IngestionManager":
         self._client = FECClient()
         await self._client.__aenter__()
+        self._transform_pool = TransformPool()
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if self._transform_pool:
+            self._transform_pool.close()
         if self._client:
             await self._client.__aexit__(exc_type, exc_val, exc_tb)
 
@@ -54,7 +78,11 @@ class IngestionManager:
             )
 
         async with AsyncSessionLocal() as session:
-            ingestor = ingestor_cls(client=self._client, session=session)
+            ingestor = ingestor_cls(
+                client=self._client,
+                session=session,
+                transform_pool=self._transform_pool,
+            )
             return await ingestor.run(
                 start_date=start_date, end_date=end_date, **kwargs
             )
@@ -64,42 +92,334 @@ class IngestionManager:
         entities: Optional[List[str]] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        max_concurrency: int = 2,
+        cycles: Optional[Iterable[int]] = None,
+        cycle_concurrency: int = 4,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """Run ingestors for the given entities, or all if not specified.
 
-        Executes in dependency order. Continues on failure — a failed
-        entity is logged and recorded but does not block subsequent ones.
+        Ingestors are scheduled as a DAG from their ``depends_on``: each
+        starts once its selected parents finish, with up to max_concurrency
+        running at once under the shared FECClient. Continues on failure — a
+        failed entity is logged and recorded, and only its dependents are
+        skipped. Start/finish times land in ``last_run_timings``.
+
+        Pass cycles (e.g. ``range(1980, 2028, 2)``) to backfill history in one
+        job: each cycle-scoped ingestor fans out one run per cycle, up to
+        cycle_concurrency at a time, all sharing the client's rate limiters.
+        The materialized views are refreshed once, after every cycle lands.
+
+        Every ingestor in the batch shares one run_id (``last_run_id``), which
+        tags the pagination checkpoints it leaves behind if interrupted.
         """
+        cycles = list(cycles) if cycles else None
+        kwargs.setdefault("run_id", uuid.uuid4().hex)
+        self.last_run_id = kwargs["run_id"]
         if entities:
-            registry_keys = list(INGESTOR_REGISTRY.keys())
-            targets = sorted(entities, key=lambda x: registry_keys.index(x))
+            unknown = [name for name in entities if name not in INGESTOR_REGISTRY]
+            if unknown:
+                raise ValueError(
+                    f"Unknown entities: {unknown}. Available: {list(INGESTOR_REGISTRY)}"
+                )
+            targets = [name for name in INGESTOR_REGISTRY if name in entities]
         else:
             targets = list(INGESTOR_REGISTRY.keys())
 
+        # Parents outside the selected set are assumed to be already loaded.
+        graph = {
+            name: [
+                parent
+                for parent in getattr(INGESTOR_REGISTRY[name], "depends_on", ())
+                if parent in targets
+            ]
+            for name in targets
+        }
+        sorter = TopologicalSorter(graph)
+        try:
+            sorter.prepare()
+        except CycleError as e:
+            raise ValueError(f"Ingestor dependency cycle: {e.args[1]}") from e
+
+        results: Dict[str, Any] = {}
+        self.last_run_timings = {}
+        semaphore = asyncio.Semaphore(max_concurrency)
+        running: Dict[asyncio.Task, str] = {}
+
+        while sorter.is_active():
+            for name in sorter.get_ready():
+                failed_parents = [
+                    parent
+                    for parent in graph[name]
+                    if "error" in (results[parent] or {})
+                ]
+                if failed_parents:
+                    logger.warning(
+                        f"Skipping '{name}': dependencies failed {failed_parents}"
+                    )
+                    results[name] = {
+                        "error": f"Skipped: dependencies failed {failed_parents}",
+                        "skipped": True,
+                    }
+                    sorter.done(name)
+                    continue
+
+                task = asyncio.create_task(
+                    self._run_node(
+                        name,
+                        semaphore,
+                        start_date,
+                        end_date,
+                        cycles=cycles,
+                        cycle_concurrency=cycle_concurrency,
+                        **kwargs,
+                    )
+                )
+                running[task] = name
+
+            if not running:
+                continue
+
+            finished, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in finished:
+                name = running.pop(task)
+                results[name] = task.result()
+                sorter.done(name)
+
+        results = {name: results[name] for name in targets}
+
+        await self._refresh_if_spending_changed(results)
+        return results
+
+    async def retry_dead_letters(
+        self, entities: Optional[List[str]] = None, bulk: bool = False
+    ) -> Dict[str, Any]:
+        """Replay pages that failed permanently in earlier runs.
+
+        Loads unresolved rows from page_dead_letters (optionally only for
+        some entities) and hands each entity's letters to its ingestor's
+        retry_dead_letters(), one entity at a time. Returns per-entity stats,
+        or {"error": ...} for entities whose replay raised.
+        """
+        if self._client is None:
+            raise RuntimeError(
+                "IngestionManager must be used as an async context manager. "
+                "Use 'async with IngestionManager() as manager:'"
+            )
+
+        async with AsyncSessionLocal() as session:
+            letters = await PageDeadLetterService(db=session).get_unresolved(entities)
+
+        by_entity: Dict[str, List[Any]] = {}
+        for letter in letters:
+            by_entity.setdefault(letter.entity, []).append(letter)
+
         results: Dict[str, Any] = {}
+        for name, group in by_entity.items():
+            ingestor_cls = INGESTOR_REGISTRY.get(name)
+            if not ingestor_cls:
+                logger.warning(f"Skipping {len(group)} dead letters for '{name}'")
+                continue
+            async with AsyncSessionLocal() as session:
+                ingestor = ingestor_cls(
+                    client=self._client,
+                    session=session,
+                    transform_pool=self._transform_pool,
+                )
+                try:
+                    results[name] = await ingestor.retry_dead_letters(group, bulk=bulk)
+                except Exception as e:
+                    logger.error(
+                        f"Dead letter replay for '{name}' failed: {e}", exc_info=True
+                    )
+                    results[name] = {"error": str(e)}
+
+        await self._refresh_if_spending_changed(results)
+        return results
+
+    async def replay(
+        self,
+        entities: Optional[List[str]] = None,
+        run_id: Optional[str] = None,
+        bulk: bool = False,
+    ) -> Dict[str, Any]:
+        """Re-transform and upsert landed raw pages without calling the API.
 
+        Use after changing a schema or transformer to apply it to history
+        ingested with land=True. Entities run one at a time in registry
+        (FK) order, each replaying run_id or all of its landed runs. Returns
+        per-entity stats, or {"error": ...} for entities whose replay raised.
+        """
+        if entities:
+            unknown = [name for name in entities if name not in INGESTOR_REGISTRY]
+            if unknown:
+                raise ValueError(
+                    f"Unknown entities: {unknown}. Available: {list(INGESTOR_REGISTRY)}"
+                )
+        targets = [
+            name for name in INGESTOR_REGISTRY if not entities or name in entities
+        ]
+        results: Dict[str, Any] = {}
         for name in targets:
-            try:
-                results[name] = await self.ingest(name, start_date, end_date, **kwargs)
-            except Exception as e:
-                logger.error(f"Entity '{name}' failed: {e}", exc_info=True)
-                results[name] = {"error": str(e)}
+            async with AsyncSessionLocal() as session:
+                ingestor = INGESTOR_REGISTRY[name](
+                    client=self._client,
+                    session=session,
+                    transform_pool=self._transform_pool,
+                )
+                try:
+                    results[name] = await ingestor.replay(run_id=run_id, bulk=bulk)
+                except Exception as e:
+                    logger.error(f"Replay of '{name}' failed: {e}", exc_info=True)
+                    results[name] = {"error": str(e)}
 
-        # Refresh MVs if any spending source ingestor ran and succeeded.
+        await self._refresh_if_spending_changed(results)
+        return results
+
+    async def load_bulk_files(
+        self, directory: Union[str, Path], entities: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Populate candidates/committees from FEC bulk master files.
+
+        Reads cn*.zip / cm*.zip / ccl*.zip from `directory` (see
+        BulkFileLoader) without any API calls, so a cold database can be
+        seeded before the first API sync.
+        """
+        async with AsyncSessionLocal() as session:
+            return await BulkFileLoader(session).load(directory, entities)
+
+    async def _refresh_if_spending_changed(self, results: Dict[str, Any]) -> None:
+        """Refresh MVs if any spending source ingestor ran and succeeded."""
         spending_ingestors = {
             "inside_totals_by_candidate",
             "schedule_e_totals_by_candidate",
         }
-        ran = spending_ingestors & set(targets)
         any_succeeded = any(
             results.get(name) and "error" not in results.get(name, {})
-            for name in ran
+            for name in spending_ingestors & set(results)
         )
         if any_succeeded:
             await self.refresh_spending_stats()
 
-        return results
+    async def _run_node(
+        self,
+        name: str,
+        semaphore: asyncio.Semaphore,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        cycles: Optional[List[int]] = None,
+        cycle_concurrency: int = 4,
+        **kwargs: Any,
+    ) -> Optional[Dict[str, Any]]:
+        """Run one DAG node, recording its timing and capturing failure."""
+        async with semaphore:
+            started_at = datetime.now(timezone.utc)
+            mark = time.perf_counter()
+            status = "ok"
+            try:
+                if cycles and getattr(INGESTOR_REGISTRY[name], "cycle_scoped", False):
+                    return await self._ingest_cycles(
+                        name, cycles, cycle_concurrency, start_date, end_date, **kwargs
+                    )
+                return await self.ingest(name, start_date, end_date, **kwargs)
+            except Exception as e:
+                status = "error"
+                logger.error(f"Entity '{name}' failed: {e}", exc_info=True)
+                return {"error": str(e)}
+            finally:
+                seconds = round(time.perf_counter() - mark, 3)
+                self.last_run_timings[name] = {
+                    "started_at": started_at.isoformat(),
+                    "finished_at": datetime.now(timezone.utc).isoformat(),
+                    "seconds": seconds,
+                    "status": status,
+                }
+                logger.info(f"Entity '{name}' finished ({status}) in {seconds}s")
+
+    async def _ingest_cycles(
+        self,
+        name: str,
+        cycles: List[int],
+        concurrency: int,
+        start_date: Optional[str],
+        end_date: Optional[str],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Run one cycle-scoped ingestor once per cycle, concurrently.
+
+        Returns the summed stats plus each cycle's own result under
+        "cycles". Only fails (has "error") if every cycle failed; partial
+        failures are listed under "failed_cycles".
+        """
+        kwargs.pop("cycle", None)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_cycle(cycle: int) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await self.ingest(
+                        name, start_date, end_date, cycle=cycle, **kwargs
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Entity '{name}' cycle {cycle} failed: {e}", exc_info=True
+                    )
+                    return {"error": str(e)}
+
+        outcomes = await asyncio.gather(*(run_cycle(cycle) for cycle in cycles))
+        per_cycle = dict(zip(cycles, outcomes))
+        failed_cycles = [
+            cycle for cycle, result in per_cycle.items() if "error" in (result or {})
+        ]
+
+        if len(failed_cycles) == len(cycles):
+            return {
+                "error": f"All {len(cycles)} cycles failed",
+                "cycles": per_cycle,
+            }
+
+        stats: Dict[str, Any] = {
+            "inserted": 0,
+            "updated": 0,
+            "errors": 0,
+            "failed_ids": [],
+        }
+        for result in outcomes:
+            if result and "error" not in result:
+                merge_stats(stats, result)
+        stats["cycles"] = per_cycle
+        stats["failed_cycles"] = failed_cycles
+        return stats
+
+    async def discard_stale_checkpoints(
+        self, ttl: timedelta = timedelta(hours=24)
+    ) -> int:
+        """Delete pagination checkpoints not updated within `ttl`.
+
+        Returns the number of checkpoints removed.
+        """
+        async with AsyncSessionLocal() as session:
+            service = PaginationCheckpointService(db=session, run_id="", ttl=ttl)
+            discarded = await service.discard_stale()
+        logger.info(f"Discarded {discarded} stale pagination checkpoints")
+        return discarded
+
+    async def reconcile_schedule_e(
+        self, cycle: int, tolerance: float = 1.0
+    ) -> List[Dict[str, Any]]:
+        """Check itemized Schedule E sums against the FEC's by_candidate totals.
+
+        Run after ingesting both schedule_e_itemized and
+        schedule_e_totals_by_candidate for the cycle. Returns the
+        (candidate_id, support_oppose_indicator) pairs that differ by more
+        than `tolerance` dollars.
+        """
+        async with AsyncSessionLocal() as session:
+            return await ScheduleEItemizedService(db=session).reconcile_totals(
+                cycle, tolerance
+            )
 
     async def refresh_spending_stats(self) -> None:
         """Refresh candidate and election spending materialized views.
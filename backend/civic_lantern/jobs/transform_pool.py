@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from civic_lantern.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+Transformer = Callable[..., list]
+
+
+class _RecordCollector(logging.Handler):
+    """Buffers a worker's log records so the parent can re-emit them."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Render the message now: args and tracebacks may not pickle.
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        self.records.append(record)
+
+
+def _init_worker() -> None:
+    # Let every record reach the collector; the parent applies its levels.
+    logging.getLogger().setLevel(logging.DEBUG)
+
+
+def _transform_to_rows(
+    transformer: Transformer, raw_records: List[Dict[str, Any]], kwargs: Dict[str, Any]
+) -> Tuple[Optional[type], List[Dict[str, Any]], List[logging.LogRecord]]:
+    """Worker entrypoint: run a transformer and return its records as dicts.
+
+    Returns (schema class, row dicts, log records emitted meanwhile). The
+    schema class is None when the transformer already returned row dicts.
+    """
+    collector = _RecordCollector()
+    root = logging.getLogger()
+    root.addHandler(collector)
+    try:
+        records = transformer(raw_records, **kwargs)
+    finally:
+        root.removeHandler(collector)
+    if not records or isinstance(records[0], dict):
+        return None, records, collector.records
+    rows = [record.model_dump() for record in records]
+    return type(records[0]), rows, collector.records
+
+
+class TransformPool:
+    """Runs transformer functions in worker processes, off the event loop.
+
+    Pydantic validation (and CandidateIn's name normalization) is CPU-bound,
+    so a large transform() run on the event loop stalls in-flight requests
+    and rate-limiter timers. run() hands the raw records to a process pool
+    instead: record-local transforms are split into one chunk per worker,
+    others go to a single worker whole. Workers send back plain row dicts,
+    which are rebuilt into schema instances without re-validating unless
+    the transformer produced rows itself, and their log records are
+    re-emitted here.
+
+    Inputs under min_records, and every input when workers is 0 (the
+    default, see TRANSFORM_WORKERS), are transformed in-process since the
+    pickling round trip would cost more than it saves. Pipelined ingestors
+    transform one pipeline_chunk_size batch at a time, so min_records must
+    not exceed it or their chunks never reach the pool.
+    """
+
+    def __init__(
+        self, workers: Optional[int] = None, min_records: Optional[int] = None
+    ) -> None:
+        settings = get_settings()
+        self.workers = settings.TRANSFORM_WORKERS if workers is None else workers
+        self.min_records = (
+            settings.TRANSFORM_POOL_MIN_RECORDS if min_records is None else min_records
+        )
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that runs an event loop and holds
+            # sockets and locks is not safe.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+            )
+        return self._executor
+
+    async def run(
+        self,
+        transformer: Transformer,
+        raw_records: List[Dict[str, Any]],
+        split: bool = True,
+        **kwargs: Any,
+    ) -> list:
+        """Return transformer(raw_records, **kwargs), computed in the pool.
+
+        transformer must be a module-level function so it can be pickled.
+        Pass split=False for transforms that aggregate across records.
+        """
+        if not self.workers or len(raw_records) < self.min_records:
+            return transformer(raw_records, **kwargs)
+
+        size = math.ceil(len(raw_records) / self.workers) if split else len(raw_records)
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor,
+                    _transform_to_rows,
+                    transformer,
+                    raw_records[start : start + size],
+                    kwargs,
+                )
+                for start in range(0, len(raw_records), size)
+            )
+        )
+
+        records: list = []
+        for schema_cls, rows, log_records in results:
+            for record in log_records:
+                target = logging.getLogger(record.name)
+                if target.isEnabledFor(record.levelno):
+                    target.handle(record)
+            if schema_cls is None:
+                records.extend(rows)
+            else:
+                records.extend(schema_cls.model_construct(**row) for row in rows)
+        return records
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
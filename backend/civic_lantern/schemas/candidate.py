@@ -8,6 +8,21 @@ from civic_lantern.db.models.enums import OfficeTypeEnum
 
 CandidateSortBy = Literal["name", "state", "first_file_date", "last_file_date"]
 
+# Name suffixes kept upper case ("III", "PHD") vs. title cased ("Jr").
+_UPPER_SUFFIXES = frozenset(
+    {"II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X", "PHD", "MD"}
+)
+_TITLE_SUFFIXES = frozenset({"JR", "SR", "ESQ"})
+_APOSTROPHE_LETTER = re.compile(r"([a-zA-Z]')([a-z])")
+
+
+def _title_with_apostrophe(text: str) -> str:
+    """Title-case words, also capitalizing after an apostrophe (O'Neil)."""
+    titled = text.title()
+    if "'" not in titled:
+        return titled
+    return _APOSTROPHE_LETTER.sub(lambda m: m.group(1) + m.group(2).upper(), titled)
+
 
 class CandidateIn(BaseModel):
     candidate_id: str = Field(..., min_length=1)
@@ -41,30 +56,8 @@ class CandidateIn(BaseModel):
             raise ValueError("Name cannot be empty")
         v = v.strip()
 
-        UPPER_SUFFIXES = {
-            "II",
-            "III",
-            "IV",
-            "V",
-            "VI",
-            "VII",
-            "VIII",
-            "IX",
-            "X",
-            "PHD",
-            "MD",
-        }
-        TITLE_SUFFIXES = {"JR", "SR", "ESQ"}
-
-        def title_with_apostrophe(text: str) -> str:
-            t = text.title()
-            return re.sub(
-                r"([a-zA-Z]')([a-z])", lambda m: m.group(1) + m.group(2).upper(), t
-            )
-
         if "," not in v:
-            words = v.split()
-            return " ".join(title_with_apostrophe(w) for w in words)
+            return _title_with_apostrophe(" ".join(v.split()))
 
         parts = [p.strip() for p in v.split(",")]
         last_name = parts[0]
@@ -75,15 +68,14 @@ class CandidateIn(BaseModel):
 
         for w in other_words:
             norm = w.upper().rstrip(".")
-            if norm in UPPER_SUFFIXES:
+            if norm in _UPPER_SUFFIXES:
                 found_suffixes.append(norm)
-            elif norm in TITLE_SUFFIXES:
+            elif norm in _TITLE_SUFFIXES:
                 found_suffixes.append(norm.title())
             else:
                 clean_words.append(w)
 
-        core_name_parts = clean_words + [last_name]
-        full_name = " ".join(title_with_apostrophe(w) for w in core_name_parts)
+        full_name = _title_with_apostrophe(" ".join(clean_words + [last_name]))
 
         if found_suffixes:
             return f"{full_name} {' '.join(found_suffixes)}"
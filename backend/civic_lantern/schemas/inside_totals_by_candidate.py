@@ -1,3 +1,4 @@
+from decimal import Decimal
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -6,7 +7,7 @@ from pydantic import BaseModel, ConfigDict, Field
 class InsideTotalsByCandidateIn(BaseModel):
     candidate_id: str = Field(..., min_length=1)
     cycle: int
-    receipts: Optional[float] = None
-    disbursements: Optional[float] = None
+    receipts: Optional[Decimal] = None
+    disbursements: Optional[Decimal] = None
 
     model_config = ConfigDict(str_strip_whitespace=True)
@@ -0,0 +1,59 @@
+from datetime import date
+from decimal import Decimal
+from typing import Any, Optional
+
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator
+
+from civic_lantern.db.models.enums import SupportOpposeEnum
+from civic_lantern.utils.cents import from_cents, to_cents
+
+
+class ScheduleEItemizedIn(BaseModel):
+    sub_id: str = Field(..., min_length=1)
+    cycle: int = Field(
+        ..., validation_alias=AliasChoices("cycle", "two_year_transaction_period")
+    )
+    committee_id: Optional[str] = None
+    candidate_id: Optional[str] = None
+    candidate_name: Optional[str] = None
+    support_oppose_indicator: Optional[SupportOpposeEnum] = None
+    expenditure_date: Optional[date] = None
+    dissemination_date: Optional[date] = None
+    expenditure_amount: Optional[Decimal] = None
+    payee_name: Optional[str] = None
+    expenditure_description: Optional[str] = None
+    memo_code: Optional[str] = None
+    memoed_subtotal: Optional[bool] = None
+    amendment_indicator: Optional[str] = None
+    file_number: Optional[int] = None
+    image_number: Optional[str] = None
+
+    model_config = ConfigDict(str_strip_whitespace=True)
+
+    @field_validator("sub_id", "image_number", mode="before")
+    @classmethod
+    def coerce_id_to_str(cls, v: Any) -> Any:
+        return str(v) if isinstance(v, int) else v
+
+    @field_validator("support_oppose_indicator", mode="before")
+    @classmethod
+    def normalize_indicator(cls, v: Any) -> Any:
+        if isinstance(v, str):
+            return v.strip().upper() or None
+        return v
+
+    @field_validator("expenditure_date", "dissemination_date", mode="before")
+    @classmethod
+    def strip_time(cls, v: Any) -> Any:
+        """The API sends dates as midnight timestamps ("2024-10-01T00:00:00")."""
+        if isinstance(v, str):
+            return v[:10] or None
+        return v
+
+    @field_validator("expenditure_amount", mode="before")
+    @classmethod
+    def round_to_cents(cls, v: Any) -> Any:
+        """JSON floats carry binary noise; keep the exact two-place amount."""
+        if isinstance(v, float):
+            return from_cents(to_cents(v))
+        return v
@@ -0,0 +1,138 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from civic_lantern.services.fec_exceptions import FECAuthenticationError
+from civic_lantern.services.rate_limiter import (
+    AdaptiveLimiter,
+    AdaptivePacer,
+    HourlyBudgetLimiter,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ApiKeySlot:
+    """One FEC API key with its own hourly budget and request pacer."""
+
+    def __init__(self, key: Optional[str], index: int = 0) -> None:
+        self.key = key
+        self.index = index
+        self.budget: Any = HourlyBudgetLimiter()
+        self.pacer: Any = AdaptivePacer()
+        self.quarantined_until = 0.0
+        self.quarantine_reason: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        """Key identifier that is safe to log."""
+        suffix = f"…{self.key[-4:]}" if self.key else "<no key>"
+        return f"#{self.index} {suffix}"
+
+    @property
+    def budget_remaining(self) -> float:
+        if isinstance(self.budget, AdaptiveLimiter):
+            return self.budget.metrics()["budget_remaining"]
+        return 0
+
+    def is_available(self, now: float) -> bool:
+        return self.quarantined_until <= now
+
+    def observe(self, status_code: int, headers: Mapping[str, Any]) -> None:
+        for limiter in (self.pacer, self.budget):
+            if isinstance(limiter, AdaptiveLimiter):
+                limiter.observe(status_code, headers)
+
+    def metrics(self) -> Dict[str, Any]:
+        metrics: Dict[str, Any] = {}
+        for limiter in (self.pacer, self.budget):
+            if isinstance(limiter, AdaptiveLimiter):
+                metrics.update(limiter.metrics())
+        metrics["quarantined"] = not self.is_available(time.monotonic())
+        metrics["quarantine_reason"] = self.quarantine_reason
+        return metrics
+
+
+class ApiKeyPool:
+    """Routes requests across several FEC API keys.
+
+    Each key has its own limiter state, so throughput scales with the number
+    of keys. acquire() returns the available key with the most remaining
+    hourly budget. Keys answering 401/403 are quarantined for
+    auth_quarantine_seconds, and keys answering 429 for Retry-After (or
+    rate_limit_quarantine_seconds). observe() reports whether it quarantined
+    the key, so the caller can retry the request on another available key.
+    When every key is rate limited, acquire() waits for the first to come
+    back. When every key has been rejected, it raises FECAuthenticationError.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[Optional[str]],
+        auth_quarantine_seconds: float = 24 * 3600,
+        rate_limit_quarantine_seconds: float = 300,
+    ) -> None:
+        self.slots: List[ApiKeySlot] = [
+            ApiKeySlot(key, index) for index, key in enumerate(keys or [None])
+        ]
+        self.auth_quarantine_seconds = auth_quarantine_seconds
+        self.rate_limit_quarantine_seconds = rate_limit_quarantine_seconds
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    async def acquire(self) -> ApiKeySlot:
+        while True:
+            now = time.monotonic()
+            available = [slot for slot in self.slots if slot.is_available(now)]
+            if available:
+                return max(available, key=lambda slot: slot.budget_remaining)
+
+            if all(slot.quarantine_reason == "auth" for slot in self.slots):
+                raise FECAuthenticationError("All FEC API keys were rejected")
+
+            wake_at = min(
+                slot.quarantined_until
+                for slot in self.slots
+                if slot.quarantine_reason != "auth"
+            )
+            await asyncio.sleep(max(0.0, wake_at - now))
+
+    def has_available(self) -> bool:
+        """Whether any key is out of quarantine right now."""
+        now = time.monotonic()
+        return any(slot.is_available(now) for slot in self.slots)
+
+    def observe(
+        self, slot: ApiKeySlot, status_code: int, headers: Mapping[str, Any]
+    ) -> bool:
+        """Feed a response to the key's limiters and quarantine it if needed.
+
+        Returns True when the key was quarantined.
+        """
+        slot.observe(status_code, headers)
+
+        if status_code in (401, 403):
+            self._quarantine(slot, "auth", self.auth_quarantine_seconds)
+            return True
+        if status_code == 429:
+            try:
+                seconds = float(headers.get("Retry-After"))
+            except (TypeError, ValueError):
+                seconds = self.rate_limit_quarantine_seconds
+            self._quarantine(slot, "rate_limit", seconds)
+            return True
+        if status_code < 400:
+            slot.quarantine_reason = None
+        return False
+
+    def _quarantine(self, slot: ApiKeySlot, reason: str, seconds: float) -> None:
+        slot.quarantined_until = time.monotonic() + seconds
+        slot.quarantine_reason = reason
+        logger.warning(
+            f"Quarantining FEC API key {slot.label} for {seconds:.0f}s ({reason})"
+        )
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        return {slot.label: slot.metrics() for slot in self.slots}
@@ -1,17 +1,130 @@
+import asyncio
+import copy
+import hashlib
 import logging
-from typing import Any, Dict, Generic, List, Type, TypeVar, Union
+from collections import OrderedDict
+from enum import Enum
+from functools import lru_cache
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from pydantic import BaseModel
-from sqlalchemy import exc, func, inspect, literal_column, or_, select
-from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import (
+    Text,
+    bindparam,
+    cast,
+    column,
+    exc,
+    func,
+    inspect,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Column holding a row's content digest on tables with ContentHashMixin.
+ROW_HASH = "row_hash"
+# Conflict keys per existing-hash lookup, well under asyncpg's bind limit.
+HASH_LOOKUP_CHUNK_SIZE = 5000
+
+# Compiled-once unnest upserts by (service class, model, columns, conflict
+# keys), least recently used first; see BaseService._unnest_upsert. Callers
+# choosing their own column subsets could otherwise grow it without bound.
+UNNEST_UPSERT_CACHE_SIZE = 256
+_UNNEST_UPSERTS: OrderedDict[tuple, Tuple[Any, Tuple[Callable[[Any], Any], ...]]] = (
+    OrderedDict()
+)
+
+
+def merge_stats(into: Dict[str, Any], other: Dict[str, Any]) -> Dict[str, Any]:
+    """Fold one upsert stats dict into another.
+
+    Numeric counters are summed and list values (e.g. failed_ids) extended,
+    so callers that split work across several upsert_batch calls can report
+    a single result in the same shape.
+    """
+    for key, value in other.items():
+        if isinstance(value, list):
+            into.setdefault(key, []).extend(value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            into[key] = into.get(key, 0) + value
+    return into
+
+
+@lru_cache(maxsize=None)
+def _table_columns(model: Any) -> Tuple[str, ...]:
+    return tuple(col.name for col in model.__table__.columns)
+
+
+@lru_cache(maxsize=None)
+def _row_builder(
+    schema_cls: Type[BaseModel], columns: Tuple[str, ...]
+) -> Callable[[BaseModel], dict]:
+    """Build a record -> row dict function for the schema's table columns.
+
+    Values are read straight from the validated instance's __dict__;
+    model_dump() would copy every field (and nested list) first.
+    """
+    names = tuple(name for name in columns if name in schema_cls.model_fields)
+    if not names:
+        return lambda record: {}
+    getter = itemgetter(*names)
+    if len(names) == 1:
+        return lambda record: {names[0]: getter(record.__dict__)}
+    return lambda record: dict(zip(names, getter(record.__dict__)))
+
+
+def model_rows(records: Sequence[BaseModel], columns: Sequence[str]) -> List[dict]:
+    """Row dicts holding the records' fields that are in `columns`, in order."""
+    if not records:
+        return []
+    build = _row_builder(type(records[0]), tuple(columns))
+    return [build(record) for record in records]
+
+
+def row_hash(row: Dict[str, Any]) -> bytes:
+    """16-byte BLAKE2b digest of a row's column names and values, in order.
+
+    Rows built the same way (e.g. by model_rows) hash identically across
+    runs. A row with other columns or another column order than the stored
+    one (e.g. from a bulk file) hashes differently, so it is written.
+    """
+    if ROW_HASH in row:
+        row = {name: value for name, value in row.items() if name != ROW_HASH}
+    digest = hashlib.blake2b(repr(tuple(row)).encode(), digest_size=16)
+    digest.update(repr(tuple(row.values())).encode())
+    return digest.digest()
+
 
 class BaseService(Generic[T]):
+    # Send upsert batches as one array per column through unnest() rather
+    # than as a multi-row VALUES list.
+    unnest_upserts: bool = True
+
     def __init__(self, model: Type[T], db: AsyncSession):
         self.model = model
         self.db = db
@@ -20,6 +133,11 @@ class BaseService(Generic[T]):
         if not hasattr(self, "index_elements"):
             self.index_elements = [self.pk_name]
 
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """The target table's column names, in table order."""
+        return _table_columns(self.model)
+
     def _apply_filters(self, stmt: Any, **filters: Any) -> Any:
         """Apply equality filters to a select statement, skipping None values."""
         for field, value in filters.items():
@@ -33,6 +151,15 @@ class BaseService(Generic[T]):
         result = await self.db.execute(select(self.model).filter(pk_column == id))
         return result.scalars().first()
 
+    async def get_existing_ids(self, ids: Iterable[Any]) -> Set[Any]:
+        """Return the subset of primary-key values already present, in one query."""
+        ids = list(ids)
+        if not ids:
+            return set()
+        pk_column = getattr(self.model, self.pk_name)
+        result = await self.db.execute(select(pk_column).where(pk_column.in_(ids)))
+        return set(result.scalars().all())
+
     async def _paginate(
         self, base_stmt: Any, sorted_stmt: Any, limit: int, offset: int
     ) -> Dict[str, Any]:
@@ -55,23 +182,40 @@ class BaseService(Generic[T]):
         }
 
     async def upsert_batch(
-        self, data: Union[List[dict], List[BaseModel]], batch_size: int = 500
+        self,
+        data: Union[List[dict], List[BaseModel]],
+        batch_size: int = 500,
+        bulk: bool = False,
+        workers: int = 1,
     ) -> Dict[str, Any]:
         """
         Generic upsert. Tries to insert in batches.
-        If a batch fails, falls back to row-by-row processing.
+        If a batch fails, bisects it to isolate the bad rows (see
+        _process_batch_bisecting); recovery_statements counts the extra
+        statements that took.
+
+        On tables with a row_hash column, rows whose content hash matches
+        the stored one are dropped before any upsert and counted as
+        unchanged.
+
+        With bulk=True, rows are loaded through bulk_upsert() instead. With
+        workers > 1, more than a batch of rows is split across that many
+        sessions and upserted concurrently (see _upsert_sharded).
         """
         if not data:
-            return {"inserted": 0, "updated": 0, "errors": 0, "failed_ids": []}
+            return self._empty_stats()
 
-        if data and isinstance(data[0], BaseModel):
-            table_columns = {col.name for col in self.model.__table__.columns}
-            data = [
-                {k: v for k, v in item.model_dump().items() if k in table_columns}
-                for item in data
-            ]
+        data = self._to_rows(data)
+
+        if workers > 1 and len(data) > batch_size:
+            return await self._upsert_sharded(data, batch_size, bulk, workers)
 
-        stats = {"inserted": 0, "updated": 0, "errors": 0, "failed_ids": []}
+        if bulk:
+            return await self.bulk_upsert(data, batch_size=batch_size)
+
+        data, unchanged = await self._skip_unchanged(data)
+        stats = self._empty_stats()
+        stats["unchanged"] = unchanged
 
         for i in range(0, len(data), batch_size):
             batch = data[i : i + batch_size]
@@ -90,15 +234,16 @@ class BaseService(Generic[T]):
                 await self.db.rollback()
                 logger.warning(
                     f"Batch failed for {self.model.__name__} (idx {i}). "
-                    f"Switching to row-by-row. Error: {e}"
+                    f"Bisecting to isolate bad rows. Error: {e}"
                 )
 
-                batch_stats = await self._process_batch_individually(batch)
+                batch_stats = await self._process_batch_bisecting(batch)
 
                 stats["inserted"] += batch_stats["inserted"]
                 stats["updated"] += batch_stats["updated"]
                 stats["errors"] += batch_stats["error_count"]
                 stats["failed_ids"].extend(batch_stats["failed_ids"])
+                stats["recovery_statements"] += batch_stats["recovery_statements"]
 
             await self.db.commit()
 
@@ -106,65 +251,420 @@ class BaseService(Generic[T]):
             f"Upsert complete. "
             f"Inserted: {stats['inserted']}, "
             f"Updated: {stats['updated']}, "
-            f"Errors: {stats['errors']}"
+            f"Unchanged: {stats['unchanged']}, "
+            f"Errors: {stats['errors']}, "
+            f"Recovery statements: {stats['recovery_statements']}"
         )
 
         return stats
 
-    async def _process_batch_individually(self, batch: List[dict]) -> Dict[str, Any]:
-        """Helper to process a failed batch one row at a time."""
-        stats = {"inserted": 0, "updated": 0, "error_count": 0, "failed_ids": []}
+    async def bulk_upsert(
+        self, data: Union[List[dict], List[BaseModel]], batch_size: int = 500
+    ) -> Dict[str, Any]:
+        """Bulk upsert for full backfills via a COPY-loaded staging table.
+
+        Rows are streamed into a temp table with asyncpg's binary COPY, then
+        moved into the target with one set-based INSERT ... SELECT ... ON
+        CONFLICT DO UPDATE, committed once. If that transaction fails (e.g. a
+        FK violation), it is rolled back and the rows are replayed through the
+        batched upsert_batch() path so bad rows still land in failed_ids.
+        Duplicate keys are collapsed before loading — last one wins — and
+        unchanged rows are skipped as in upsert_batch().
+        """
+        rows = self._dedupe_rows(self._to_rows(data))
+        rows, unchanged = await self._skip_unchanged(rows)
+        if not rows:
+            return {**self._empty_stats(), "unchanged": unchanged}
 
-        for row in batch:
-            row_id = row.get(self.pk_name, "UNKNOWN")
+        try:
+            inserted, updated = await self._execute_copy_upsert(rows)
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            logger.warning(
+                f"Bulk upsert failed for {self.model.__name__}. "
+                f"Falling back to batched upsert. Error: {e}"
+            )
+            stats = await self.upsert_batch(rows, batch_size=batch_size)
+            return merge_stats(stats, {"unchanged": unchanged})
 
-            try:
-                async with self.db.begin_nested():
-                    inserted, updated = await self._execute_upsert([row])
+        logger.info(
+            f"Bulk upsert complete. Inserted: {inserted}, Updated: {updated}, "
+            f"Unchanged: {unchanged}"
+        )
+        return {
+            **self._empty_stats(),
+            "inserted": inserted,
+            "updated": updated,
+            "unchanged": unchanged,
+        }
 
-                stats["inserted"] += inserted
-                stats["updated"] += updated
+    async def _upsert_sharded(
+        self, rows: List[dict], batch_size: int, bulk: bool, workers: int
+    ) -> Dict[str, Any]:
+        """Upsert rows in `workers` shards, each on its own pooled session.
+
+        Rows are deduplicated (last wins) and assigned to shards by conflict
+        key hash, so no two shards touch the same row. Each shard is sorted
+        by key, so any transactions writing overlapping keys lock rows in
+        the same order instead of deadlocking. Shards commit on their own:
+        a failing shard does not roll back the others' committed batches,
+        but it cancels them (and waits for them to wind down) before the
+        error is raised, so nothing keeps writing behind the caller's back.
+        Their stats are merged into the usual shape.
+        """
+        shards: List[List[dict]] = [[] for _ in range(workers)]
+        for row in self._dedupe_rows(rows):
+            shards[hash(self._row_key(row)) % workers].append(row)
+
+        session_factory = self._session_factory()
+        tasks = [
+            asyncio.create_task(
+                self._upsert_shard(session_factory, shard, batch_size, bulk)
+            )
+            for shard in shards
+            if shard
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        stats = self._empty_stats()
+        for shard_stats in results:
+            merge_stats(stats, shard_stats)
+        logger.info(
+            f"Sharded upsert of {self.model.__name__} across {len(results)} "
+            f"sessions complete. Inserted: {stats['inserted']}, "
+            f"Updated: {stats['updated']}, Unchanged: {stats['unchanged']}, "
+            f"Errors: {stats['errors']}"
+        )
+        return stats
+
+    async def _upsert_shard(
+        self,
+        session_factory: async_sessionmaker,
+        rows: List[dict],
+        batch_size: int,
+        bulk: bool,
+    ) -> Dict[str, Any]:
+        # Keys may hold NULLs, which don't compare with values: sort them last.
+        rows = sorted(
+            rows, key=lambda row: tuple((v is None, v) for v in self._row_key(row))
+        )
+        async with session_factory() as session:
+            shard = copy.copy(self)
+            shard.db = session
+            return await shard.upsert_batch(rows, batch_size=batch_size, bulk=bulk)
+
+    def _session_factory(self) -> async_sessionmaker:
+        """Sessions on this service's engine, drawing from its pool."""
+        return async_sessionmaker(
+            bind=self.db.bind, class_=AsyncSession, expire_on_commit=False
+        )
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, Any]:
+        return {
+            "inserted": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "errors": 0,
+            "failed_ids": [],
+            "recovery_statements": 0,
+        }
+
+    def _to_rows(self, data: Union[List[dict], List[BaseModel]]) -> List[dict]:
+        """Turn Pydantic models into dicts restricted to the table's columns.
+
+        Dicts are taken as already-built rows (e.g. from a transformer called
+        with columns=service.columns) and passed through untouched.
+        """
+        if data and isinstance(data[0], BaseModel):
+            return model_rows(data, self.columns)
+        return data
 
-            except Exception as e:
+    def _row_key(self, row: Dict[str, Any]) -> tuple:
+        return tuple(_copy_value(row.get(k)) for k in self.index_elements)
+
+    async def _skip_unchanged(self, rows: List[dict]) -> Tuple[List[dict], int]:
+        """Hash rows and drop those whose stored row_hash already matches.
+
+        Returns (rows to write, now carrying row_hash; unchanged count).
+        Tables without a row_hash column get their rows back as-is.
+        """
+        if not rows or ROW_HASH not in self.columns:
+            return rows, 0
+
+        hashed = [{**row, ROW_HASH: row_hash(row)} for row in rows]
+        keys = [self._row_key(row) for row in hashed]
+        existing = await self._existing_hashes(list(dict.fromkeys(keys)))
+        changed = [
+            row for key, row in zip(keys, hashed) if existing.get(key) != row[ROW_HASH]
+        ]
+        return changed, len(rows) - len(changed)
+
+    async def _existing_hashes(self, keys: List[tuple]) -> Dict[tuple, bytes]:
+        """Stored row_hash by conflict key, for the keys that exist."""
+        key_columns = [getattr(self.model, name) for name in self.index_elements]
+        composite = len(key_columns) > 1
+        key_expr = tuple_(*key_columns) if composite else key_columns[0]
+        hash_column = getattr(self.model, ROW_HASH)
+
+        existing: Dict[tuple, bytes] = {}
+        for i in range(0, len(keys), HASH_LOOKUP_CHUNK_SIZE):
+            chunk = keys[i : i + HASH_LOOKUP_CHUNK_SIZE]
+            values = chunk if composite else [key[0] for key in chunk]
+            result = await self.db.execute(
+                select(*key_columns, hash_column).where(key_expr.in_(values))
+            )
+            for *key, digest in result.all():
+                existing[tuple(_copy_value(value) for value in key)] = digest
+        return existing
+
+    def _dedupe_rows(self, rows: List[dict]) -> List[dict]:
+        """Collapse rows sharing the conflict key, keeping the last one."""
+        seen: Dict[tuple, dict] = {}
+        for row in rows:
+            seen[tuple(row.get(k) for k in self.index_elements)] = row
+        return list(seen.values())
+
+    async def _process_batch_bisecting(self, batch: List[dict]) -> Dict[str, Any]:
+        """Isolate the bad rows of a failed batch by recursive halving.
+
+        Each half is retried inside a savepoint. Halves that succeed are kept;
+        halves that fail are split again until the offending rows stand alone.
+        With k bad rows in n, that's O(k log n) statements rather than n.
+        """
+        stats = {
+            "inserted": 0,
+            "updated": 0,
+            "error_count": 0,
+            "failed_ids": [],
+            "recovery_statements": 0,
+        }
+        mid = len(batch) // 2
+        await self._bisect(batch[:mid], stats)
+        await self._bisect(batch[mid:], stats)
+        return stats
+
+    async def _bisect(self, rows: List[dict], stats: Dict[str, Any]) -> None:
+        if not rows:
+            return
+
+        stats["recovery_statements"] += 1
+        try:
+            async with self.db.begin_nested():
+                inserted, updated = await self._execute_upsert(rows)
+
+            stats["inserted"] += inserted
+            stats["updated"] += updated
+            return
+
+        except Exception as e:
+            if len(rows) == 1:
+                row_id = rows[0].get(self.pk_name, "UNKNOWN")
                 stats["error_count"] += 1
                 stats["failed_ids"].append(row_id)
                 logger.error(
                     f"Failed {self.model.__name__} [{row_id}]: {type(e).__name__} - {e}"
                 )
+                return
 
-        return stats
+        mid = len(rows) // 2
+        await self._bisect(rows[:mid], stats)
+        await self._bisect(rows[mid:], stats)
 
     async def _execute_upsert(self, values: List[dict]) -> tuple[int, int]:
         """Constructs and executes the PostgreSQL upsert statement.
 
         Returns (inserted_count, updated_count) using the xmax system column:
         xmax = 0 means the row was inserted; xmax != 0 means it was updated.
+
+        With unnest_upserts, the rows go out as one array parameter per
+        column, so the SQL text depends only on the columns written, not on
+        the batch size: it is compiled once and prepared once per
+        connection, and batches are not capped by the bind parameter limit.
+        """
+        if not self.unnest_upserts:
+            stmt = insert(self.model).values(values)
+            return await self._execute_returning_counts(
+                self._on_conflict_update(stmt, values[0].keys())
+            )
+
+        target = self.model.__table__
+        columns = tuple(col.name for col in target.columns if col.name in values[0])
+        stmt, encoders = self._unnest_upsert(columns)
+        params = {
+            f"{name}_values": [encode(row.get(name)) for row in values]
+            for name, encode in zip(columns, encoders)
+        }
+        return await self._execute_returning_counts(stmt, params)
+
+    def _unnest_upsert(
+        self, columns: Tuple[str, ...]
+    ) -> Tuple[Any, Tuple[Callable[[Any], Any], ...]]:
+        """The cached unnest upsert for these columns, plus value encoders.
+
+        INSERT ... SELECT ... FROM unnest($1::VARCHAR[], $2::DATE[], ...)
+        ON CONFLICT ... with one typed array parameter per column. Array
+        columns (unnest would flatten them) and enums travel as text and are
+        cast back in the SELECT.
+        """
+        cache_key = (type(self), self.model, columns, tuple(self.index_elements))
+        cached = _UNNEST_UPSERTS.get(cache_key)
+        if cached is not None:
+            _UNNEST_UPSERTS.move_to_end(cache_key)
+            return cached
+
+        target = self.model.__table__
+        params, encoders, as_text = [], [], set()
+        for name in columns:
+            col_type = target.c[name].type
+            encoder = _text_encoder(col_type)
+            if encoder is not None:
+                as_text.add(name)
+            param_type = ARRAY(Text) if encoder else ARRAY(col_type)
+            params.append(bindparam(f"{name}_values", type_=param_type))
+            encoders.append(encoder or _copy_value)
+
+        batch = func.unnest(*params).table_valued(*columns).render_derived("batch")
+        rows = select(
+            *(
+                (
+                    cast(batch.c[name], target.c[name].type)
+                    if name in as_text
+                    else batch.c[name]
+                )
+                for name in columns
+            )
+        )
+        stmt = self._on_conflict_update(
+            insert(self.model).from_select(list(columns), rows), columns
+        )
+        cached = _UNNEST_UPSERTS[cache_key] = (stmt, tuple(encoders))
+        if len(_UNNEST_UPSERTS) > UNNEST_UPSERT_CACHE_SIZE:
+            _UNNEST_UPSERTS.popitem(last=False)
+        return cached
+
+    async def _execute_copy_upsert(self, rows: List[dict]) -> tuple[int, int]:
+        """COPY rows into a temp staging table and upsert them in one statement.
+
+        The staging table is created per transaction (ON COMMIT DROP) with the
+        same column types as the target, so binary COPY encodes each value
+        exactly as the target column expects.
         """
-        stmt = insert(self.model).values(values)
+        target = self.model.__table__
+        columns = [col.name for col in target.columns if col.name in rows[0]]
+        staging_name = f"_staging_{target.name}"
+        column_list = ", ".join(f'"{name}"' for name in columns)
+
+        await self.db.execute(
+            text(
+                f'CREATE TEMP TABLE "{staging_name}" ON COMMIT DROP AS '
+                f'SELECT {column_list} FROM "{target.name}" WITH NO DATA'
+            )
+        )
 
+        conn = await self.db.connection()
+        raw_conn = await conn.get_raw_connection()
+        await raw_conn.driver_connection.copy_records_to_table(
+            staging_name,
+            records=(
+                tuple(_copy_value(row.get(name)) for name in columns) for row in rows
+            ),
+            columns=columns,
+        )
+
+        staging = table(staging_name, *(column(name) for name in columns))
+        stmt = insert(self.model).from_select(columns, select(*staging.c))
+        return await self._execute_returning_counts(
+            self._on_conflict_update(stmt, columns)
+        )
+
+    def _on_conflict_update(self, stmt: Any, columns: Iterable[str]) -> Any:
+        """Attach the shared ON CONFLICT DO UPDATE clause to an insert.
+
+        Only the inserted columns are updated: rows carrying a subset of the
+        table (e.g. bulk file loads) leave the other columns alone.
+        """
+        written = set(columns)
         update_cols = {
             col.name: col
             for col in stmt.excluded
-            if col.name not in self.index_elements and col.name != "created_at"
+            if col.name in written
+            and col.name not in self.index_elements
+            and col.name != "created_at"
         }
 
+        xmax = literal_column("xmax::text::bigint")
+        if not update_cols:
+            # Key-only rows: nothing to update on conflict.
+            return stmt.on_conflict_do_nothing(
+                index_elements=self.index_elements
+            ).returning(xmax)
+
         # Only update when at least one meaningful column actually changed.
         # Excludes updated_at (trigger-managed) to avoid counting timestamp-only diffs.
-        table = self.model.__table__
-        changed_conditions = [
-            table.c[name].is_distinct_from(excl_col)
-            for name, excl_col in update_cols.items()
-            if name != "updated_at"
-        ]
+        # Hashed rows compare their content digest alone.
+        target = self.model.__table__
+        if ROW_HASH in update_cols:
+            changed_conditions = [
+                target.c[ROW_HASH].is_distinct_from(update_cols[ROW_HASH])
+            ]
+        else:
+            changed_conditions = [
+                target.c[name].is_distinct_from(excl_col)
+                for name, excl_col in update_cols.items()
+                if name != "updated_at"
+            ]
 
-        upsert_stmt = stmt.on_conflict_do_update(
+        return stmt.on_conflict_do_update(
             index_elements=self.index_elements,
             set_=update_cols,
             where=or_(*changed_conditions) if changed_conditions else None,
-        ).returning(literal_column("xmax::text::bigint"))
+        ).returning(xmax)
 
-        result = await self.db.execute(upsert_stmt)
+    async def _execute_returning_counts(
+        self, upsert_stmt: Any, params: Optional[Dict[str, Any]] = None
+    ) -> tuple[int, int]:
+        result = await self.db.execute(upsert_stmt, params)
         rows = result.fetchall()
         inserted = sum(1 for row in rows if row[0] == 0)
         updated = len(rows) - inserted
         return inserted, updated
+
+
+def _copy_value(value: Any) -> Any:
+    """Unwrap Python enums so asyncpg's COPY encoder sees the raw value."""
+    return value.value if isinstance(value, Enum) else value
+
+
+def _text_encoder(col_type: Any) -> Optional[Callable[[Any], Optional[str]]]:
+    """How values of col_type are sent as text to an unnest upsert, if so."""
+    if isinstance(col_type, ARRAY):
+        return _array_literal
+    if isinstance(col_type, SQLEnum):
+        return _enum_text
+    return None
+
+
+def _enum_text(value: Any) -> Optional[str]:
+    return None if value is None else str(_copy_value(value))
+
+
+def _array_literal(values: Optional[Iterable[Any]]) -> Optional[str]:
+    """A one-dimensional Postgres array literal, e.g. '{"2022","2024"}'."""
+    if values is None:
+        return None
+    items = []
+    for value in values:
+        if value is None:
+            items.append("NULL")
+        else:
+            quoted = str(_copy_value(value)).replace("\\", "\\\\")
+            items.append('"' + quoted.replace('"', '\\"') + '"')
+    return "{" + ",".join(items) + "}"
@@ -0,0 +1,103 @@
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from civic_lantern.db.models.page_dead_letter import PageDeadLetter
+from civic_lantern.services.data.base import BaseService
+from civic_lantern.services.data.pagination_checkpoint import (
+    normalize_query_params,
+    query_fingerprint,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PageDeadLetterService(BaseService[PageDeadLetter]):
+    """Stores pages that failed permanently so they can be replayed later.
+
+    FECClient.iter_pages() calls record() (in memory, safe while the session
+    is busy upserting) for every page its second retry pass could not fetch,
+    and iter_partitioned()/iter_keyset_ranges() record a failed partition or
+    range as its page 1; the
+    ingestor calls flush() once fetching is done. Recording the same
+    page again bumps its attempt count instead of adding a row.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        entity: Optional[str] = None,
+        run_id: Optional[str] = None,
+    ) -> None:
+        super().__init__(model=PageDeadLetter, db=db)
+        self.entity = entity
+        self.run_id = run_id
+        self._pending: List[Dict[str, Any]] = []
+        # Pages recorded over this service's lifetime, flushed or not.
+        self.recorded = 0
+
+    def record(
+        self, url: str, params: Dict[str, Any], page: int, error: Exception
+    ) -> None:
+        """Buffer a failed page until the next flush()."""
+        self.recorded += 1
+        self._pending.append(
+            {
+                "entity": self.entity,
+                "run_id": self.run_id,
+                "fingerprint": query_fingerprint(url, params),
+                "endpoint": url,
+                "params": normalize_query_params(params),
+                "page": page,
+                "error": f"{type(error).__name__}: {error}",
+            }
+        )
+
+    async def flush(self) -> int:
+        """Persist buffered failures. Returns the number of pages written."""
+        if not self._pending:
+            return 0
+
+        stmt = insert(PageDeadLetter).values(self._pending)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["fingerprint", "page"],
+            set_={
+                "run_id": stmt.excluded.run_id,
+                "error": stmt.excluded.error,
+                "attempts": PageDeadLetter.attempts + 1,
+                "resolved_at": None,
+            },
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
+
+        count = len(self._pending)
+        logger.warning(f"Dead-lettered {count} {self.entity} pages")
+        self._pending = []
+        return count
+
+    async def get_unresolved(
+        self, entities: Optional[Iterable[str]] = None
+    ) -> List[PageDeadLetter]:
+        """Unresolved dead letters, oldest first, optionally for some entities."""
+        stmt = select(PageDeadLetter).where(PageDeadLetter.resolved_at.is_(None))
+        if entities is not None:
+            stmt = stmt.where(PageDeadLetter.entity.in_(list(entities)))
+        stmt = stmt.order_by(PageDeadLetter.id)
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
+    async def mark_resolved(self, ids: Iterable[int]) -> None:
+        ids = list(ids)
+        if not ids:
+            return
+        await self.db.execute(
+            update(PageDeadLetter)
+            .where(PageDeadLetter.id.in_(ids))
+            .values(resolved_at=datetime.now(timezone.utc))
+        )
+        await self.db.commit()
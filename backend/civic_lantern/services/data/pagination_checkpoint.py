@@ -0,0 +1,184 @@
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from civic_lantern.db.models.pagination_checkpoint import PaginationCheckpoint
+from civic_lantern.services.data.base import BaseService
+
+logger = logging.getLogger(__name__)
+
+# Params that don't change which records a paginated query returns.
+_VOLATILE_PARAMS = ("api_key", "page")
+
+
+def query_fingerprint(url: str, params: Dict[str, Any]) -> str:
+    """Stable identity for a paginated query, independent of key and page."""
+    payload = json.dumps(
+        [url, normalize_query_params(params)], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def normalize_query_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-safe copy of params without api_key/page, for storage."""
+    kept = {k: v for k, v in params.items() if k not in _VOLATILE_PARAMS}
+    return json.loads(json.dumps(kept, default=str))
+
+
+@dataclass
+class PageProgress:
+    """Pages of one query that earlier runs already ingested."""
+
+    fingerprint: str
+    endpoint: str
+    params: Dict[str, Any]
+    completed: Set[int] = field(default_factory=set)
+    # Cursor to continue a keyset-paginated query from.
+    last_index: Optional[Dict[str, Any]] = None
+
+
+class PaginationCheckpointService(BaseService[PaginationCheckpoint]):
+    """Records which pages of each query have been upserted during a run.
+
+    FECClient.iter_pages() calls open() to learn which pages to skip (or,
+    for keyset-paginated queries, which cursor to continue from) and mark()
+    / mark_cursor() for every page it hands to the ingestor. The ingestor calls
+    commit() after each successful upsert, persisting the pages marked up to
+    that point, and finish() once the run succeeds, which deletes the
+    checkpoints. A run that dies leaves them behind for the next run with the
+    same query to resume from. Checkpoints older than `ttl` are ignored and
+    discarded, since the underlying data may have shifted between pages.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        run_id: str,
+        ttl: timedelta = timedelta(hours=24),
+    ) -> None:
+        super().__init__(model=PaginationCheckpoint, db=db)
+        self.run_id = run_id
+        self.ttl = ttl
+        self._progress: Dict[str, PageProgress] = {}
+        # (fingerprint, page, cursor) in the order pages were handed out.
+        self._marked: List[Tuple[str, Optional[int], Optional[Dict[str, Any]]]] = []
+        self._committed = 0
+
+    async def open(self, url: str, params: Dict[str, Any]) -> PageProgress:
+        """Load (or start) the checkpoint for one paginated query."""
+        fingerprint = query_fingerprint(url, params)
+        if fingerprint in self._progress:
+            return self._progress[fingerprint]
+
+        progress = PageProgress(
+            fingerprint=fingerprint,
+            endpoint=url,
+            params=normalize_query_params(params),
+        )
+        checkpoint = await self.get_by_id(fingerprint)
+        if checkpoint is not None:
+            if self._is_stale(checkpoint):
+                logger.info(
+                    f"Discarding stale checkpoint for {url} "
+                    f"from run {checkpoint.run_id}"
+                )
+                await self.db.execute(
+                    delete(PaginationCheckpoint).where(
+                        PaginationCheckpoint.fingerprint == fingerprint
+                    )
+                )
+                await self.db.commit()
+            else:
+                progress.completed = set(checkpoint.completed_pages or [])
+                progress.last_index = checkpoint.last_index
+                logger.info(
+                    f"Resuming {url} from run {checkpoint.run_id}: "
+                    f"{len(progress.completed)} pages already ingested"
+                    + (f", cursor {progress.last_index}" if progress.last_index else "")
+                )
+
+        self._progress[fingerprint] = progress
+        return progress
+
+    def mark(self, progress: PageProgress, page: int) -> None:
+        """Record that a page was handed downstream (not yet upserted)."""
+        self._marked.append((progress.fingerprint, page, None))
+
+    def mark_cursor(self, progress: PageProgress, cursor: Dict[str, Any]) -> None:
+        """Record the keyset cursor that follows a page handed downstream."""
+        self._marked.append((progress.fingerprint, None, cursor))
+
+    def position(self) -> int:
+        """Marker for everything marked so far, for commit(upto=...)."""
+        return len(self._marked)
+
+    async def commit(self, upto: Optional[int] = None) -> None:
+        """Persist pages marked before `upto` (default: all marked pages)."""
+        upto = len(self._marked) if upto is None else upto
+        pending = self._marked[self._committed : upto]
+        if not pending:
+            return
+
+        pages_by_query: Dict[str, Set[int]] = {}
+        for fingerprint, page, cursor in pending:
+            pages = pages_by_query.setdefault(fingerprint, set())
+            if page is not None:
+                pages.add(page)
+            if cursor is not None:
+                self._progress[fingerprint].last_index = cursor
+
+        for fingerprint, pages in pages_by_query.items():
+            progress = self._progress[fingerprint]
+            progress.completed |= pages
+            stmt = insert(PaginationCheckpoint).values(
+                fingerprint=fingerprint,
+                endpoint=progress.endpoint,
+                params=progress.params,
+                run_id=self.run_id,
+                completed_pages=sorted(progress.completed),
+                last_index=progress.last_index,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["fingerprint"],
+                set_={
+                    "run_id": stmt.excluded.run_id,
+                    "completed_pages": stmt.excluded.completed_pages,
+                    "last_index": stmt.excluded.last_index,
+                },
+            )
+            await self.db.execute(stmt)
+
+        await self.db.commit()
+        self._committed = upto
+
+    async def finish(self) -> None:
+        """Drop the checkpoints of every query this run completed."""
+        if self._progress:
+            await self.db.execute(
+                delete(PaginationCheckpoint).where(
+                    PaginationCheckpoint.fingerprint.in_(self._progress)
+                )
+            )
+            await self.db.commit()
+        self._progress.clear()
+        self._marked.clear()
+        self._committed = 0
+
+    async def discard_stale(self) -> int:
+        """Delete every checkpoint older than the TTL. Returns rows deleted."""
+        cutoff = datetime.now(timezone.utc) - self.ttl
+        result = await self.db.execute(
+            delete(PaginationCheckpoint).where(PaginationCheckpoint.updated_at < cutoff)
+        )
+        await self.db.commit()
+        return result.rowcount or 0
+
+    def _is_stale(self, checkpoint: PaginationCheckpoint) -> bool:
+        return checkpoint.updated_at < datetime.now(timezone.utc) - self.ttl
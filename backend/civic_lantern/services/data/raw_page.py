@@ -0,0 +1,103 @@
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from civic_lantern.db.models.raw_page import RawPage
+from civic_lantern.services.data.base import BaseService
+from civic_lantern.services.data.pagination_checkpoint import normalize_query_params
+
+logger = logging.getLogger(__name__)
+
+
+class RawPageService(BaseService[RawPage]):
+    """Lands raw FEC pages and reads them back for replay.
+
+    Ingestors run with land=True call record() for every page handed to
+    transform() and flush() before transforming, so each run's raw_pages
+    rows are exactly the input its upserts were built from. iter_pages()
+    streams a run back in fetch order without holding the session open on
+    a cursor, so the caller can upsert between batches.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        entity: Optional[str] = None,
+        run_id: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        super().__init__(model=RawPage, db=db)
+        self.entity = entity
+        self.run_id = run_id
+        self.endpoint = endpoint
+        self.params = normalize_query_params(params or {})
+        self._pending: List[Dict[str, Any]] = []
+
+    def record(self, records: List[Dict[str, Any]]) -> None:
+        """Buffer one page of raw records until the next flush()."""
+        if not records:
+            return
+        self._pending.append(
+            {
+                "entity": self.entity,
+                "run_id": self.run_id,
+                "endpoint": self.endpoint,
+                "params": self.params,
+                "record_count": len(records),
+                "payload": records,
+            }
+        )
+
+    async def flush(self) -> int:
+        """Persist buffered pages. Returns the number of pages written."""
+        if not self._pending:
+            return 0
+
+        await self.db.execute(insert(RawPage), self._pending)
+        await self.db.commit()
+
+        count = len(self._pending)
+        logger.debug(f"Landed {count} raw {self.entity} pages")
+        self._pending = []
+        return count
+
+    async def get_run_ids(self, entity: str) -> List[str]:
+        """Run IDs with landed pages for an entity, oldest first."""
+        first_id = func.min(RawPage.id)
+        result = await self.db.execute(
+            select(RawPage.run_id)
+            .where(RawPage.entity == entity)
+            .group_by(RawPage.run_id)
+            .order_by(first_id)
+        )
+        return list(result.scalars().all())
+
+    async def iter_pages(
+        self, entity: str, run_id: str, batch_size: int = 50
+    ) -> AsyncIterator[List[Tuple[Dict[str, Any], List[Dict[str, Any]]]]]:
+        """Yield a run's (params, payload) pages in landing order.
+
+        Pages come batch_size at a time. params are the kwargs each page was
+        fetched with, which can differ within a run: a manager batch lands
+        every cycle under one run_id.
+        """
+        last_id = 0
+        while True:
+            result = await self.db.execute(
+                select(RawPage.id, RawPage.params, RawPage.payload)
+                .where(
+                    RawPage.entity == entity,
+                    RawPage.run_id == run_id,
+                    RawPage.id > last_id,
+                )
+                .order_by(RawPage.id)
+                .limit(batch_size)
+            )
+            rows = result.all()
+            if not rows:
+                return
+            last_id = rows[-1].id
+            yield [(row.params or {}, row.payload) for row in rows]
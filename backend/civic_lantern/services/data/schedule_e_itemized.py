@@ -0,0 +1,117 @@
+import logging
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy import and_, func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from civic_lantern.db.models.schedule_e_itemized import ScheduleEItemized
+from civic_lantern.db.models.schedule_e_totals_by_candidate import (
+    ScheduleETotalsByCandidate,
+)
+from civic_lantern.services.data.base import BaseService
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduleEItemizedService(BaseService[ScheduleEItemized]):
+    index_elements = ["sub_id", "cycle"]
+
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(model=ScheduleEItemized, db=db)
+
+    async def ensure_partitions(self, cycles: Iterable[int]) -> None:
+        """Create the LIST partition for each cycle if it doesn't exist yet."""
+        table = self.model.__tablename__
+        for cycle in sorted({int(cycle) for cycle in cycles}):
+            await self.db.execute(
+                text(
+                    f"CREATE TABLE IF NOT EXISTS {table}_{cycle} "
+                    f"PARTITION OF {table} FOR VALUES IN ({cycle})"
+                )
+            )
+        await self.db.commit()
+
+    def _totals_query(self, cycle: int):
+        """Per-candidate S/O sums, excluding memo lines like the FEC aggregates."""
+        item = ScheduleEItemized
+        return (
+            select(
+                item.candidate_id,
+                item.support_oppose_indicator,
+                func.sum(item.expenditure_amount).label("total"),
+            )
+            .where(
+                item.cycle == cycle,
+                item.candidate_id.is_not(None),
+                item.support_oppose_indicator.is_not(None),
+                or_(item.memoed_subtotal.is_(None), item.memoed_subtotal.is_(False)),
+                func.coalesce(item.memo_code, "") != "X",
+            )
+            .group_by(item.candidate_id, item.support_oppose_indicator)
+        )
+
+    async def get_totals_by_candidate(self, cycle: int) -> List[Dict[str, Any]]:
+        """Schedule E totals per candidate and indicator, derived locally."""
+        result = await self.db.execute(self._totals_query(cycle))
+        return [dict(row) for row in result.mappings().all()]
+
+    async def reconcile_totals(
+        self, cycle: int, tolerance: float = 1.0
+    ) -> List[Dict[str, Any]]:
+        """Compare locally derived totals with the FEC's by_candidate aggregates.
+
+        Returns one row per (candidate_id, support_oppose_indicator) whose
+        itemized sum and stored aggregate differ by more than `tolerance`,
+        including pairs present on only one side (the other total is None).
+        """
+        itemized = self._totals_query(cycle).subquery("itemized")
+        totals = ScheduleETotalsByCandidate
+        aggregate = (
+            select(
+                totals.candidate_id,
+                totals.support_oppose_indicator,
+                totals.total,
+            )
+            .where(totals.cycle == cycle)
+            .subquery("aggregate")
+        )
+        itemized_total = itemized.c.total
+        aggregate_total = aggregate.c.total
+        stmt = (
+            select(
+                func.coalesce(itemized.c.candidate_id, aggregate.c.candidate_id).label(
+                    "candidate_id"
+                ),
+                func.coalesce(
+                    itemized.c.support_oppose_indicator,
+                    aggregate.c.support_oppose_indicator,
+                ).label("support_oppose_indicator"),
+                itemized_total.label("itemized_total"),
+                aggregate_total.label("aggregate_total"),
+            )
+            .select_from(
+                itemized.join(
+                    aggregate,
+                    and_(
+                        itemized.c.candidate_id == aggregate.c.candidate_id,
+                        itemized.c.support_oppose_indicator
+                        == aggregate.c.support_oppose_indicator,
+                    ),
+                    full=True,
+                )
+            )
+            .where(
+                func.abs(
+                    func.coalesce(itemized_total, 0) - func.coalesce(aggregate_total, 0)
+                )
+                > tolerance
+            )
+            .order_by("candidate_id", "support_oppose_indicator")
+        )
+        result = await self.db.execute(stmt)
+        mismatches = [dict(row) for row in result.mappings().all()]
+        logger.info(
+            f"Schedule E {cycle}: {len(mismatches)} candidate totals differ "
+            f"from the FEC aggregates by more than {tolerance}"
+        )
+        return mismatches
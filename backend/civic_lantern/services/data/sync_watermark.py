@@ -0,0 +1,39 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from civic_lantern.db.models.sync_watermark import SyncWatermark
+from civic_lantern.services.data.base import BaseService
+
+
+class SyncWatermarkService(BaseService[SyncWatermark]):
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(model=SyncWatermark, db=db)
+
+    async def get_high_water(self, entity: str) -> Optional[date]:
+        """The entity's current mark, or None if it was never synced."""
+        watermark = await self.get_by_id(entity)
+        return watermark.high_water if watermark else None
+
+    async def advance(
+        self, entity: str, field: str, high_water: date, run_id: str
+    ) -> None:
+        """Move the mark forward to high_water; never moves it back."""
+        stmt = insert(SyncWatermark).values(
+            entity=entity, field=field, high_water=high_water, run_id=run_id
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["entity"],
+            set_={
+                "field": stmt.excluded.field,
+                "high_water": func.greatest(
+                    SyncWatermark.high_water, stmt.excluded.high_water
+                ),
+                "run_id": stmt.excluded.run_id,
+            },
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
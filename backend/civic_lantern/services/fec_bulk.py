@@ -0,0 +1,169 @@
+import csv
+import io
+import logging
+import re
+import zipfile
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Column layouts of the FEC bulk master files, which ship without headers.
+# See https://www.fec.gov/campaign-finance-data/candidate-master-file-description/
+CANDIDATE_COLUMNS = (
+    "CAND_ID",
+    "CAND_NAME",
+    "CAND_PTY_AFFILIATION",
+    "CAND_ELECTION_YR",
+    "CAND_OFFICE_ST",
+    "CAND_OFFICE",
+    "CAND_OFFICE_DISTRICT",
+    "CAND_ICI",
+    "CAND_STATUS",
+    "CAND_PCC",
+    "CAND_ST1",
+    "CAND_ST2",
+    "CAND_CITY",
+    "CAND_ST",
+    "CAND_ZIP",
+)
+COMMITTEE_COLUMNS = (
+    "CMTE_ID",
+    "CMTE_NM",
+    "TRES_NM",
+    "CMTE_ST1",
+    "CMTE_ST2",
+    "CMTE_CITY",
+    "CMTE_ST",
+    "CMTE_ZIP",
+    "CMTE_DSGN",
+    "CMTE_TP",
+    "CMTE_PTY_AFFILIATION",
+    "CMTE_FILING_FREQ",
+    "ORG_TP",
+    "CONNECTED_ORG_NM",
+    "CAND_ID",
+)
+LINKAGE_COLUMNS = (
+    "CAND_ID",
+    "CAND_ELECTION_YR",
+    "FEC_ELECTION_YR",
+    "CMTE_ID",
+    "CMTE_TP",
+    "CMTE_DSGN",
+    "LINKAGE_ID",
+)
+
+BULK_FILE_PATTERN = re.compile(r"^(cn|cm|ccl)(\d{2})\.zip$", re.IGNORECASE)
+
+
+def cycle_from_filename(path: Union[str, Path]) -> int:
+    """Two-year cycle a bulk file covers, e.g. cn24.zip -> 2024, cm98.zip -> 1998."""
+    match = BULK_FILE_PATTERN.match(Path(path).name)
+    if not match:
+        raise ValueError(f"Not an FEC bulk master file name: {Path(path).name}")
+    yy = int(match.group(2))
+    century = 2000 if yy <= (date.today().year + 1) % 100 else 1900
+    return century + yy
+
+
+def find_bulk_files(directory: Union[str, Path], prefix: str) -> List[Path]:
+    """Bulk files of one kind (cn, cm or ccl) in a directory, oldest cycle first."""
+    files = [
+        path
+        for path in Path(directory).iterdir()
+        if (match := BULK_FILE_PATTERN.match(path.name))
+        and match.group(1).lower() == prefix
+    ]
+    return sorted(files, key=cycle_from_filename)
+
+
+def iter_rows(
+    path: Union[str, Path], columns: Tuple[str, ...]
+) -> Iterator[Dict[str, str]]:
+    """Stream a zipped pipe-delimited bulk file as dicts keyed by `columns`.
+
+    The archive member is decompressed as it is read, never held in memory
+    whole. Rows with the wrong number of fields are logged and skipped.
+    """
+    with zipfile.ZipFile(path) as archive:
+        member = next(
+            name for name in archive.namelist() if name.lower().endswith(".txt")
+        )
+        with archive.open(member) as raw:
+            text = io.TextIOWrapper(raw, encoding="utf-8", errors="replace")
+            reader = csv.reader(text, delimiter="|", quoting=csv.QUOTE_NONE)
+            for line_no, row in enumerate(reader, start=1):
+                if len(row) != len(columns):
+                    logger.warning(
+                        f"Skipping {Path(path).name} line {line_no}: "
+                        f"expected {len(columns)} fields, got {len(row)}"
+                    )
+                    continue
+                yield dict(zip(columns, row))
+
+
+def _blank_to_none(value: str) -> Optional[str]:
+    value = value.strip()
+    return value or None
+
+
+def _year(value: str) -> List[int]:
+    value = value.strip()
+    return [int(value)] if value.isdigit() else []
+
+
+def candidate_record(row: Dict[str, str], cycle: int) -> Dict[str, Any]:
+    """Map a cn row onto the /candidates/ field names CandidateIn expects."""
+    return {
+        "candidate_id": row["CAND_ID"].strip(),
+        "name": row["CAND_NAME"],
+        "party": _blank_to_none(row["CAND_PTY_AFFILIATION"]),
+        "office": _blank_to_none(row["CAND_OFFICE"]),
+        "state": _blank_to_none(row["CAND_OFFICE_ST"]),
+        "district": _blank_to_none(row["CAND_OFFICE_DISTRICT"]),
+        "incumbent_challenge": _blank_to_none(row["CAND_ICI"]),
+        "candidate_status": _blank_to_none(row["CAND_STATUS"]),
+        "election_years": _year(row["CAND_ELECTION_YR"]),
+        "cycles": [cycle],
+    }
+
+
+def committee_record(row: Dict[str, str], cycle: int) -> Dict[str, Any]:
+    """Map a cm row onto the /committees/ field names CommitteeIn expects."""
+    candidate_id = _blank_to_none(row["CAND_ID"])
+    return {
+        "committee_id": row["CMTE_ID"].strip(),
+        "name": row["CMTE_NM"],
+        "treasurer_name": _blank_to_none(row["TRES_NM"]),
+        "state": _blank_to_none(row["CMTE_ST"]),
+        "designation": _blank_to_none(row["CMTE_DSGN"]),
+        "committee_type": _blank_to_none(row["CMTE_TP"]),
+        "party": _blank_to_none(row["CMTE_PTY_AFFILIATION"]),
+        "filing_frequency": _blank_to_none(row["CMTE_FILING_FREQ"]),
+        "organization_type": _blank_to_none(row["ORG_TP"]),
+        "affiliated_committee_name": _blank_to_none(row["CONNECTED_ORG_NM"]),
+        "candidate_ids": [candidate_id] if candidate_id else [],
+        "cycles": [cycle],
+    }
+
+
+def iter_candidates(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    cycle = cycle_from_filename(path)
+    for row in iter_rows(path, CANDIDATE_COLUMNS):
+        yield candidate_record(row, cycle)
+
+
+def iter_committees(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    cycle = cycle_from_filename(path)
+    for row in iter_rows(path, COMMITTEE_COLUMNS):
+        yield committee_record(row, cycle)
+
+
+def iter_linkages(path: Union[str, Path]) -> Iterator[Tuple[str, str]]:
+    """(committee_id, candidate_id) pairs from a ccl linkage file."""
+    for row in iter_rows(path, LINKAGE_COLUMNS):
+        committee_id, candidate_id = row["CMTE_ID"].strip(), row["CAND_ID"].strip()
+        if committee_id and candidate_id:
+            yield committee_id, candidate_id
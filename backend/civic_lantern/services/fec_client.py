@@ -1,13 +1,30 @@
 import asyncio
 import logging
-from typing import Any, Dict, List
+from collections import deque
+from datetime import date, timedelta
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import httpx
-from aiolimiter import AsyncLimiter
 from tqdm import tqdm
-from tqdm.asyncio import tqdm_asyncio
 
 from civic_lantern.core.config import get_settings
+from civic_lantern.db.models.enums import CommitteeTypeEnum
+from civic_lantern.services.api_key_pool import ApiKeyPool
+from civic_lantern.services.data.page_dead_letter import PageDeadLetterService
+from civic_lantern.services.data.pagination_checkpoint import (
+    PaginationCheckpointService,
+)
 from civic_lantern.services.fec_exceptions import (
     FECAPIError,
     FECAuthenticationError,
@@ -20,15 +37,57 @@ from civic_lantern.services.fec_exceptions import (
     FECValidationError,
 )
 from civic_lantern.services.http_utils import fec_retry
+from civic_lantern.services.response_cache import ResponseCache
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# A query param dict per partition, or the name of a field in PARTITION_VALUES.
+Partitions = Union[str, Sequence[Dict[str, Any]]]
+
+
+class _DeferredMarks:
+    """Checkpoint proxy that holds a partition's marks until its page is consumed.
+
+    Concurrent partitions hand pages over through a queue, so marking at
+    yield time would let the checkpoint position run ahead of what the
+    consumer has actually received.
+    """
+
+    def __init__(self, checkpoints: PaginationCheckpointService) -> None:
+        self._checkpoints = checkpoints
+        self._marks: List[Callable[[PaginationCheckpointService], None]] = []
+
+    async def open(self, url: str, params: Dict[str, Any]) -> Any:
+        return await self._checkpoints.open(url, params)
+
+    def mark(self, progress: Any, page: int) -> None:
+        self._marks.append(lambda target: target.mark(progress, page))
+
+    def mark_cursor(self, progress: Any, cursor: Dict[str, Any]) -> None:
+        self._marks.append(lambda target: target.mark_cursor(progress, cursor))
+
+    def drain(self) -> List[Callable[[PaginationCheckpointService], None]]:
+        marks, self._marks = self._marks, []
+        return marks
+
 
 class FECClient:
     BASE_URL = "https://api.open.fec.gov/v1"
 
-    def __init__(self):
+    # Cache TTLs (seconds) by endpoint path prefix; other endpoints use
+    # FEC_CACHE_TTL_SECONDS. Totals are recomputed as filings arrive, while
+    # candidate and committee records change slowly.
+    CACHE_TTLS: Dict[str, float] = {
+        "/v1/candidates/totals/": 6 * 3600,
+        "/v1/schedules/": 6 * 3600,
+    }
+
+    def __init__(
+        self,
+        api_keys: Optional[Sequence[str]] = None,
+        cache: Optional[ResponseCache] = None,
+    ):
         self.base_url = self.BASE_URL
         self.candidate_url = f"{self.base_url}/candidates/"
         self.candidate_totals_url = f"{self.base_url}/candidates/totals/"
@@ -36,35 +95,94 @@ class FECClient:
         self.schedule_e_totals_by_candidate_url = (
             f"{self.base_url}/schedules/schedule_e/totals/by_candidate/"
         )
-        self.api_key = settings.FEC_API_KEY
+        self.schedule_e_url = f"{self.base_url}/schedules/schedule_e/"
         self.client = httpx.AsyncClient(timeout=30.0)
-        self.limiter = AsyncLimiter(max_rate=900, time_period=3600)
-        # The FEC API has an undocumented per-minute burst limit
-        # max_rate=1 allows 60 req/min.
-        self.minute_limiter = AsyncLimiter(max_rate=1, time_period=1)
+        # Every key gets its own hourly budget (synced from the
+        # X-RateLimit-Limit/Remaining headers) and its own AIMD pacer for the
+        # API's undocumented per-minute burst limit. Requests go to the key
+        # with the most budget left; rejected or throttled keys sit out.
+        self.keys = ApiKeyPool(
+            api_keys if api_keys is not None else settings.fec_api_keys_list
+        )
+        if cache is None and settings.FEC_CACHE_DIR:
+            cache = ResponseCache(
+                settings.FEC_CACHE_DIR,
+                default_ttl=settings.FEC_CACHE_TTL_SECONDS,
+                ttls=self.CACHE_TTLS,
+                max_bytes=settings.FEC_CACHE_MAX_BYTES,
+            )
+        self.cache = cache
 
-    @fec_retry
-    async def _fetch_page(self, url: str, params: dict) -> dict:
-        async with self.minute_limiter, self.limiter:
-            try:
-                response = await self.client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()
+    def rate_limit_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Rate, concurrency, remaining budget and quarantine state per key."""
+        return self.keys.metrics()
+
+    def cache_metrics(self) -> Dict[str, Dict[str, int]]:
+        """Response cache hits, misses and revalidations per endpoint."""
+        return self.cache.metrics() if self.cache else {}
 
-            except httpx.HTTPStatusError as e:
-                self._raise_fec_error(e, url=url, params=params)
+    async def _fetch_page(self, url: str, params: dict) -> dict:
+        if self.cache is None:
+            return (await self._request(url, params)).json()
 
-            except httpx.TimeoutException as e:
-                raise FECTimeoutError(f"Request timeout after 30 seconds: {url}") from e
+        cached = self.cache.get(url, params)
+        if cached and cached.fresh:
+            return cached.body
 
-            except httpx.NetworkError as e:
-                raise FECNetworkError("Network connectivity failed") from e
+        response = await self._request(
+            url, params, headers=cached.validators if cached else None
+        )
+        if cached and response.status_code == 304:
+            self.cache.revalidated(url, cached)
+            return cached.body
+        if cached:
+            self.cache.stale(url)
 
-            except httpx.ProtocolError as e:
-                raise FECProtocolError(f"Protocol error: {e}") from e
+        body = response.json()
+        self.cache.put(url, params, body, response.headers)
+        return body
 
-            except httpx.RequestError as e:
-                raise FECAPIError(f"Request failed: {e}") from e
+    @fec_retry
+    async def _request(
+        self, url: str, params: dict, headers: Optional[Dict[str, str]] = None
+    ) -> httpx.Response:
+        while True:
+            slot = await self.keys.acquire()
+            if slot.key is not None:
+                params = {**params, "api_key": slot.key}
+
+            async with slot.pacer, slot.budget:
+                try:
+                    response = await self.client.get(
+                        url, params=params, headers=headers
+                    )
+                    quarantined = self.keys.observe(
+                        slot, response.status_code, response.headers
+                    )
+                    # A rejected or throttled key says nothing about the
+                    # request: retry it on the next healthy key, if any.
+                    if quarantined and self.keys.has_available():
+                        continue
+                    if response.status_code != 304:
+                        response.raise_for_status()
+                    return response
+
+                except httpx.HTTPStatusError as e:
+                    self._raise_fec_error(e, url=url, params=params)
+
+                except httpx.TimeoutException as e:
+                    raise FECTimeoutError(
+                        f"Request timeout after 30 seconds: {url}"
+                    ) from e
+
+                except httpx.NetworkError as e:
+                    raise FECNetworkError("Network connectivity failed") from e
+
+                except httpx.ProtocolError as e:
+                    raise FECProtocolError(f"Protocol error: {e}") from e
+
+                except httpx.RequestError as e:
+                    raise FECAPIError(f"Request failed: {e}") from e
 
     def _raise_fec_error(self, e: httpx.HTTPStatusError, *, url: str, params: dict):
         response = e.response
@@ -93,124 +211,681 @@ class FECClient:
                 f"HTTP {status} error", status_code=status, response=response
             ) from e
 
-    async def _paginate(self, url: str, base_params: dict) -> List[Dict[str, Any]]:
-        """Parallel pagination with a real-time progress bar."""
-        p1_data = await self._fetch_page(url, {**base_params, "page": 1})
-        results = p1_data.get("results", [])
-
-        last_page = p1_data.get("pagination", {}).get("pages", 1)
+    # Max page requests in flight at once during pagination, per API key.
+    PAGE_WINDOW = 10
 
-        if not results or last_page <= 1:
-            return results
+    async def iter_pages(
+        self,
+        url: str,
+        base_params: dict,
+        window: Optional[int] = None,
+        checkpoints: Optional[PaginationCheckpointService] = None,
+        dead_letters: Optional[PageDeadLetterService] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield each page's results as soon as it is decoded, in page order.
+
+        Page 1 is fetched first to learn the page count. After that, at most
+        `window` page tasks are in flight at once, so memory stays bounded by
+        the window instead of the endpoint's total page count. The default
+        window is PAGE_WINDOW per API key, so more keys means more pages in
+        flight.
+
+        Pages that fail after retries get a second pass once every other page
+        is done, with only one request in flight per API key so a struggling
+        API isn't hit with another burst; pages recovered there are yielded
+        last. Pages that still fail are logged and skipped, and recorded in
+        `dead_letters` when given.
+
+        With `checkpoints`, pages an interrupted earlier run already ingested
+        are skipped (page 1 is still fetched for the page count) and every
+        page handed out is marked for the caller to commit once upserted.
+
+        Endpoints that answer with pagination.last_indexes (itemized
+        schedules) are followed by keyset cursor instead, see
+        iter_keyset_pages().
+        """
+        window = window or self.PAGE_WINDOW * len(self.keys)
+        progress = await checkpoints.open(url, base_params) if checkpoints else None
+        done = set(progress.completed) if progress else set()
+
+        if progress and progress.last_index:
+            async for results in self._mark_keyset(
+                self._follow_keyset(url, base_params, progress.last_index),
+                checkpoints,
+                progress,
+            ):
+                yield results
+            return
 
-        concurrency_limit = asyncio.Semaphore(10)
-        tasks = [
-            self._safe_fetch_page(url, base_params, p, concurrency_limit)
-            for p in range(2, last_page + 1)
-        ]
+        p1_data = await self._fetch_page(url, {**base_params, "page": 1})
+        first_results = p1_data.get("results", [])
+        pagination = p1_data.get("pagination") or {}
+        last_page = pagination.get("pages", 1)
+
+        if not first_results:
+            return
+
+        if pagination.get("last_indexes"):
+            if checkpoints:
+                checkpoints.mark_cursor(progress, pagination["last_indexes"])
+            yield first_results
+            async for results in self._mark_keyset(
+                self._follow_keyset(url, base_params, pagination["last_indexes"]),
+                checkpoints,
+                progress,
+            ):
+                yield results
+            return
+
+        if 1 not in done:
+            if checkpoints:
+                checkpoints.mark(progress, 1)
+            yield first_results
+        if last_page <= 1:
+            return
+
+        endpoint_name = self._endpoint_name(url)
+        record_count = len(first_results)
+        failed_pages: List[int] = []
+        pending: Deque[Tuple[int, asyncio.Task]] = deque()
+        remaining = [p for p in range(2, last_page + 1) if p not in done]
+        to_fetch = iter(remaining)
+        next_page = next(to_fetch, None)
+        if done:
+            logger.info(
+                f"Resuming {endpoint_name}: skipping {len(done)}/{last_page} "
+                f"pages already ingested"
+            )
 
-        endpoint_name = url.rstrip("/").split("?")[0].split("/")[-1] or "data"
-        responses = await tqdm_asyncio.gather(
-            *tasks,
-            desc=f"Fetching {endpoint_name}",
-            unit="page",
+        progress_bar = tqdm(
+            total=len(remaining), desc=f"Fetching {endpoint_name}", unit="page"
+        )
+        try:
+            while next_page is not None or pending:
+                while next_page is not None and len(pending) < window:
+                    task = asyncio.create_task(
+                        self._safe_fetch_page(url, base_params, next_page)
+                    )
+                    pending.append((next_page, task))
+                    next_page = next(to_fetch, None)
+
+                page, task = pending.popleft()
+                resp = await task
+                progress_bar.update(1)
+
+                if isinstance(resp, Exception):
+                    tqdm.write(f"❌ Page {page} failed: {resp}")
+                    failed_pages.append(page)
+                    continue
+
+                results = resp.get("results", [])
+                if checkpoints:
+                    checkpoints.mark(progress, page)
+                if results:
+                    record_count += len(results)
+                    yield results
+        finally:
+            progress_bar.close()
+            # Consumer stopped early (or we were cancelled) — drop the window.
+            for _, task in pending:
+                task.cancel()
+
+        if not failed_pages:
+            return
+
+        logger.info(
+            f"Retrying {len(failed_pages)} failed {endpoint_name} pages "
+            f"(pages {failed_pages})"
         )
+        retry_window = len(self.keys)
+        dead_pages: List[int] = []
+        for i in range(0, len(failed_pages), retry_window):
+            batch = failed_pages[i : i + retry_window]
+            responses = await asyncio.gather(
+                *(self._safe_fetch_page(url, base_params, page) for page in batch)
+            )
+            for page, resp in zip(batch, responses):
+                if isinstance(resp, Exception):
+                    dead_pages.append(page)
+                    if dead_letters:
+                        dead_letters.record(url, base_params, page, resp)
+                    continue
+
+                results = resp.get("results", [])
+                if checkpoints:
+                    checkpoints.mark(progress, page)
+                if results:
+                    record_count += len(results)
+                    yield results
+
+        if dead_pages:
+            logger.warning(
+                f"Partial results for {endpoint_name}: "
+                f"{len(dead_pages)}/{last_page} pages failed "
+                f"(pages {dead_pages}). {record_count} records returned."
+            )
+        else:
+            logger.info(f"Recovered all failed {endpoint_name} pages on retry")
 
-        failed_pages = []
-        for i, resp in enumerate(responses):
-            if isinstance(resp, Exception):
-                tqdm.write(f"❌ Page {i + 2} failed: {resp}")
-                failed_pages.append(i + 2)
-                continue
-            results.extend(resp.get("results", []))
+    # Partitions paginated at once by iter_partitioned(), per API key.
+    PARTITION_CONCURRENCY = 4
 
-        if failed_pages:
+    FEDERAL_OFFICES = ["P", "S", "H"]
+    # FEC state codes, including territories and "US" (used for presidential
+    # filers). Records with no state are not covered by a state partitioning.
+    US_STATES = [
+        "AK", "AL", "AR", "AS", "AZ", "CA", "CO", "CT", "DC", "DE", "FL", "GA",
+        "GU", "HI", "IA", "ID", "IL", "IN", "KS", "KY", "LA", "MA", "MD", "ME",
+        "MI", "MN", "MO", "MP", "MS", "MT", "NC", "ND", "NE", "NH", "NJ", "NM",
+        "NV", "NY", "OH", "OK", "OR", "PA", "PR", "RI", "SC", "SD", "TN", "TX",
+        "US", "UT", "VA", "VI", "VT", "WA", "WI", "WV", "WY",
+    ]  # fmt: skip
+    # Known values per field for named partitionings (see resolve_partitions).
+    PARTITION_VALUES: Dict[str, List[str]] = {
+        "office": FEDERAL_OFFICES,
+        "state": US_STATES,
+        "committee_type": [t.value for t in CommitteeTypeEnum],
+    }
+
+    @classmethod
+    def resolve_partitions(cls, partitions: Partitions) -> List[Dict[str, Any]]:
+        """Expand a field name from PARTITION_VALUES into one param dict per value.
+
+        Lists of param dicts (e.g. date windows from split_date_range()) pass
+        through unchanged. Partitions must be disjoint and together cover the
+        query; a field partitioning skips records where that field is null.
+        """
+        if isinstance(partitions, str):
+            if partitions not in cls.PARTITION_VALUES:
+                raise ValueError(
+                    f"Unknown partition field: '{partitions}'. "
+                    f"Available: {list(cls.PARTITION_VALUES)}"
+                )
+            return [{partitions: value} for value in cls.PARTITION_VALUES[partitions]]
+        return list(partitions)
+
+    async def iter_partitioned(
+        self,
+        url: str,
+        base_params: dict,
+        partitions: Partitions,
+        key: str,
+        concurrency: Optional[int] = None,
+        checkpoints: Optional[PaginationCheckpointService] = None,
+        dead_letters: Optional[PageDeadLetterService] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Paginate disjoint slices of one query concurrently and merge them.
+
+        Each partition's params are layered over base_params and paginated
+        with iter_pages(), up to `concurrency` partitions at once (default:
+        PARTITION_CONCURRENCY per API key). The page window is divided
+        between them so the total number of requests in flight matches an
+        unpartitioned query; every request still goes through the shared
+        key pool and its limiters. Pages are yielded as they arrive, minus
+        records whose `key` was already seen. A partition that fails is
+        skipped without stopping the others and recorded in `dead_letters`
+        as page 1 of its query, so a retry re-runs the whole partition.
+        """
+        partitions = self.resolve_partitions(partitions)
+        concurrency = concurrency or self.PARTITION_CONCURRENCY * len(self.keys)
+        window = max(1, self.PAGE_WINDOW * len(self.keys) // concurrency)
+        queries = [{**base_params, **partition} for partition in partitions]
+        if checkpoints:
+            # Partitions share the caller's session, so load their checkpoints
+            # one at a time up front; later open() calls hit the cache.
+            for params in queries:
+                await checkpoints.open(url, params)
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+        semaphore = asyncio.Semaphore(concurrency)
+        failed: List[Dict[str, Any]] = []
+
+        async def produce(params: dict) -> None:
+            async with semaphore:
+                marks = _DeferredMarks(checkpoints) if checkpoints else None
+                try:
+                    async for results in self.iter_pages(
+                        url,
+                        params,
+                        window=window,
+                        checkpoints=marks,
+                        dead_letters=dead_letters,
+                    ):
+                        await queue.put((marks.drain() if marks else [], results))
+                except Exception as e:
+                    logger.warning(f"Partition {params} failed: {e}")
+                    failed.append(params)
+                    if dead_letters:
+                        dead_letters.record(url, params, 1, e)
+
+        async def produce_all() -> None:
+            try:
+                await asyncio.gather(*(produce(params) for params in queries))
+            finally:
+                # No sentinel once cancelled: the consumer is gone.
+                if not asyncio.current_task().cancelling():
+                    await queue.put(None)
+
+        seen: set = set()
+        duplicates = 0
+        producer = asyncio.create_task(produce_all())
+        try:
+            while (item := await queue.get()) is not None:
+                marks, results = item
+                for mark in marks:
+                    mark(checkpoints)
+                fresh = []
+                for record in results:
+                    record_key = record.get(key)
+                    if record_key is not None and record_key in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(record_key)
+                    fresh.append(record)
+                if fresh:
+                    yield fresh
+            await producer
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+        endpoint_name = self._endpoint_name(url)
+        if duplicates:
+            logger.info(
+                f"Dropped {duplicates} duplicate {endpoint_name} across partitions"
+            )
+        if failed:
             logger.warning(
                 f"Partial results for {endpoint_name}: "
-                f"{len(failed_pages)}/{last_page} pages failed "
-                f"(pages {failed_pages}). {len(results)} records returned."
+                f"{len(failed)}/{len(queries)} partitions failed ({failed})"
             )
 
-        return results
-
-    async def _safe_fetch_page(
-        self, url: str, params: dict, page: int, sem: asyncio.Semaphore
-    ):
-        async with sem:
+    async def iter_keyset_pages(
+        self,
+        url: str,
+        base_params: dict,
+        checkpoints: Optional[PaginationCheckpointService] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream a keyset-paginated endpoint by following its cursors.
+
+        Itemized endpoints return pagination.last_indexes (last_index plus
+        last_<sort field>) instead of supporting deep page numbers; sending
+        those back fetches the next page. Pages are strictly sequential, so
+        use iter_keyset_ranges() to parallelize a large query. With
+        `checkpoints`, an interrupted query resumes from its last committed
+        cursor.
+        """
+        progress = await checkpoints.open(url, base_params) if checkpoints else None
+        cursor = progress.last_index if progress else None
+        async for results in self._mark_keyset(
+            self._follow_keyset(url, base_params, cursor), checkpoints, progress
+        ):
+            yield results
+
+    async def iter_keyset_ranges(
+        self,
+        url: str,
+        base_params: dict,
+        ranges: Sequence[Dict[str, Any]],
+        concurrency: Optional[int] = None,
+        checkpoints: Optional[PaginationCheckpointService] = None,
+        dead_letters: Optional[PageDeadLetterService] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Fetch disjoint slices of one keyset query in parallel.
+
+        Each range is a dict of extra params (e.g. a min_date/max_date
+        window from split_date_range()) that carves out an independent
+        sub-query with its own cursor chain. Up to `concurrency` chains run
+        at once (default: PAGE_WINDOW per API key), and their pages are
+        yielded as they arrive. A range that fails is skipped without
+        stopping the others and recorded in `dead_letters` as page 1 of its
+        query, so a retry re-runs the whole range.
+        """
+        concurrency = concurrency or self.PAGE_WINDOW * len(self.keys)
+        chains = []
+        for extra in ranges:
+            params = {**base_params, **extra}
+            # Opened up front: checkpoint lookups share the caller's session.
+            progress = await checkpoints.open(url, params) if checkpoints else None
+            chains.append((params, progress))
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+        semaphore = asyncio.Semaphore(concurrency)
+        failed: List[Dict[str, Any]] = []
+
+        async def produce(params: dict, progress: Any) -> None:
+            async with semaphore:
+                cursor = progress.last_index if progress else None
+                try:
+                    async for item in self._follow_keyset(url, params, cursor):
+                        await queue.put((progress, *item))
+                except Exception as e:
+                    logger.warning(f"Keyset range {params} failed: {e}")
+                    failed.append(params)
+                    if dead_letters:
+                        dead_letters.record(url, params, 1, e)
+
+        async def produce_all() -> None:
             try:
-                return await self._fetch_page(url, {**params, "page": page})
-            except Exception as e:
-                logger.warning(f"Page {page} failed: {e}")
-                return e
+                await asyncio.gather(*(produce(*chain) for chain in chains))
+            finally:
+                # No sentinel once cancelled: the consumer is gone.
+                if not asyncio.current_task().cancelling():
+                    await queue.put(None)
+
+        producer = asyncio.create_task(produce_all())
+        try:
+            while (item := await queue.get()) is not None:
+                progress, cursor, results = item
+                if checkpoints and cursor:
+                    checkpoints.mark_cursor(progress, cursor)
+                yield results
+            await producer
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+        if failed:
+            logger.warning(
+                f"Partial results for {self._endpoint_name(url)}: "
+                f"{len(failed)}/{len(chains)} keyset ranges failed"
+            )
 
-    FEDERAL_OFFICES = ["P", "S", "H"]
+    async def _follow_keyset(
+        self, url: str, base_params: dict, cursor: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """Yield (next cursor, results) pages until the cursor runs out."""
+        while True:
+            data = await self._fetch_page(url, {**base_params, **(cursor or {})})
+            results = data.get("results", [])
+            cursor = (data.get("pagination") or {}).get("last_indexes")
+            if results:
+                yield cursor, results
+            if not results or not cursor:
+                return
+
+    @staticmethod
+    async def _mark_keyset(
+        pages: AsyncIterator[Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]],
+        checkpoints: Optional[PaginationCheckpointService],
+        progress: Any,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        async for cursor, results in pages:
+            if checkpoints and cursor:
+                checkpoints.mark_cursor(progress, cursor)
+            yield results
+
+    @staticmethod
+    def split_date_range(
+        start: date,
+        end: date,
+        parts: int,
+        min_param: str = "min_date",
+        max_param: str = "max_date",
+    ) -> List[Dict[str, str]]:
+        """Split [start, end] into up to `parts` non-overlapping day windows.
+
+        Returns param dicts for iter_keyset_ranges(); both bounds are
+        inclusive, so consecutive windows never share a day.
+        """
+        days = (end - start).days + 1
+        parts = max(1, min(parts, days))
+        size, extra = divmod(days, parts)
+        windows = []
+        window_start = start
+        for i in range(parts):
+            window_end = window_start + timedelta(days=size + (i < extra) - 1)
+            windows.append(
+                {
+                    min_param: window_start.isoformat(),
+                    max_param: window_end.isoformat(),
+                }
+            )
+            window_start = window_end + timedelta(days=1)
+        return windows
+
+    async def iter_records(
+        self, url: str, base_params: dict, window: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield individual records from iter_pages()."""
+        async for page in self.iter_pages(url, base_params, window=window):
+            for record in page:
+                yield record
+
+    async def _paginate(
+        self,
+        url: str,
+        base_params: dict,
+        checkpoints: Optional[PaginationCheckpointService] = None,
+        dead_letters: Optional[PageDeadLetterService] = None,
+    ) -> List[Dict[str, Any]]:
+        """Collect every page from iter_pages() into a single list."""
+        return await self._collect(
+            self.iter_pages(
+                url, base_params, checkpoints=checkpoints, dead_letters=dead_letters
+            )
+        )
 
-    async def get_candidates(
-        self, per_page: int = 100, office: list[str] = FEDERAL_OFFICES, **kwargs
-    ) -> list[dict]:
+    async def get_page(self, url: str, params: dict, page: int) -> List[Dict[str, Any]]:
+        """Fetch the results of a single page, e.g. to replay a dead letter."""
+        data = await self._fetch_page(url, {**params, "page": page})
+        return data.get("results", [])
+
+    @staticmethod
+    def _endpoint_name(url: str) -> str:
+        return url.rstrip("/").split("?")[0].split("/")[-1] or "data"
+
+    async def _safe_fetch_page(self, url: str, params: dict, page: int):
+        try:
+            return await self._fetch_page(url, {**params, "page": page})
+        except Exception as e:
+            logger.warning(f"Page {page} failed: {e}")
+            return e
+
+    def iter_candidates(
+        self,
+        per_page: int = 100,
+        office: list[str] = FEDERAL_OFFICES,
+        checkpoints: Optional[PaginationCheckpointService] = None,
+        dead_letters: Optional[PageDeadLetterService] = None,
+        partitions: Optional[Partitions] = None,
+        **kwargs,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream candidate pages as they arrive.
+
+        Pass partitions (e.g. "office", or date windows over
+        min/max_first_file_date) to fetch disjoint slices concurrently.
+        """
         params = {
-            "api_key": self.api_key,
             "per_page": per_page,
             "office": office,
         }
         params.update(kwargs)
+        if partitions:
+            return self.iter_partitioned(
+                self.candidate_url,
+                params,
+                partitions,
+                key="candidate_id",
+                checkpoints=checkpoints,
+                dead_letters=dead_letters,
+            )
+        return self.iter_pages(
+            self.candidate_url,
+            params,
+            checkpoints=checkpoints,
+            dead_letters=dead_letters,
+        )
 
-        candidates = await self._paginate(self.candidate_url, params)
+    async def get_candidates(self, **kwargs) -> list[dict]:
+        candidates = await self._collect(self.iter_candidates(**kwargs))
         logger.info(f"✅ Fetched {len(candidates)} candidates")
         return candidates
 
-    async def get_committees(self, per_page: int = 100, **kwargs) -> list[dict]:
+    async def get_candidates_by_ids(
+        self, candidate_ids: List[str], batch_size: int = 100
+    ) -> list[dict]:
+        """Look up specific candidates, batching IDs into multi-value queries.
+
+        /candidates/ accepts a repeated candidate_id param, so each batch of
+        up to batch_size IDs costs a single request.
+        """
+        chunks = [
+            candidate_ids[i : i + batch_size]
+            for i in range(0, len(candidate_ids), batch_size)
+        ]
+        pages = await asyncio.gather(
+            *(
+                self._collect(
+                    self.iter_candidates(per_page=batch_size, candidate_id=chunk)
+                )
+                for chunk in chunks
+            )
+        )
+        candidates = [c for page in pages for c in page]
+        logger.info(
+            f"✅ Looked up {len(candidates)}/{len(candidate_ids)} candidates by ID"
+        )
+        return candidates
+
+    def iter_committees(
+        self,
+        per_page: int = 100,
+        checkpoints: Optional[PaginationCheckpointService] = None,
+        dead_letters: Optional[PageDeadLetterService] = None,
+        partitions: Optional[Partitions] = None,
+        **kwargs,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream committee pages as they arrive.
+
+        Pass partitions (e.g. "committee_type" or "state") to fetch disjoint
+        slices concurrently.
+        """
         params = {
-            "api_key": self.api_key,
             "per_page": per_page,
         }
         params.update(kwargs)
+        if partitions:
+            return self.iter_partitioned(
+                self.committee_url,
+                params,
+                partitions,
+                key="committee_id",
+                checkpoints=checkpoints,
+                dead_letters=dead_letters,
+            )
+        return self.iter_pages(
+            self.committee_url,
+            params,
+            checkpoints=checkpoints,
+            dead_letters=dead_letters,
+        )
 
-        committees = await self._paginate(self.committee_url, params)
+    async def get_committees(self, **kwargs) -> list[dict]:
+        committees = await self._collect(self.iter_committees(**kwargs))
         logger.info(f"✅ Fetched {len(committees)} committees")
         return committees
 
-    async def get_candidate_totals(
+    def iter_candidate_totals(
         self,
         cycle: int = 2024,
         per_page: int = 100,
         office: list[str] = FEDERAL_OFFICES,
+        dead_letters: Optional[PageDeadLetterService] = None,
         **kwargs,
-    ) -> list[dict]:
-        """Fetch inside spending totals for candidates."""
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream inside spending totals pages for candidates."""
         params = {
-            "api_key": self.api_key,
             "cycle": cycle,
             "election_full": "false",
             "per_page": per_page,
             "office": office,
             **kwargs,
         }
+        return self.iter_pages(
+            self.candidate_totals_url, params, dead_letters=dead_letters
+        )
 
-        totals = await self._paginate(self.candidate_totals_url, params)
+    async def get_candidate_totals(self, **kwargs) -> list[dict]:
+        """Fetch inside spending totals for candidates."""
+        totals = await self._collect(self.iter_candidate_totals(**kwargs))
         logger.info(f"✅ Fetched {len(totals)} inside candidate totals")
         return totals
 
-    async def get_candidate_schedule_e_totals(
+    def iter_candidate_schedule_e_totals(
         self,
         cycle: int = 2024,
         per_page: int = 100,
         office: list[str] = FEDERAL_OFFICES,
+        dead_letters: Optional[PageDeadLetterService] = None,
         **kwargs,
-    ) -> list[dict]:
-        """Fetch independent expenditures aggregated by candidate."""
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream independent expenditure totals pages aggregated by candidate."""
         params = {
-            "api_key": self.api_key,
             "cycle": cycle,
             "per_page": per_page,
             "office": office,
             **kwargs,
         }
+        return self.iter_pages(
+            self.schedule_e_totals_by_candidate_url, params, dead_letters=dead_letters
+        )
 
-        totals = await self._paginate(self.schedule_e_totals_by_candidate_url, params)
+    async def get_candidate_schedule_e_totals(self, **kwargs) -> list[dict]:
+        """Fetch independent expenditures aggregated by candidate."""
+        totals = await self._collect(self.iter_candidate_schedule_e_totals(**kwargs))
         logger.info(f"✅ Fetched {len(totals)} candidate schedule E totals")
         return totals
 
+    def iter_schedule_e(
+        self,
+        cycle: int = 2024,
+        per_page: int = 100,
+        windows: int = 1,
+        since: Optional[date] = None,
+        checkpoints: Optional[PaginationCheckpointService] = None,
+        dead_letters: Optional[PageDeadLetterService] = None,
+        **kwargs,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Stream itemized independent expenditures for one cycle.
+
+        /schedules/schedule_e/ is keyset paginated. With windows > 1 the
+        cycle's expenditure dates (from `since`, if given) are split into
+        that many min_date/max_date windows fetched in parallel; each
+        window keeps its own resumable cursor chain, and windows that fail
+        go to `dead_letters`.
+        """
+        params = {
+            "two_year_transaction_period": cycle,
+            "per_page": per_page,
+            **kwargs,
+        }
+        start, end = date(cycle - 1, 1, 1), date(cycle, 12, 31)
+        if since:
+            start = max(start, since)
+            params["min_date"] = start.isoformat()
+        if windows > 1 and start <= end:
+            ranges = self.split_date_range(start, end, windows)
+            return self.iter_keyset_ranges(
+                self.schedule_e_url,
+                params,
+                ranges,
+                checkpoints=checkpoints,
+                dead_letters=dead_letters,
+            )
+        return self.iter_keyset_pages(
+            self.schedule_e_url, params, checkpoints=checkpoints
+        )
+
+    @staticmethod
+    async def _collect(
+        pages: AsyncIterator[List[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
+        async for page in pages:
+            results.extend(page)
+        return results
+
     async def __aenter__(self):
         return self
 
@@ -219,3 +894,5 @@ class FECClient:
 
     async def close(self):
         await self.client.aclose()
+        if self.cache:
+            self.cache.close()
@@ -10,9 +10,9 @@ class FECAPIError(Exception):
 class FECRateLimitError(FECAPIError):
     """Raised when FEC API rate limit is exceeded.
 
-    Not retried — the minute_limiter in FECClient should prevent 429s entirely.
-    If one does occur, retrying immediately with a short backoff won't help since
-    the per-minute window hasn't reset.
+    Not retried — FECClient's adaptive limiters back off on 429s (and honor
+    Retry-After) for subsequent requests, but retrying this one immediately
+    with a short backoff won't help since the window hasn't reset.
     """
 
     retryable = False
@@ -0,0 +1,189 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _header_int(headers: Mapping[str, Any], name: str) -> Optional[int]:
+    """Parse an integer response header, ignoring missing or malformed values."""
+    try:
+        return int(float(headers.get(name)))
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveLimiter:
+    """Base for limiters that tune themselves from FEC responses.
+
+    Used as an async context manager around each request (like
+    aiolimiter.AsyncLimiter), then fed the response via observe().
+    """
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        return None
+
+    def observe(self, status_code: int, headers: Mapping[str, Any]) -> None:
+        """Update limiter state from one response's status and headers."""
+
+    def metrics(self) -> Dict[str, Any]:
+        """Current limiter state, for logging and monitoring."""
+        return {}
+
+
+class HourlyBudgetLimiter(AdaptiveLimiter):
+    """Hourly request budget kept in sync with the API's rate-limit headers.
+
+    Drop-in for AsyncLimiter(900, 3600). The budget refills continuously at
+    limit/hour like a leaky bucket, but every response's X-RateLimit-Limit
+    and X-RateLimit-Remaining overwrite the local estimate, so the full
+    budget is used when it exists and requests slow to the refill rate as
+    soon as the API reports it is nearly spent. `reserve` requests are held
+    back for other users of the same key.
+    """
+
+    def __init__(self, limit: int = 1000, reserve: int = 25) -> None:
+        self.limit = limit
+        self.reserve = reserve
+        self._remaining = float(limit)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def refill_rate(self) -> float:
+        """Requests regained per second."""
+        return self.limit / 3600
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._remaining = min(self.limit, self._remaining + elapsed * self.refill_rate)
+
+    async def __aenter__(self) -> "HourlyBudgetLimiter":
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._remaining >= self.reserve + 1:
+                    self._remaining -= 1
+                    return self
+                deficit = self.reserve + 1 - self._remaining
+                await asyncio.sleep(deficit / self.refill_rate)
+
+    def observe(self, status_code: int, headers: Mapping[str, Any]) -> None:
+        limit = _header_int(headers, "X-RateLimit-Limit")
+        if limit:
+            self.limit = limit
+
+        remaining = _header_int(headers, "X-RateLimit-Remaining")
+        if remaining is not None:
+            self._refill()
+            self._remaining = float(remaining)
+        elif status_code == 429:
+            self._refill()
+            self._remaining = 0.0
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "hourly_limit": self.limit,
+            "budget_remaining": int(self._remaining),
+        }
+
+
+class AdaptivePacer(AdaptiveLimiter):
+    """Per-request pacing and in-flight concurrency, tuned by AIMD.
+
+    Drop-in for the 1 req/sec minute limiter plus the fixed page semaphore.
+    Request starts are spaced 1/rate seconds apart and at most `concurrency`
+    requests are in flight. Each success raises the rate additively (and
+    the concurrency by one every `concurrency` successes); a 429 halves both
+    and pauses all requests for Retry-After seconds when the API sends it.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = 1.0,
+        min_rate: float = 0.2,
+        max_rate: float = 10.0,
+        rate_step: float = 0.05,
+        initial_concurrency: int = 4,
+        max_concurrency: int = 10,
+        backoff_factor: float = 0.5,
+    ) -> None:
+        self.rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate_step = rate_step
+        self.concurrency = initial_concurrency
+        self.max_concurrency = max_concurrency
+        self.backoff_factor = backoff_factor
+
+        self.in_flight = 0
+        self.throttled = 0
+        self._successes = 0
+        self._next_slot = time.monotonic()
+        self._paused_until = 0.0
+        self._slot_available = asyncio.Condition()
+
+    async def __aenter__(self) -> "AdaptivePacer":
+        async with self._slot_available:
+            await self._slot_available.wait_for(
+                lambda: self.in_flight < self.concurrency
+            )
+            self.in_flight += 1
+
+        # Reserve a start slot, then sleep outside the lock until it comes up.
+        now = time.monotonic()
+        start = max(now, self._next_slot, self._paused_until)
+        self._next_slot = start + 1 / self.rate
+        if start > now:
+            try:
+                await asyncio.sleep(start - now)
+            except BaseException:
+                await self.__aexit__(None, None, None)
+                raise
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        async with self._slot_available:
+            self.in_flight -= 1
+            self._slot_available.notify_all()
+
+    def observe(self, status_code: int, headers: Mapping[str, Any]) -> None:
+        if status_code == 429:
+            self._back_off(_header_int(headers, "Retry-After"))
+        elif status_code < 400:
+            self._speed_up()
+
+    def _speed_up(self) -> None:
+        self.rate = min(self.max_rate, self.rate + self.rate_step)
+        self._successes += 1
+        if self._successes >= self.concurrency:
+            self._successes = 0
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+
+    def _back_off(self, retry_after: Optional[int]) -> None:
+        self.throttled += 1
+        self._successes = 0
+        self.rate = max(self.min_rate, self.rate * self.backoff_factor)
+        self.concurrency = max(1, int(self.concurrency * self.backoff_factor))
+        if retry_after:
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        logger.warning(
+            f"FEC rate limited: backing off to {self.rate:.2f} req/s, "
+            f"{self.concurrency} in flight"
+            + (f", pausing {retry_after}s" if retry_after else "")
+        )
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "rate_per_sec": round(self.rate, 3),
+            "concurrency": self.concurrency,
+            "in_flight": self.in_flight,
+            "throttled": self.throttled,
+            "paused_for": max(0.0, round(self._paused_until - time.monotonic(), 1)),
+        }
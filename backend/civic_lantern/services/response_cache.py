@@ -0,0 +1,212 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Union
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Params that don't change the response body.
+_UNCACHED_PARAMS = ("api_key",)
+
+
+@dataclass
+class CachedResponse:
+    """A stored FEC response body plus what is needed to revalidate it."""
+
+    key: str
+    body: Dict[str, Any]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fresh: bool
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """On-disk cache of FEC API responses, stored zlib-compressed in SQLite.
+
+    Entries are keyed by URL plus params (minus api_key), so identical page
+    requests made with different keys share one entry. Each endpoint path
+    can have its own TTL via `ttls` (longest matching path prefix wins,
+    otherwise `default_ttl`). Expired entries that carry an ETag or
+    Last-Modified are kept for revalidation; FECClient sends them back as
+    If-None-Match/If-Modified-Since and a 304 refreshes the entry. Once the
+    stored bodies exceed `max_bytes`, least recently used entries are
+    evicted. Hit/miss/revalidation counts are kept per endpoint.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        default_ttl: float = 24 * 3600,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_bytes: int = 512 * 1024 * 1024,
+    ) -> None:
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.max_bytes = max_bytes
+        self.counters: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "revalidated": 0}
+        )
+        self._db = sqlite3.connect(path / "fec_responses.sqlite3")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS ix_responses_accessed_at "
+            "ON responses (accessed_at)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def cache_key(url: str, params: Mapping[str, Any]) -> str:
+        """Stable key for one request, independent of the API key used."""
+        kept = {k: v for k, v in params.items() if k not in _UNCACHED_PARAMS}
+        payload = json.dumps([url, kept], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    def endpoint(url: str) -> str:
+        """URL path used for TTL lookup and counters."""
+        return urlsplit(url).path
+
+    def ttl_for(self, url: str) -> float:
+        path = self.endpoint(url)
+        matches = [prefix for prefix in self.ttls if path.startswith(prefix)]
+        if matches:
+            return self.ttls[max(matches, key=len)]
+        return self.default_ttl
+
+    def get(self, url: str, params: Mapping[str, Any]) -> Optional[CachedResponse]:
+        """Return the stored response, fresh or revalidatable, or None.
+
+        Fresh entries count as hits. Expired entries without validators are
+        unusable and count as misses; expired entries with validators are
+        returned with fresh=False and counted once revalidation resolves.
+        """
+        key = self.cache_key(url, params)
+        row = self._db.execute(
+            "SELECT body, etag, last_modified, stored_at FROM responses "
+            "WHERE key = ?",
+            (key,),
+        ).fetchone()
+        endpoint = self.endpoint(url)
+        if row is None:
+            self.counters[endpoint]["misses"] += 1
+            return None
+
+        body, etag, last_modified, stored_at = row
+        now = time.time()
+        fresh = now - stored_at < self.ttl_for(url)
+        if not fresh and not (etag or last_modified):
+            self.counters[endpoint]["misses"] += 1
+            return None
+
+        self._db.execute(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+        )
+        self._db.commit()
+        if fresh:
+            self.counters[endpoint]["hits"] += 1
+        return CachedResponse(
+            key=key,
+            body=json.loads(zlib.decompress(body)),
+            etag=etag,
+            last_modified=last_modified,
+            fresh=fresh,
+        )
+
+    def put(
+        self,
+        url: str,
+        params: Mapping[str, Any],
+        body: Dict[str, Any],
+        headers: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """Store a response body with its validators, then enforce max_bytes."""
+        headers = headers or {}
+        blob = zlib.compress(json.dumps(body).encode())
+        now = time.time()
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses "
+            "(key, endpoint, body, size, etag, last_modified, stored_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                self.cache_key(url, params),
+                self.endpoint(url),
+                blob,
+                len(blob),
+                headers.get("ETag"),
+                headers.get("Last-Modified"),
+                now,
+                now,
+            ),
+        )
+        self._evict()
+        self._db.commit()
+
+    def revalidated(self, url: str, entry: CachedResponse) -> None:
+        """Record a 304 for an expired entry: it is fresh for another TTL."""
+        now = time.time()
+        self._db.execute(
+            "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+            (now, now, entry.key),
+        )
+        self._db.commit()
+        self.counters[self.endpoint(url)]["revalidated"] += 1
+
+    def stale(self, url: str) -> None:
+        """Record that an expired entry's revalidation returned a new body."""
+        self.counters[self.endpoint(url)]["misses"] += 1
+
+    def _evict(self) -> None:
+        (total,) = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+
+        evicted = []
+        for key, size in self._db.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        logger.debug(f"Evicted {len(evicted)} cached FEC responses")
+
+    def metrics(self) -> Dict[str, Dict[str, int]]:
+        return {endpoint: dict(counts) for endpoint, counts in self.counters.items()}
+
+    def close(self) -> None:
+        self._db.close()
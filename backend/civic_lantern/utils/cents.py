@@ -0,0 +1,50 @@
+from decimal import ROUND_HALF_UP, Decimal
+from itertools import repeat
+from typing import Any, Dict, Hashable, List, Mapping, Sequence, Tuple
+
+_HUNDRED = 100.0
+
+
+def to_cents(value: Any) -> int:
+    """Integer cents for an amount given as a float, int, str or Decimal.
+
+    None and "" count as zero. Floats are rounded to the nearest cent, which
+    recovers the exact amount for anything a Numeric(15, 2) column can hold.
+    """
+    if not value:
+        return 0
+    if isinstance(value, float):
+        return round(value * _HUNDRED)
+    return int((Decimal(value) * 100).to_integral_value(ROUND_HALF_UP))
+
+
+def from_cents(cents: int) -> Decimal:
+    """The two-place Decimal for an amount in cents."""
+    return Decimal(cents).scaleb(-2)
+
+
+def sum_cents_by_key(
+    keys: Sequence[Hashable], columns: Mapping[str, Sequence[Any]]
+) -> Tuple[List[Hashable], Dict[str, List[Decimal]]]:
+    """Group rows by key and sum each amount column exactly.
+
+    keys[i] is row i's group key and columns maps a column name to its
+    per-row amounts. Returns the distinct keys in order of first row, and
+    {column: Decimal totals} aligned with them. Each amount is converted to
+    cents and added to its group's integer total in the same pass; floats
+    (the JSON case) are converted inline, anything else through to_cents().
+    """
+    index: Dict[Hashable, int] = {}
+    groups = [index.setdefault(key, len(index)) for key in keys]
+
+    sums: Dict[str, List[Decimal]] = {}
+    for name, values in columns.items():
+        totals = [0] * len(index)
+        for group, value in zip(groups, values):
+            if isinstance(value, float):
+                totals[group] += round(value * _HUNDRED)
+            else:
+                totals[group] += to_cents(value)
+        # from_cents() without a Python call per total.
+        sums[name] = list(map(Decimal.scaleb, map(Decimal, totals), repeat(-2)))
+    return list(index), sums
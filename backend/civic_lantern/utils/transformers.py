@@ -1,71 +1,221 @@
 import logging
-from typing import Any, Dict, List, Type, TypeVar
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from pydantic import BaseModel, ValidationError
+from pydantic import (
+    BaseModel,
+    TypeAdapter,
+    ValidationError,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
+)
 
 from civic_lantern.schemas.candidate import CandidateIn
 from civic_lantern.schemas.committee import CommitteeIn
 from civic_lantern.schemas.inside_totals_by_candidate import InsideTotalsByCandidateIn
+from civic_lantern.schemas.schedule_e_itemized import ScheduleEItemizedIn
 from civic_lantern.schemas.schedule_e_totals_by_candidate import (
     ScheduleETotalsByCandidateIn,
 )
+from civic_lantern.services.data.base import model_rows
+from civic_lantern.utils.cents import sum_cents_by_key
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# Row dicts keyed by table column, as returned when a transform is given
+# `columns`; BaseService.upsert_batch() takes them without re-dumping.
+Rows = List[Dict[str, Any]]
+
+
+def _output(records: List[T], columns: Optional[Sequence[str]]) -> Union[List[T], Rows]:
+    return model_rows(records, columns) if columns is not None else records
+
+
+# Amounts summed per (candidate_id, cycle) by the inside totals transform.
+INSIDE_TOTAL_FIELDS = ("receipts", "disbursements")
+
+
+# Records validated per TypeAdapter call.
+VALIDATION_CHUNK_SIZE = 1000
+
+
+def _none_on_error(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    try:
+        return handler(value)
+    except ValidationError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema_cls: Type[T]) -> TypeAdapter[List[Optional[T]]]:
+    """List validator for a schema, built once. Invalid items come back None."""
+    item = Annotated[schema_cls, WrapValidator(_none_on_error)]  # type: ignore[valid-type]
+    return TypeAdapter(List[item])  # type: ignore[valid-type]
+
+
+def _validate_one(
+    idx: int, raw: Dict[str, Any], schema_cls: Type[T], id_field: str, entity_name: str
+) -> Optional[T]:
+    record_id = raw.get(id_field, f"index {idx}")
+    try:
+        return schema_cls.model_validate(raw)
+    except ValidationError as e:
+        logger.warning(f"Skipping {entity_name} {record_id}: {e}")
+    except Exception as e:
+        logger.error(f"Unexpected crash on {entity_name} {record_id}: {e}")
+    return None
+
+
+def _validate_chunk(
+    chunk: List[Dict[str, Any]], schema_cls: Type[T]
+) -> List[Optional[T]]:
+    """Validate raw records in one call; None for each one that fails.
+
+    A chunk that raises something other than a ValidationError comes back
+    all None, so every record in it is retried (and logged) on its own.
+    """
+    try:
+        return _list_adapter(schema_cls).validate_python(chunk)
+    except Exception:
+        return [None] * len(chunk)
+
 
 def _transform_records(
     raw_records: List[Dict[str, Any]],
     schema_cls: Type[T],
     id_field: str,
     entity_name: str,
-) -> List[T]:
-    transformed = []
+    columns: Optional[Sequence[str]] = None,
+) -> Union[List[T], Rows]:
+    # Dedupe before validating so a repeated ID is validated once. The last
+    # occurrence is kept at the first occurrence's position; records without
+    # an ID are kept apart so they still fail validation individually.
+    unique: Dict[Any, Tuple[int, Dict[str, Any]]] = {}
+    earlier: Dict[Any, List[Tuple[int, Dict[str, Any]]]] = {}
     for idx, raw in enumerate(raw_records):
-        record_id = raw.get(id_field, f"index {idx}")
-        try:
-            transformed.append(schema_cls.model_validate(raw))
-        except ValidationError as e:
-            logger.warning(f"Skipping {entity_name} {record_id}: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected crash on {entity_name} {record_id}: {e}")
+        key = raw.get(id_field)
+        if isinstance(key, str):
+            key = key.strip()
+        if key is None:
+            key = (None, idx)
+        previous = unique.get(key)
+        if previous is not None:
+            earlier.setdefault(key, []).append(previous)
+        unique[key] = (idx, raw)
 
+    keys = list(unique)
+    transformed: List[T] = []
+    for start in range(0, len(keys), VALIDATION_CHUNK_SIZE):
+        chunk_keys = keys[start : start + VALIDATION_CHUNK_SIZE]
+        chunk = [unique[key][1] for key in chunk_keys]
+        for key, record in zip(chunk_keys, _validate_chunk(chunk, schema_cls)):
+            if record is None:
+                # Log the kept record's failure, then fall back to the
+                # latest earlier duplicate that validates.
+                candidates = [unique[key], *reversed(earlier.get(key, ()))]
+                for idx, raw in candidates:
+                    record = _validate_one(idx, raw, schema_cls, id_field, entity_name)
+                    if record is not None:
+                        break
+            if record is not None:
+                transformed.append(record)
+
+    # Validators can still map distinct raw IDs onto the same value.
     seen: dict[str, T] = {}
     for record in transformed:
         seen[getattr(record, id_field)] = record
     deduped = list(seen.values())
 
-    if len(deduped) < len(transformed):
-        logger.warning(
-            f"Dropped {len(transformed) - len(deduped)} duplicate {id_field}(s)."
-        )
+    duplicates = len(raw_records) - len(unique) + len(transformed) - len(deduped)
+    if duplicates:
+        logger.warning(f"Dropped {duplicates} duplicate {id_field}(s).")
 
     logger.info(f"Successfully transformed {len(deduped)}/{len(raw_records)} records.")
 
-    return deduped
+    return _output(deduped, columns)
+
 
+def transform_candidates(
+    raw_candidates: List[Dict[str, Any]], columns: Optional[Sequence[str]] = None
+) -> Union[List[CandidateIn], Rows]:
+    """Transform raw FEC candidate data. Skips invalid records and deduplicates.
 
-def transform_candidates(raw_candidates: List[Dict[str, Any]]) -> List[CandidateIn]:
-    """Transform raw FEC candidate data. Skips invalid records and deduplicates."""
-    return _transform_records(raw_candidates, CandidateIn, "candidate_id", "candidate")
+    Every transform_* function returns schema instances, or row dicts
+    holding just `columns` (in that order) when columns is given.
+    """
+    return _transform_records(
+        raw_candidates, CandidateIn, "candidate_id", "candidate", columns
+    )
 
 
-def transform_committees(raw_committees: List[Dict[str, Any]]) -> List[CommitteeIn]:
+def transform_committees(
+    raw_committees: List[Dict[str, Any]], columns: Optional[Sequence[str]] = None
+) -> Union[List[CommitteeIn], Rows]:
     """Transform raw FEC committee data. Skips invalid records and deduplicates."""
-    return _transform_records(raw_committees, CommitteeIn, "committee_id", "committee")
+    return _transform_records(
+        raw_committees, CommitteeIn, "committee_id", "committee", columns
+    )
 
 
-def transform_inside_totals_by_candidate(
+def transform_schedule_e_itemized(
     raw_records: List[Dict[str, Any]],
-) -> List[InsideTotalsByCandidateIn]:
+    cycle: Optional[int] = None,
+    columns: Optional[Sequence[str]] = None,
+) -> Union[List[ScheduleEItemizedIn], Rows]:
+    """Transform raw itemized Schedule E rows. Skips invalid records and deduplicates.
+
+    Rows lacking two_year_transaction_period are assigned `cycle`, the
+    cycle they were queried for. Without one they can't be placed in a
+    partition and are dropped with a warning.
+    """
+    if cycle is not None:
+        raw_records = [
+            raw if raw.get("two_year_transaction_period") else {**raw, "cycle": cycle}
+            for raw in raw_records
+        ]
+    else:
+        placed = [
+            raw
+            for raw in raw_records
+            if raw.get("two_year_transaction_period") or raw.get("cycle")
+        ]
+        if len(placed) < len(raw_records):
+            logger.warning(
+                f"Dropped {len(raw_records) - len(placed)} schedule E "
+                f"expenditure(s) with no two_year_transaction_period and no "
+                f"queried cycle to assign."
+            )
+        raw_records = placed
+    return _transform_records(
+        raw_records, ScheduleEItemizedIn, "sub_id", "schedule E expenditure", columns
+    )
+
+
+def transform_inside_totals_by_candidate(
+    raw_records: List[Dict[str, Any]], columns: Optional[Sequence[str]] = None
+) -> Union[List[InsideTotalsByCandidateIn], Rows]:
     """Transform raw FEC candidate totals into inside spending records.
 
     /candidates/totals/ returns multiple rows per candidate (e.g. primary +
-    general election rows). Accumulates receipts and disbursements across all
-    rows for the same (candidate_id, cycle) before validating.
+    general election rows). Receipts and disbursements are summed across
+    all rows for the same (candidate_id, cycle) in integer cents, giving
+    exact Decimal totals for the Numeric(15, 2) columns, before validating.
     """
-    accumulated: dict[tuple, dict] = {}
+    keys: List[Tuple[Any, Any]] = []
+    kept: List[Dict[str, Any]] = []
 
     for idx, item in enumerate(raw_records):
         candidate_id = item.get("candidate_id")
@@ -78,41 +228,38 @@ def transform_inside_totals_by_candidate(
             )
             continue
 
-        key = (candidate_id, cycle)
-        if key not in accumulated:
-            accumulated[key] = {
-                "candidate_id": candidate_id,
-                "cycle": cycle,
-                "receipts": 0.0,
-                "disbursements": 0.0,
-            }
+        keys.append((candidate_id, cycle))
+        kept.append(item)
 
-        accumulated[key]["receipts"] += float(item.get("receipts") or 0)
-        accumulated[key]["disbursements"] += float(item.get("disbursements") or 0)
+    group_keys, totals = sum_cents_by_key(
+        keys,
+        {field: [item.get(field) for item in kept] for field in INSIDE_TOTAL_FIELDS},
+    )
 
-    results = []
-    for data in accumulated.values():
+    results: List[InsideTotalsByCandidateIn] = []
+    fields = ("candidate_id", "cycle", *totals)
+    for key, *amounts in zip(group_keys, *totals.values()):
         try:
-            results.append(InsideTotalsByCandidateIn.model_validate(data))
-        except ValidationError as e:
-            logger.warning(
-                f"Skipping inside totals for {data.get('candidate_id')}: {e}"
+            results.append(
+                InsideTotalsByCandidateIn.model_validate(
+                    dict(zip(fields, (*key, *amounts)))
+                )
             )
+        except ValidationError as e:
+            logger.warning(f"Skipping inside totals for {key[0]}: {e}")
         except Exception as e:
-            logger.error(
-                f"Unexpected crash on inside totals for {data.get('candidate_id')}: {e}"
-            )
+            logger.error(f"Unexpected crash on inside totals for {key[0]}: {e}")
 
     logger.info(
         f"Successfully transformed {len(results)} inside totals from "
         f"{len(raw_records)} records."
     )
-    return results
+    return _output(results, columns)
 
 
 def transform_schedule_e_totals_by_candidate(
-    raw_records: List[Dict[str, Any]],
-) -> List[ScheduleETotalsByCandidateIn]:
+    raw_records: List[Dict[str, Any]], columns: Optional[Sequence[str]] = None
+) -> Union[List[ScheduleETotalsByCandidateIn], Rows]:
     """Transform raw FEC schedule E totals by candidate.
 
     Skips rows without a candidate_id — some IEs are not attributed to a
@@ -150,4 +297,4 @@ def transform_schedule_e_totals_by_candidate(
         f"Successfully transformed {len(results)} schedule E totals from "
         f"{len(raw_records)} records."
     )
-    return results
+    return _output(results, columns)
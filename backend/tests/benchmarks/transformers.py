@@ -0,0 +1,136 @@
+"""Throughput of transform_candidates: a git revision vs. the working tree.
+
+Run from backend/:
+
+    python -m tests.benchmarks.transformers --before <rev> [--records 100000]
+
+"before" is transform_candidates, with the CandidateIn it validates
+through, loaded from civic_lantern/utils/transformers.py and
+civic_lantern/schemas/candidate.py at <rev>; "after" is the checked-out
+code. The synthetic feed mimics a paged /candidates/ pull: ~2% of rows
+repeat an earlier candidate (pages shifting between requests) and ~0.1%
+are invalid. Both sides must keep the same records.
+"""
+
+import argparse
+import gc
+import logging
+import random
+import subprocess
+import sys
+import time
+from types import ModuleType
+from typing import Any, Callable, Dict, List
+
+from civic_lantern.utils.transformers import transform_candidates
+
+OFFICES = ("H", "S", "P")
+STATES = ("CA", "TX", "NY", "FL", "PA", "OH")
+
+
+def synthetic_candidates(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        if records and rng.random() < 0.02:
+            records.append(dict(rng.choice(records)))
+            continue
+        office = rng.choice(OFFICES)
+        records.append(
+            {
+                "candidate_id": f"{office}{i:08d}",
+                "name": "" if rng.random() < 0.001 else f"DOE{i}, JOHN Q JR",
+                "office": office,
+                "state": rng.choice(STATES),
+                "party": rng.choice(("DEM", "REP", "IND")),
+                "district": str(rng.randint(0, 52)) if office == "H" else None,
+                "incumbent_challenge": rng.choice(("I", "C", "O")),
+                "candidate_status": "C",
+                "cycles": [2020, 2022, 2024],
+                "election_years": [2024],
+                "has_raised_funds": True,
+                "first_file_date": "2019-03-04",
+                "last_file_date": "2024-06-30",
+                "load_date": "2024-07-01T02:15:00",
+            }
+        )
+    return records
+
+
+# Loaded from the revision in this order, each visible to the next.
+BEFORE_MODULES = {
+    "civic_lantern.schemas.candidate": "civic_lantern/schemas/candidate.py",
+    "civic_lantern.utils.transformers": "civic_lantern/utils/transformers.py",
+}
+
+
+def load_before(rev: str) -> ModuleType:
+    """The transformers module as of `rev`, with that revision's CandidateIn."""
+    saved = {name: sys.modules[name] for name in BEFORE_MODULES}
+    try:
+        for name, path in BEFORE_MODULES.items():
+            source = subprocess.run(
+                ["git", "show", f"{rev}:./{path}"],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            module = ModuleType(name)
+            module.__file__ = f"{rev}:{path}"
+            sys.modules[name] = module
+            exec(compile(source, module.__file__, "exec"), module.__dict__)
+        return module
+    finally:
+        sys.modules.update(saved)
+
+
+def measure(
+    candidates: Dict[str, Callable], records: List[Dict[str, Any]], repeat: int
+) -> Dict[str, float]:
+    """Best-of-repeat throughput per candidate, interleaving the runs so both
+    see the same machine noise. The collector is off while timing, as in
+    timeit."""
+    best = dict.fromkeys(candidates, float("inf"))
+    for _ in range(repeat):
+        for name, fn in candidates.items():
+            gc.collect()
+            gc.disable()
+            started = time.process_time()
+            try:
+                fn(records)
+            finally:
+                elapsed = time.process_time() - started
+                gc.enable()
+            best[name] = min(best[name], elapsed)
+    rates = {name: len(records) / elapsed for name, elapsed in best.items()}
+    for name, rate in rates.items():
+        print(f"{name:<12} {rate:>12,.0f} records/s")
+    return rates
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--before", required=True, help="git revision to compare")
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=7)
+    args = parser.parse_args()
+
+    # Keep per-row skip warnings out of the timings.
+    logging.disable(logging.WARNING)
+    before = load_before(args.before).transform_candidates
+    records = synthetic_candidates(args.records)
+
+    kept_before = [r.model_dump() for r in before(records)]
+    kept_after = [r.model_dump() for r in transform_candidates(records)]
+    if kept_before != kept_after:
+        raise SystemExit("before and after kept different records")
+    print(f"{len(kept_after):,} of {len(records):,} records kept by both")
+
+    rates = measure(
+        {"before": before, "after": transform_candidates}, records, args.repeat
+    )
+    print(f"speedup      {rates['after'] / rates['before']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,3 @@
-import asyncio
 from unittest.mock import patch
 
 import pytest
@@ -38,23 +37,14 @@ async def client():
     run at full speed. Limiter wiring is verified separately in TestFECClientRateLimiting.
     """
     async with FECClient() as client:
-        client.limiter = AsyncLimiter(max_rate=10000, time_period=1)
-        client.minute_limiter = AsyncLimiter(max_rate=10000, time_period=1)
+        for slot in client.keys.slots:
+            slot.budget = AsyncLimiter(max_rate=10000, time_period=1)
+            slot.pacer = AsyncLimiter(max_rate=10000, time_period=1)
         yield client
 
 
 @pytest.fixture(autouse=True, scope="session")
 def globally_silence_tqdm():
-    """Silence all tqdm animations during tests by shimming gather."""
-
-    async def silent_gather(*args, **kwargs):
-        return await asyncio.gather(*args)
-
-    with (
-        patch(
-            "civic_lantern.services.fec_client.tqdm_asyncio.gather",
-            side_effect=silent_gather,
-        ),
-        patch("civic_lantern.services.fec_client.tqdm.write"),
-    ):
+    """Silence all tqdm progress bars and writes during tests."""
+    with patch("civic_lantern.services.fec_client.tqdm"):
         yield
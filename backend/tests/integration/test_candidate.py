@@ -397,3 +397,54 @@ class TestCandidateGetList:
 
         assert "items" in result_desc
         assert "items" in result_asc
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+class TestBulkUpsert:
+    async def test_bulk_inserts_and_updates(self, async_db):
+        """COPY-staged bulk path reports inserted vs updated like upsert_batch."""
+        service = CandidateService(db=async_db)
+        await service.upsert_batch([CandidateIn(candidate_id="C001", name="Old")])
+
+        stats = await service.upsert_batch(
+            [
+                CandidateIn(candidate_id="C001", name="New", office="H"),
+                CandidateIn(candidate_id="C002", name="Second", cycles=[2024]),
+            ],
+            bulk=True,
+        )
+
+        assert stats["inserted"] == 1
+        assert stats["updated"] == 1
+        assert stats["errors"] == 0
+        updated = await service.get_by_id("C001")
+        assert updated.name == "New"
+        assert updated.office == OfficeTypeEnum.HOUSE
+        assert (await service.get_by_id("C002")).cycles == [2024]
+
+    async def test_bulk_skips_unchanged_rows(self, async_db):
+        """Re-loading identical rows neither inserts nor updates."""
+        service = CandidateService(db=async_db)
+        rows = [CandidateIn(candidate_id=f"C_{i}", name=f"N {i}") for i in range(5)]
+        await service.upsert_batch(rows, bulk=True)
+
+        stats = await service.upsert_batch(rows, bulk=True)
+
+        assert stats["inserted"] == 0
+        assert stats["updated"] == 0
+
+    async def test_bulk_falls_back_on_invalid_row(self, async_db):
+        """A failing bulk load still isolates bad rows into failed_ids."""
+        service = CandidateService(db=async_db)
+
+        stats = await service.upsert_batch(
+            [
+                {"candidate_id": "C_VALID", "name": "Valid"},
+                {"candidate_id": "C_INVALID", "name": None},
+            ],
+            bulk=True,
+        )
+
+        assert stats["inserted"] == 1
+        assert stats["failed_ids"] == ["C_INVALID"]
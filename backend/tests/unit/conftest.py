@@ -1,7 +1,9 @@
+from typing import Any, Dict, List
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from civic_lantern.jobs.base_ingestor import BaseIngestor
 from civic_lantern.jobs.manager import IngestionManager
 
 
@@ -22,6 +24,73 @@ def manager(mock_client: AsyncMock) -> IngestionManager:
     return m
 
 
+# ---------------------------------------------------------------------------
+# Fake ingestor — for BaseIngestor run modes (pipelined, landing, replay...)
+# ---------------------------------------------------------------------------
+
+
+class PagedIngestor(BaseIngestor):
+    """Streams fixed pages through an identity transform.
+
+    transformed holds each transform() input and upserted every record the
+    service received. service is an AsyncMock whose upsert_batch counts
+    records and reports `errors` errors. Subclass to override fetching or
+    transforming; pass any other keyword to set that attribute.
+    """
+
+    entity_name = "fake"
+    endpoint = "/fake/"
+
+    def __init__(
+        self, client, session, *, pages=(), pipelined=True, errors=0, **attrs: Any
+    ):
+        super().__init__(client, session)
+        self.pages = list(pages)
+        self.pipelined = pipelined
+        self.errors = errors
+        self.fetched_pages = 0
+        self.transformed: List[List[Any]] = []
+        self.upserted: List[Any] = []
+        self.service = AsyncMock()
+        self.service.upsert_batch.side_effect = self._upsert
+        for name, value in attrs.items():
+            setattr(self, name, value)
+
+    async def fetch(self, **kwargs: Any) -> list:
+        return [record for page in self.pages for record in page]
+
+    async def fetch_pages(self, **kwargs: Any):
+        for page in self.pages:
+            self.fetched_pages += 1
+            yield page
+
+    def transform(self, raw_data: List[Dict[str, Any]]) -> list:
+        self.transformed.append(list(raw_data))
+        return list(raw_data)
+
+    def create_service(self):
+        return self.service
+
+    async def _upsert(self, records, **kwargs):
+        self.upserted.extend(records)
+        return {
+            "inserted": len(records),
+            "updated": 0,
+            "errors": self.errors,
+            "failed_ids": [],
+        }
+
+
+@pytest.fixture
+def make_ingestor(mock_client: AsyncMock, mock_session: AsyncMock):
+    """Build a PagedIngestor (or subclass) on the test's client and session."""
+
+    def make(cls=PagedIngestor, **kwargs: Any) -> PagedIngestor:
+        return cls(mock_client, mock_session, **kwargs)
+
+    return make
+
+
 # ---------------------------------------------------------------------------
 # DB result mock helpers — usable in any unit test
 # ---------------------------------------------------------------------------
@@ -48,6 +117,13 @@ def scalars_first_result(item):
     return m
 
 
+def rows_result(rows):
+    """Mock a DB result where .all() → rows (tuples)."""
+    m = MagicMock()
+    m.all.return_value = rows
+    return m
+
+
 def mappings_result(items):
     """Mock a DB result where .mappings().all() → items and .mappings().first() → items[0]."""
     mappings = MagicMock()
@@ -0,0 +1,161 @@
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+import respx
+from aiolimiter import AsyncLimiter
+
+from civic_lantern.services.api_key_pool import ApiKeyPool
+from civic_lantern.services.fec_client import FECClient
+from civic_lantern.services.fec_exceptions import (
+    FECAuthenticationError,
+    FECRateLimitError,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestApiKeyPool:
+    async def test_routes_to_key_with_most_budget(self):
+        pool = ApiKeyPool(["key-a", "key-b", "key-c"])
+        pool.observe(pool.slots[0], 200, {"X-RateLimit-Remaining": "100"})
+        pool.observe(pool.slots[1], 200, {"X-RateLimit-Remaining": "900"})
+        pool.observe(pool.slots[2], 200, {"X-RateLimit-Remaining": "400"})
+
+        slot = await pool.acquire()
+
+        assert slot.key == "key-b"
+
+    @pytest.mark.parametrize("status", [401, 403])
+    async def test_rejected_key_is_quarantined(self, status):
+        pool = ApiKeyPool(["bad-key", "good-key"])
+        pool.observe(pool.slots[0], status, {})
+
+        slot = await pool.acquire()
+
+        assert slot.key == "good-key"
+        assert pool.metrics()[pool.slots[0].label]["quarantine_reason"] == "auth"
+
+    async def test_all_keys_rejected_raises(self):
+        pool = ApiKeyPool(["key-a", "key-b"])
+        for slot in pool.slots:
+            pool.observe(slot, 403, {})
+
+        with pytest.raises(FECAuthenticationError):
+            await pool.acquire()
+
+    async def test_waits_for_throttled_key_when_all_are_throttled(self, mocker):
+        pool = ApiKeyPool(["key-a", "key-b"])
+        pool.observe(pool.slots[0], 429, {"Retry-After": "30"})
+        pool.observe(pool.slots[1], 429, {"Retry-After": "5"})
+
+        def release(seconds):
+            pool.slots[1].quarantined_until = 0.0
+
+        sleep = mocker.patch(
+            "civic_lantern.services.api_key_pool.asyncio.sleep", side_effect=release
+        )
+
+        slot = await pool.acquire()
+
+        assert slot.key == "key-b"
+        assert 0 < sleep.await_args.args[0] <= 5
+
+    async def test_no_keys_yields_single_keyless_slot(self):
+        pool = ApiKeyPool([])
+
+        slot = await pool.acquire()
+
+        assert len(pool) == 1
+        assert slot.key is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestFECClientKeyRotation:
+    @pytest_asyncio.fixture
+    async def pooled_client(self):
+        async with FECClient(api_keys=["key-a", "key-b"]) as client:
+            for slot in client.keys.slots:
+                slot.budget = AsyncLimiter(max_rate=10000, time_period=1)
+                slot.pacer = AsyncLimiter(max_rate=10000, time_period=1)
+            yield client
+
+    @respx.mock
+    async def test_throttled_key_fails_over_to_the_next(self, pooled_client):
+        def respond(request):
+            if request.url.params["api_key"] == "key-a":
+                return httpx.Response(429, headers={"Retry-After": "60"})
+            return httpx.Response(
+                200, json={"results": [{"candidate_id": "C1"}], "pagination": {}}
+            )
+
+        route = respx.get(url__startswith=pooled_client.candidate_url).mock(
+            side_effect=respond
+        )
+
+        first = await pooled_client._fetch_page(pooled_client.candidate_url, {})
+        second = await pooled_client._fetch_page(pooled_client.candidate_url, {})
+
+        assert first == second
+        assert first["results"] == [{"candidate_id": "C1"}]
+        used = [call.request.url.params["api_key"] for call in route.calls]
+        assert used == ["key-a", "key-b", "key-b"]
+
+    @respx.mock
+    async def test_rejected_key_fails_over_to_the_next(self, pooled_client):
+        def respond(request):
+            if request.url.params["api_key"] == "key-a":
+                return httpx.Response(401)
+            return httpx.Response(
+                200, json={"results": [{"candidate_id": "C1"}], "pagination": {}}
+            )
+
+        route = respx.get(url__startswith=pooled_client.candidate_url).mock(
+            side_effect=respond
+        )
+
+        result = await pooled_client._fetch_page(pooled_client.candidate_url, {})
+
+        assert result["results"] == [{"candidate_id": "C1"}]
+        used = [call.request.url.params["api_key"] for call in route.calls]
+        assert used == ["key-a", "key-b"]
+        assert pooled_client.keys.slots[0].quarantine_reason == "auth"
+
+    @respx.mock
+    @pytest.mark.parametrize(
+        "status, error", [(403, FECAuthenticationError), (429, FECRateLimitError)]
+    )
+    async def test_raises_once_every_key_is_quarantined(
+        self, pooled_client, status, error
+    ):
+        route = respx.get(url__startswith=pooled_client.candidate_url).mock(
+            return_value=httpx.Response(status)
+        )
+
+        with pytest.raises(error):
+            await pooled_client._fetch_page(pooled_client.candidate_url, {})
+
+        assert route.call_count == 2
+
+    async def test_page_window_scales_with_keys(self, pooled_client, mocker):
+        pages = {1: {"results": [{"id": 1}], "pagination": {"pages": 40}}}
+        in_flight = peak = 0
+
+        async def fetch(url, params):
+            nonlocal in_flight, peak
+            if params["page"] == 1:
+                return pages[1]
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"results": [{"id": params["page"]}]}
+
+        mocker.patch.object(pooled_client, "_fetch_page", side_effect=fetch)
+
+        records = await pooled_client._paginate(pooled_client.candidate_url, {})
+
+        assert len(records) == 40
+        assert peak == 2 * pooled_client.PAGE_WINDOW
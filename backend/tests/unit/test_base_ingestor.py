@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 from typing import Any, Dict, List
 from unittest.mock import AsyncMock
@@ -7,6 +8,8 @@ from zoneinfo import ZoneInfo
 import pytest
 
 from civic_lantern.jobs.base_ingestor import BaseIngestor
+from civic_lantern.services.data.page_dead_letter import PageDeadLetterService
+from civic_lantern.services.fec_exceptions import FECServerError
 
 
 class FakeIngestor(BaseIngestor):
@@ -115,3 +118,118 @@ class TestBaseIngestorWorkflow:
 
         with pytest.raises(Exception, match="DB gone"):
             await ingestor.run(start_date="2024-01-01", end_date="2024-06-01")
+
+
+@pytest.fixture
+def make_pipelined(make_ingestor):
+    """Small chunks and a one-slot queue so chunking and backpressure show."""
+
+    def make(**kwargs):
+        return make_ingestor(pipeline_chunk_size=2, pipeline_queue_size=1, **kwargs)
+
+    return make
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBaseIngestorPipelined:
+    """Test the pipelined fetch → transform → upsert run mode."""
+
+    async def test_transforms_and_upserts_in_chunks(self, make_pipelined):
+        """Pages are buffered into chunks of pipeline_chunk_size records."""
+        pages = [[{"id": 1}], [{"id": 2}], [{"id": 3}], [{"id": 4}], [{"id": 5}]]
+        ingestor = make_pipelined(pages=pages)
+
+        stats = await ingestor.run()
+
+        assert [len(c) for c in ingestor.transformed] == [2, 2, 1]
+        assert ingestor.service.upsert_batch.await_count == 3
+        assert stats["inserted"] == 5
+        assert stats["failed_ids"] == []
+
+    async def test_reports_per_stage_throughput(self, make_pipelined):
+        """Stats include records and busy time for each stage."""
+        ingestor = make_pipelined(pages=[[{"id": 1}, {"id": 2}]])
+
+        stats = await ingestor.run()
+
+        pipeline = stats["pipeline"]
+        assert pipeline["fetch"]["records"] == 2
+        assert pipeline["transform"]["records"] == 2
+        assert pipeline["upsert"]["records"] == 2
+        assert "records_per_sec" in pipeline["upsert"]
+        assert pipeline["wall_seconds"] >= 0
+
+    async def test_empty_stream_returns_none(self, make_pipelined):
+        """Nothing to upsert returns None, matching the sequential contract."""
+        ingestor = make_pipelined(pages=[])
+
+        assert await ingestor.run() is None
+        ingestor.service.upsert_batch.assert_not_awaited()
+
+    async def test_bounded_queue_applies_backpressure(self, make_pipelined):
+        """Fetch cannot run more than the queue size ahead of a slow upsert."""
+        ingestor = make_pipelined(pages=[[{"id": i}] for i in range(10)])
+        ingestor.pipeline_chunk_size = 1
+        lead = []
+
+        async def slow_upsert(items, **kwargs):
+            # Pages consumed so far == items upserted before this call + 1.
+            lead.append(ingestor.fetched_pages - items[0]["id"])
+            await asyncio.sleep(0)
+            return {"inserted": 1, "updated": 0, "errors": 0, "failed_ids": []}
+
+        ingestor.service.upsert_batch.side_effect = slow_upsert
+
+        await ingestor.run()
+
+        assert max(lead) <= ingestor.pipeline_queue_size + 2
+
+    async def test_upsert_error_propagates(self, make_pipelined):
+        """A failing upsert stops the run and cancels the producer."""
+        ingestor = make_pipelined(pages=[[{"id": i}] for i in range(100)])
+        ingestor.service.upsert_batch.side_effect = Exception("DB gone")
+
+        with pytest.raises(Exception, match="DB gone"):
+            await ingestor.run()
+
+        assert ingestor.fetched_pages < 100
+
+    async def test_failed_upsert_leaves_no_producer_running(self, make_pipelined):
+        """The cancelled producer must not block on the sentinel put."""
+        ingestor = make_pipelined(pages=[[{"id": i}] for i in range(100)])
+        ingestor.service.upsert_batch.side_effect = Exception("DB gone")
+
+        with pytest.raises(Exception, match="DB gone"):
+            await ingestor.run()
+
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    async def test_fetch_error_still_flushes_dead_letters(self, make_pipelined, mocker):
+        flush = mocker.patch.object(PageDeadLetterService, "flush")
+
+        async def failing_pages(**kwargs: Any):
+            yield [{"id": 1}]
+            raise FECServerError("down")
+
+        ingestor = make_pipelined(fetch_pages=failing_pages)
+
+        with pytest.raises(FECServerError):
+            await ingestor.run()
+
+        flush.assert_awaited_once()
+
+    async def test_run_kwarg_overrides_class_default(self, mock_client, mock_session):
+        """pipelined=False forces the sequential path."""
+        ingestor = FakeIngestor(
+            client=mock_client,
+            session=mock_session,
+            fetch_return=[{"id": "1"}],
+            transform_return=["validated_obj"],
+        )
+
+        stats = await ingestor.run(
+            start_date="2024-01-01", end_date="2024-06-01", pipelined=False
+        )
+
+        assert "pipeline" not in stats
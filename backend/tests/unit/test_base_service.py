@@ -0,0 +1,507 @@
+import asyncio
+from collections import OrderedDict
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert
+
+from civic_lantern.db.models.enums import OfficeTypeEnum, SupportOpposeEnum
+from civic_lantern.schemas.candidate import CandidateIn
+from civic_lantern.services.data import base
+from civic_lantern.services.data.base import _array_literal, row_hash
+from civic_lantern.services.data.candidate import CandidateService
+from civic_lantern.services.data.schedule_e_totals_by_candidate import (
+    ScheduleETotalsByCandidateService,
+)
+from civic_lantern.services.data.sync_watermark import SyncWatermarkService
+from tests.unit.conftest import rows_result, scalars_all_result
+
+
+def upsert_result(xmax_values):
+    """Mock the RETURNING xmax result of an upsert statement."""
+    m = MagicMock()
+    m.fetchall.return_value = [(x,) for x in xmax_values]
+    return m
+
+
+@pytest.fixture
+def copied_records():
+    return []
+
+
+@pytest.fixture
+def bulk_session(mock_session, copied_records):
+    """Session whose raw asyncpg connection records what COPY received."""
+
+    async def copy_records_to_table(name, *, records, columns):
+        copied_records.extend(dict(zip(columns, r)) for r in records)
+
+    driver = MagicMock()
+    driver.copy_records_to_table = AsyncMock(side_effect=copy_records_to_table)
+    raw = MagicMock(driver_connection=driver)
+    conn = MagicMock()
+    conn.get_raw_connection = AsyncMock(return_value=raw)
+    mock_session.connection = AsyncMock(return_value=conn)
+    return mock_session
+
+
+@pytest.mark.unit
+class TestToRows:
+    def test_models_become_rows_of_table_columns(self, mock_session):
+        service = CandidateService(db=mock_session)
+        record = CandidateIn(candidate_id="C001", name="A", office="H", cycles=[2024])
+
+        (row,) = service._to_rows([record])
+
+        assert row == {
+            k: v for k, v in record.model_dump().items() if k in service.columns
+        }
+        assert list(row) == [c for c in service.columns if c in row]
+
+    def test_rows_pass_through_untouched(self, mock_session):
+        rows = [{"candidate_id": "C001", "name": "A"}]
+
+        assert CandidateService(db=mock_session)._to_rows(rows) is rows
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBulkUpsert:
+    async def test_copies_rows_then_upserts_once(self, bulk_session, copied_records):
+        """Rows go through COPY; one INSERT ... SELECT reports the counts."""
+        bulk_session.execute.side_effect = [
+            rows_result([]),
+            MagicMock(),
+            upsert_result([0, 0, 7]),
+        ]
+        service = CandidateService(db=bulk_session)
+
+        stats = await service.upsert_batch(
+            [
+                CandidateIn(candidate_id="C001", name="A", office="H"),
+                CandidateIn(candidate_id="C002", name="B"),
+                CandidateIn(candidate_id="C003", name="C"),
+            ],
+            bulk=True,
+        )
+
+        assert stats["inserted"] == 2
+        assert stats["updated"] == 1
+        assert stats["errors"] == 0
+        assert stats["failed_ids"] == []
+        assert [r["candidate_id"] for r in copied_records] == ["C001", "C002", "C003"]
+        # Enums are unwrapped so COPY sees the raw code.
+        assert copied_records[0]["office"] == "H"
+        assert not isinstance(copied_records[0]["office"], OfficeTypeEnum)
+
+        create_sql = str(bulk_session.execute.call_args_list[1].args[0])
+        assert "CREATE TEMP TABLE" in create_sql
+        assert "ON COMMIT DROP" in create_sql
+        upsert_sql = str(bulk_session.execute.call_args_list[2].args[0])
+        assert "SELECT" in upsert_sql and "ON CONFLICT" in upsert_sql
+        bulk_session.commit.assert_awaited_once()
+
+    async def test_duplicate_keys_collapse_to_last(self, bulk_session, copied_records):
+        """Repeated keys would make ON CONFLICT touch a row twice; last wins."""
+        bulk_session.execute.side_effect = [
+            rows_result([]),
+            MagicMock(),
+            upsert_result([0]),
+        ]
+        service = CandidateService(db=bulk_session)
+
+        await service.bulk_upsert(
+            [
+                {"candidate_id": "C_DUP", "name": "First"},
+                {"candidate_id": "C_DUP", "name": "Second"},
+            ]
+        )
+
+        row = {"candidate_id": "C_DUP", "name": "Second"}
+        assert copied_records == [{**row, "row_hash": row_hash(row)}]
+
+    async def test_failure_falls_back_to_batched_upsert(self, bulk_session, mocker):
+        """A failed bulk load is rolled back and replayed through upsert_batch."""
+        bulk_session.connection.return_value.get_raw_connection.side_effect = (
+            RuntimeError("fk violation")
+        )
+        bulk_session.execute.return_value = rows_result([])
+        service = CandidateService(db=bulk_session)
+        mocker.patch.object(service, "_execute_upsert", return_value=(1, 0))
+
+        stats = await service.upsert_batch(
+            [{"candidate_id": "C001", "name": "A"}], bulk=True
+        )
+
+        bulk_session.rollback.assert_awaited_once()
+        assert stats["inserted"] == 1
+        assert stats["failed_ids"] == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBisectingRecovery:
+    """A failed batch is split recursively instead of retried row by row."""
+
+    @pytest.fixture
+    def service(self, mock_session):
+        mock_session.begin_nested = MagicMock(return_value=AsyncMock())
+        mock_session.execute.return_value = rows_result([])
+        return CandidateService(db=mock_session)
+
+    @staticmethod
+    def _rows(n):
+        return [{"candidate_id": f"C{i:03d}", "name": f"N{i}"} for i in range(n)]
+
+    @staticmethod
+    def _fail_on(bad_ids):
+        async def execute_upsert(rows):
+            if any(r["candidate_id"] in bad_ids for r in rows):
+                raise exc.IntegrityError("stmt", {}, Exception("fk violation"))
+            return len(rows), 0
+
+        return execute_upsert
+
+    async def test_isolates_single_bad_row(self, service, mocker):
+        mocker.patch.object(
+            service, "_execute_upsert", side_effect=self._fail_on({"C005"})
+        )
+
+        stats = await service.upsert_batch(self._rows(64))
+
+        assert stats["inserted"] == 63
+        assert stats["errors"] == 1
+        assert stats["failed_ids"] == ["C005"]
+        # One statement per level on the bad path plus its sibling: 2 * log2(64).
+        assert stats["recovery_statements"] == 12
+
+    async def test_isolates_multiple_bad_rows(self, service, mocker):
+        mocker.patch.object(
+            service, "_execute_upsert", side_effect=self._fail_on({"C001", "C006"})
+        )
+
+        stats = await service.upsert_batch(self._rows(8))
+
+        assert stats["inserted"] == 6
+        assert sorted(stats["failed_ids"]) == ["C001", "C006"]
+        assert stats["recovery_statements"] == 10
+
+    async def test_clean_batch_spends_no_recovery(self, service, mocker):
+        mocker.patch.object(service, "_execute_upsert", return_value=(4, 0))
+
+        stats = await service.upsert_batch(self._rows(4))
+
+        assert stats["recovery_statements"] == 0
+        service.db.begin_nested.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestContentHash:
+    async def test_unchanged_rows_are_not_sent(self, mock_session, mocker):
+        same = {"candidate_id": "C001", "name": "A"}
+        edited = {"candidate_id": "C002", "name": "B"}
+        mock_session.execute.return_value = rows_result(
+            [("C001", row_hash(same)), ("C002", row_hash({**edited, "name": "Old"}))]
+        )
+        service = CandidateService(db=mock_session)
+        upsert = mocker.patch.object(service, "_execute_upsert", return_value=(0, 1))
+
+        stats = await service.upsert_batch([same, edited])
+
+        assert stats["unchanged"] == 1
+        assert stats["updated"] == 1
+        (sent,) = upsert.await_args.args[0]
+        assert sent == {**edited, "row_hash": row_hash(edited)}
+        assert "row_hash" not in edited
+
+    async def test_bulk_skips_copy_when_nothing_changed(self, bulk_session):
+        row = {"candidate_id": "C001", "name": "A"}
+        bulk_session.execute.return_value = rows_result([("C001", row_hash(row))])
+
+        stats = await CandidateService(db=bulk_session).upsert_batch([row], bulk=True)
+
+        assert stats["unchanged"] == 1
+        assert stats["inserted"] == stats["updated"] == 0
+        bulk_session.execute.assert_awaited_once()
+        bulk_session.connection.assert_not_awaited()
+
+    async def test_composite_keys_match_enum_and_raw_values(self, mock_session):
+        row = {
+            "candidate_id": "P001",
+            "cycle": 2024,
+            "support_oppose_indicator": "S",
+            "total": 10,
+        }
+        mock_session.execute.return_value = rows_result(
+            [("P001", 2024, SupportOpposeEnum.SUPPORT, row_hash(row))]
+        )
+        service = ScheduleETotalsByCandidateService(db=mock_session)
+
+        rows, unchanged = await service._skip_unchanged([row])
+
+        assert (rows, unchanged) == ([], 1)
+        sql = str(mock_session.execute.await_args.args[0])
+        assert "(schedule_e_totals_by_candidate.candidate_id, " in sql
+
+    async def test_tables_without_hash_skip_the_lookup(self, mock_session):
+        rows = [{"entity": "candidates", "field": "last_file_date"}]
+        service = SyncWatermarkService(db=mock_session)
+
+        assert await service._skip_unchanged(rows) == (rows, 0)
+        mock_session.execute.assert_not_awaited()
+
+    async def test_conflict_guard_compares_only_the_hash(self, mock_session):
+        service = CandidateService(db=mock_session)
+        stmt = insert(service.model).values(
+            [{"candidate_id": "C001", "name": "A", "row_hash": b"x"}]
+        )
+
+        sql = str(
+            service._on_conflict_update(
+                stmt, ["candidate_id", "name", "row_hash"]
+            ).compile(dialect=postgresql.dialect())
+        )
+
+        where = sql.split("WHERE")[1]
+        assert "candidates.row_hash IS DISTINCT FROM excluded.row_hash" in where
+        assert "name" not in where
+
+    async def test_hash_covers_column_names_and_values(self):
+        row = {"candidate_id": "C001", "name": "A", "office": OfficeTypeEnum.HOUSE}
+
+        assert row_hash(row) == row_hash(dict(row))
+        assert row_hash(row) == row_hash({**row, "row_hash": b"stale"})
+        assert row_hash(row) != row_hash({**row, "name": "B"})
+        assert row_hash(row) != row_hash({"candidate_id": "C001", "name": "A"})
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestShardedUpsert:
+    @pytest.fixture
+    def sessions(self):
+        return []
+
+    @pytest.fixture
+    def service(self, mock_session, sessions, mocker):
+        def session_factory():
+            session = AsyncMock()
+            session.execute.return_value = rows_result([])
+            sessions.append(session)
+            context = AsyncMock()
+            context.__aenter__.return_value = session
+            return context
+
+        service = CandidateService(db=mock_session)
+        mocker.patch.object(service, "_session_factory", return_value=session_factory)
+        return service
+
+    @pytest.fixture
+    def written(self, mocker):
+        """(session, rows) for every upsert statement, across shard copies."""
+        calls = []
+
+        async def execute_upsert(self, rows):
+            calls.append((self.db, [row["candidate_id"] for row in rows]))
+            return len(rows), 0
+
+        mocker.patch.object(
+            CandidateService,
+            "_execute_upsert",
+            autospec=True,
+            side_effect=execute_upsert,
+        )
+        return calls
+
+    async def test_shards_by_key_and_sorts_each_shard(self, service, sessions, written):
+        rows = [{"candidate_id": f"C{i:03d}", "name": "N"} for i in range(30, 0, -1)]
+
+        stats = await service.upsert_batch(rows, batch_size=4, workers=3)
+
+        assert stats["inserted"] == 30
+        assert stats["failed_ids"] == []
+        assert 1 < len(sessions) <= 3
+        by_session = {}
+        for session, ids in written:
+            by_session.setdefault(id(session), []).extend(ids)
+        assert sorted(i for ids in by_session.values() for i in ids) == sorted(
+            row["candidate_id"] for row in rows
+        )
+        for ids in by_session.values():
+            assert ids == sorted(ids)
+        for session in sessions:
+            session.commit.assert_awaited()
+        service.db.execute.assert_not_awaited()
+
+    async def test_null_keys_sort_last(self, service, written):
+        rows = [{"candidate_id": None, "name": "N"}]
+        rows += [{"candidate_id": f"C{i:02d}", "name": "N"} for i in range(20, 0, -1)]
+
+        stats = await service.upsert_batch(rows, batch_size=2, workers=2)
+
+        assert stats["inserted"] == 21
+        by_session = {}
+        for session, ids in written:
+            by_session.setdefault(id(session), []).extend(ids)
+        (with_null,) = [ids for ids in by_session.values() if None in ids]
+        assert with_null[-1] is None
+        assert with_null[:-1] == sorted(with_null[:-1])
+
+    async def test_duplicate_keys_collapse_to_last(self, service, written):
+        rows = [{"candidate_id": f"C{i}", "name": "N"} for i in range(4)]
+        rows.append({"candidate_id": "C0", "name": "Latest"})
+
+        stats = await service.upsert_batch(rows, batch_size=2, workers=2)
+
+        assert stats["inserted"] == 4
+        assert sorted(i for _, ids in written for i in ids) == ["C0", "C1", "C2", "C3"]
+
+    async def test_failing_shard_cancels_the_others(self, service, sessions, mocker):
+        blocked = asyncio.Event()
+
+        async def execute_upsert(self, rows):
+            if len(sessions) < 2:
+                await blocked.wait()
+            raise ConnectionResetError("connection lost")
+
+        mocker.patch.object(
+            CandidateService,
+            "_execute_upsert",
+            autospec=True,
+            side_effect=execute_upsert,
+        )
+        rows = [{"candidate_id": f"C{i:03d}", "name": "N"} for i in range(30)]
+
+        with pytest.raises(ConnectionResetError):
+            await service.upsert_batch(rows, batch_size=4, workers=2)
+
+        assert len(sessions) == 2
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+        for session in sessions:
+            session.commit.assert_not_awaited()
+
+    async def test_single_batch_stays_on_own_session(self, service, written):
+        service.db.execute.return_value = rows_result([])
+
+        await service.upsert_batch([{"candidate_id": "C1", "name": "N"}], workers=4)
+
+        service._session_factory.assert_not_called()
+        assert written[0][0] is service.db
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestUnnestUpsert:
+    @staticmethod
+    def _sql(session):
+        stmt, params = session.execute.await_args.args
+        return str(stmt.compile(dialect=postgresql.asyncpg.dialect())), params
+
+    async def test_one_array_per_column_whatever_the_batch_size(self, mock_session):
+        mock_session.execute.return_value = upsert_result([0, 0, 7])
+        service = CandidateService(db=mock_session)
+        rows = [
+            {"candidate_id": f"C{i}", "name": "N", "first_file_date": None}
+            for i in range(3)
+        ]
+
+        assert await service._execute_upsert(rows) == (2, 1)
+        sql, params = self._sql(mock_session)
+        await service._execute_upsert(rows[:1])
+        sql_one, params_one = self._sql(mock_session)
+
+        assert sql == sql_one
+        assert "unnest($1::VARCHAR[], $2::VARCHAR[], $3::DATE[])" in sql
+        assert "ON CONFLICT (candidate_id) DO UPDATE" in sql
+        assert params == {
+            "candidate_id_values": ["C0", "C1", "C2"],
+            "name_values": ["N", "N", "N"],
+            "first_file_date_values": [None, None, None],
+        }
+        assert params_one["candidate_id_values"] == ["C0"]
+
+    async def test_statement_is_built_once_per_column_set(self, mock_session):
+        service = CandidateService(db=mock_session)
+        other = CandidateService(db=AsyncMock())
+
+        stmt, _ = service._unnest_upsert(("candidate_id", "name"))
+
+        assert other._unnest_upsert(("candidate_id", "name"))[0] is stmt
+        assert service._unnest_upsert(("candidate_id",))[0] is not stmt
+
+    async def test_statement_cache_drops_least_recently_used(
+        self, mock_session, mocker
+    ):
+        mocker.patch.object(base, "UNNEST_UPSERT_CACHE_SIZE", 2)
+        mocker.patch.object(base, "_UNNEST_UPSERTS", OrderedDict())
+        service = CandidateService(db=mock_session)
+
+        first, _ = service._unnest_upsert(("candidate_id", "name"))
+        service._unnest_upsert(("candidate_id", "office"))
+        service._unnest_upsert(("candidate_id", "name"))
+        service._unnest_upsert(("candidate_id", "state"))
+
+        assert len(base._UNNEST_UPSERTS) == 2
+        assert service._unnest_upsert(("candidate_id", "name"))[0] is first
+        assert [key[2] for key in base._UNNEST_UPSERTS] == [
+            ("candidate_id", "state"),
+            ("candidate_id", "name"),
+        ]
+
+    async def test_arrays_and_enums_are_sent_as_text(self, mock_session):
+        mock_session.execute.return_value = upsert_result([0])
+        service = CandidateService(db=mock_session)
+        row = {
+            "candidate_id": "C1",
+            "office": OfficeTypeEnum.HOUSE,
+            "cycles": [2022, None, 2024],
+            "election_years": None,
+        }
+
+        await service._execute_upsert([row])
+        sql, params = self._sql(mock_session)
+
+        assert "CAST(batch.office AS office_enum)" in sql
+        assert "CAST(batch.cycles AS INTEGER[])" in sql
+        assert params["office_values"] == ["H"]
+        assert params["cycles_values"] == ['{"2022",NULL,"2024"}']
+        assert params["election_years_values"] == [None]
+
+    async def test_array_literal_escapes_quotes_and_backslashes(self):
+        assert _array_literal(['say "hi"', "C:\\x", ""]) == (
+            '{"say \\"hi\\"","C:\\\\x",""}'
+        )
+
+    async def test_values_statement_when_disabled(self, mock_session, mocker):
+        mock_session.execute.return_value = upsert_result([0])
+        service = CandidateService(db=mock_session)
+        mocker.patch.object(service, "unnest_upserts", False)
+
+        await service._execute_upsert([{"candidate_id": "C1", "name": "N"}])
+
+        stmt, params = mock_session.execute.await_args.args
+        assert "VALUES" in str(stmt.compile(dialect=postgresql.dialect()))
+        assert params is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGetExistingIds:
+    async def test_returns_ids_present_in_one_query(self, mock_session):
+        mock_session.execute.return_value = scalars_all_result(["C001"])
+        service = CandidateService(db=mock_session)
+
+        result = await service.get_existing_ids({"C001", "C002"})
+
+        assert result == {"C001"}
+        mock_session.execute.assert_awaited_once()
+        assert "IN" in str(mock_session.execute.call_args.args[0])
+
+    async def test_empty_input_skips_query(self, mock_session):
+        service = CandidateService(db=mock_session)
+
+        assert await service.get_existing_ids([]) == set()
+        mock_session.execute.assert_not_awaited()
@@ -21,6 +21,7 @@ class TestCandidateIngestor:
         )
 
         mock_client.get_candidates.assert_awaited_once_with(
+            dead_letters=None,
             min_first_file_date="2024-01-01",
             max_first_file_date="2024-06-01",
             election_year=2024,
@@ -38,7 +39,9 @@ class TestCandidateIngestor:
         ingestor = CandidateIngestor(client=mock_client, session=mock_session)
         result = ingestor.transform(raw)
 
-        mock_transform.assert_called_once_with(raw)
+        mock_transform.assert_called_once_with(
+            raw, columns=ingestor.create_service().columns
+        )
         assert result == ["validated"]
 
     async def test_create_service_returns_candidate_service(self, mock_client, mock_session):
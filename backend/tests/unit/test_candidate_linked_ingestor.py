@@ -0,0 +1,107 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from civic_lantern.jobs.ingestors.inside_totals_by_candidate import (
+    InsideTotalsByCandidateIngestor,
+)
+from civic_lantern.schemas.inside_totals_by_candidate import InsideTotalsByCandidateIn
+
+
+def _rows(*candidate_ids):
+    return [
+        InsideTotalsByCandidateIn(candidate_id=cid, cycle=2024, receipts=1.0)
+        for cid in candidate_ids
+    ]
+
+
+@pytest.fixture
+def candidate_service():
+    service = AsyncMock()
+    service.upsert_batch.return_value = {
+        "inserted": 1,
+        "updated": 0,
+        "errors": 0,
+        "failed_ids": [],
+    }
+    with patch(
+        "civic_lantern.jobs.candidate_linked_ingestor.CandidateService",
+        return_value=service,
+    ):
+        yield service
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCandidateFKPreflight:
+    """Test pre-flight candidate FK resolution for spending ingestors."""
+
+    async def test_all_known_candidates_pass_through(
+        self, mock_client, mock_session, candidate_service
+    ):
+        """One existence query; nothing fetched when every candidate exists."""
+        candidate_service.get_existing_ids.return_value = {"P001", "P002"}
+        ingestor = InsideTotalsByCandidateIngestor(mock_client, mock_session)
+        rows = _rows("P001", "P002")
+
+        result = await ingestor.before_upsert(rows)
+
+        assert result == rows
+        candidate_service.get_existing_ids.assert_awaited_once_with({"P001", "P002"})
+        mock_client.get_candidates_by_ids.assert_not_awaited()
+
+    async def test_backfill_inserts_missing_candidates_first(
+        self, mock_client, mock_session, candidate_service
+    ):
+        """Missing candidates are looked up by ID and upserted; rows are kept."""
+        candidate_service.get_existing_ids.return_value = {"P001"}
+        mock_client.get_candidates_by_ids.return_value = [
+            {"candidate_id": "P002", "name": "DOE, JANE"}
+        ]
+        ingestor = InsideTotalsByCandidateIngestor(mock_client, mock_session)
+        rows = _rows("P001", "P002")
+
+        result = await ingestor.before_upsert(rows)
+
+        mock_client.get_candidates_by_ids.assert_awaited_once_with(["P002"])
+        upserted = candidate_service.upsert_batch.call_args.args[0]
+        assert [c.candidate_id for c in upserted] == ["P002"]
+        assert result == rows
+
+    async def test_backfill_drops_rows_fec_cannot_resolve(
+        self, mock_client, mock_session, candidate_service
+    ):
+        """IDs the FEC lookup doesn't return are dropped rather than failing."""
+        candidate_service.get_existing_ids.return_value = set()
+        mock_client.get_candidates_by_ids.return_value = []
+        ingestor = InsideTotalsByCandidateIngestor(mock_client, mock_session)
+
+        result = await ingestor.before_upsert(_rows("P404"))
+
+        assert result == []
+        candidate_service.upsert_batch.assert_not_awaited()
+
+    async def test_drop_policy_skips_lookup(
+        self, mock_client, mock_session, candidate_service
+    ):
+        """With the drop policy, rows for unknown candidates are discarded."""
+        candidate_service.get_existing_ids.return_value = {"P001"}
+        ingestor = InsideTotalsByCandidateIngestor(mock_client, mock_session)
+        ingestor.missing_candidate_policy = "drop"
+
+        result = await ingestor.before_upsert(_rows("P001", "P002", "P002"))
+
+        assert [r.candidate_id for r in result] == ["P001"]
+        mock_client.get_candidates_by_ids.assert_not_awaited()
+
+    async def test_run_kwarg_overrides_policy(self, mock_client, mock_session):
+        """run(missing_candidates=...) sets the policy and is not sent to fetch()."""
+        mock_client.get_candidate_totals.return_value = []
+        ingestor = InsideTotalsByCandidateIngestor(mock_client, mock_session)
+
+        await ingestor.run(cycle=2024, missing_candidates="drop")
+
+        assert ingestor.missing_candidate_policy == "drop"
+        mock_client.get_candidate_totals.assert_awaited_once_with(
+            cycle=2024, dead_letters=ingestor.dead_letters
+        )
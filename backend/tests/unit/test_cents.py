@@ -0,0 +1,44 @@
+from decimal import Decimal
+
+import pytest
+
+from civic_lantern.utils.cents import from_cents, sum_cents_by_key, to_cents
+
+
+@pytest.mark.unit
+class TestCents:
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (None, 0),
+            ("", 0),
+            (0.29, 29),
+            (-12.34, -1234),
+            (5, 500),
+            ("1234.56", 123456),
+            (Decimal("0.005"), 1),
+            (99999999999.99, 9999999999999),
+        ],
+    )
+    def test_to_cents(self, value, expected):
+        assert to_cents(value) == expected
+
+    def test_from_cents_keeps_two_places(self):
+        assert str(from_cents(15000)) == "150.00"
+        assert str(from_cents(-5)) == "-0.05"
+
+    def test_sums_dispatch_on_value_type(self):
+        _, totals = sum_cents_by_key(
+            ["a"] * 5, {"x": [1.1, None, "2.20", Decimal("3.3"), 4]}
+        )
+
+        assert totals["x"] == [Decimal("10.60")]
+
+    def test_groups_in_first_seen_order(self):
+        keys, totals = sum_cents_by_key(
+            ["b", "a", "b"], {"x": [0.1, 1.0, 0.2], "y": [None, None, 3]}
+        )
+
+        assert keys == ["b", "a"]
+        assert totals["x"] == [Decimal("0.30"), Decimal("1.00")]
+        assert [str(total) for total in totals["y"]] == ["3.00", "0.00"]
@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -19,6 +19,7 @@ class TestCommitteeIngestor:
         result = await ingestor.fetch("2024-01-01", "2024-06-01", committee_type="O")
 
         mock_client.get_committees.assert_awaited_once_with(
+            dead_letters=None,
             min_first_file_date="2024-01-01",
             max_first_file_date="2024-06-01",
             committee_type="O",
@@ -32,7 +33,31 @@ class TestCommitteeIngestor:
         ingestor = CommitteeIngestor(client=mock_client, session=mock_session)
         await ingestor.fetch()
 
-        mock_client.get_committees.assert_awaited_once_with()
+        mock_client.get_committees.assert_awaited_once_with(dead_letters=None)
+
+    async def test_fetch_pages_streams_iter_committees(
+        self, mock_client, mock_session
+    ):
+        """fetch_pages() streams client.iter_committees with the same params."""
+
+        async def pages(**kwargs):
+            yield [{"committee_id": "C001"}]
+            yield [{"committee_id": "C002"}]
+
+        mock_client.iter_committees = MagicMock(side_effect=pages)
+
+        ingestor = CommitteeIngestor(client=mock_client, session=mock_session)
+        result = [
+            page async for page in ingestor.fetch_pages("2024-01-01", "2024-06-01")
+        ]
+
+        mock_client.iter_committees.assert_called_once_with(
+            checkpoints=None,
+            dead_letters=None,
+            min_first_file_date="2024-01-01",
+            max_first_file_date="2024-06-01",
+        )
+        assert result == [[{"committee_id": "C001"}], [{"committee_id": "C002"}]]
 
     @patch(
         "civic_lantern.jobs.ingestors.committees.transform_committees", autospec=True
@@ -47,7 +72,9 @@ class TestCommitteeIngestor:
         ingestor = CommitteeIngestor(client=mock_client, session=mock_session)
         result = ingestor.transform(raw)
 
-        mock_transform.assert_called_once_with(raw)
+        mock_transform.assert_called_once_with(
+            raw, columns=ingestor.create_service().columns
+        )
         assert result == ["validated"]
 
     async def test_create_service_returns_committee_service(
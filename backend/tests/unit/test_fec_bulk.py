@@ -0,0 +1,195 @@
+import zipfile
+from typing import Any, Dict, List
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert
+
+from civic_lantern.jobs.bulk_loader import BulkFileLoader
+from civic_lantern.services import fec_bulk
+from civic_lantern.services.data.candidate import CandidateService
+from civic_lantern.services.data.committee import CommitteeService
+from tests.unit.conftest import rows_result
+
+
+def _write_zip(directory, name, lines):
+    path = directory / name
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(name.replace(".zip", ".txt"), "\n".join(lines) + "\n")
+    return path
+
+
+CN22 = [
+    "H2CA01001|SMITH, JANE|DEM|2022|CA|H|1|C|C|C00000001|1 MAIN ST|"
+    "|SACRAMENTO|CA|95814",
+]
+CN24 = [
+    "H2CA01001|SMITH, JANE|IND|2024|CA|H|1|I|C|C00000001|1 MAIN ST|"
+    "|SACRAMENTO|CA|95814",
+    "S4TX00002|DOE, JOHN JR|REP|2024|TX|S||O|N||||AUSTIN|TX|73301",
+    "BROKEN|LINE",
+]
+CM24 = [
+    "C00000001|SMITH FOR CONGRESS|ROE, RAY|1 MAIN ST||SACRAMENTO|CA|95814|P|H|DEM|Q|"
+    "|NONE|H2CA01001",
+    "C00000002|FRIENDS PAC|LEE, AL|||DALLAS|TX|75201|U|Q||M|C|ACME CORP|",
+]
+CCL24 = ["S4TX00002|2024|2024|C00000002|Q|U|1"]
+
+
+@pytest.mark.unit
+class TestBulkFileParsing:
+    def test_cycle_from_filename(self):
+        assert fec_bulk.cycle_from_filename("cn24.zip") == 2024
+        assert fec_bulk.cycle_from_filename("/data/CM98.zip") == 1998
+        with pytest.raises(ValueError):
+            fec_bulk.cycle_from_filename("indiv24.zip")
+
+    def test_find_bulk_files_orders_by_cycle(self, tmp_path):
+        for name in ("cn24.zip", "cn98.zip", "cn02.zip", "cm24.zip"):
+            _write_zip(tmp_path, name, [])
+
+        files = fec_bulk.find_bulk_files(tmp_path, "cn")
+
+        assert [path.name for path in files] == ["cn98.zip", "cn02.zip", "cn24.zip"]
+
+    def test_iter_candidates_maps_columns_and_skips_bad_rows(self, tmp_path):
+        path = _write_zip(tmp_path, "cn24.zip", CN24)
+
+        records = list(fec_bulk.iter_candidates(path))
+
+        assert len(records) == 2
+        assert records[1] == {
+            "candidate_id": "S4TX00002",
+            "name": "DOE, JOHN JR",
+            "party": "REP",
+            "office": "S",
+            "state": "TX",
+            "district": None,
+            "incumbent_challenge": "O",
+            "candidate_status": "N",
+            "election_years": [2024],
+            "cycles": [2024],
+        }
+
+    def test_iter_committees_maps_columns(self, tmp_path):
+        path = _write_zip(tmp_path, "cm24.zip", CM24)
+
+        first, second = fec_bulk.iter_committees(path)
+
+        assert first["candidate_ids"] == ["H2CA01001"]
+        assert first["committee_type"] == "H"
+        assert second["affiliated_committee_name"] == "ACME CORP"
+        assert second["candidate_ids"] == []
+
+
+@pytest.fixture
+def stored_lists(mock_session):
+    """Rows already in the table, as (id, *list fields) tuples; none by default."""
+    mock_session.execute.return_value = rows_result([])
+    return mock_session.execute
+
+
+@pytest.fixture
+def upserted(mocker, stored_lists):
+    """Capture the rows each service is asked to bulk upsert."""
+    calls: Dict[str, List[Dict[str, Any]]] = {}
+
+    def capture(name):
+        async def upsert(self, rows, **kwargs):
+            assert kwargs == {"bulk": True, "workers": 1}
+            calls.setdefault(name, []).extend(rows)
+            return {"inserted": len(rows), "updated": 0, "errors": 0}
+
+        return upsert
+
+    mocker.patch.object(CandidateService, "upsert_batch", capture("candidates"))
+    mocker.patch.object(CommitteeService, "upsert_batch", capture("committees"))
+    return calls
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestBulkFileLoader:
+    async def test_candidates_merge_cycles_newest_file_wins(
+        self, tmp_path, mock_session, upserted
+    ):
+        _write_zip(tmp_path, "cn22.zip", CN22)
+        _write_zip(tmp_path, "cn24.zip", CN24)
+
+        stats = await BulkFileLoader(mock_session).load(tmp_path, ["candidates"])
+
+        assert stats["candidates"]["inserted"] == 2
+        smith = next(
+            row for row in upserted["candidates"] if row["candidate_id"] == "H2CA01001"
+        )
+        assert smith["cycles"] == [2022, 2024]
+        assert smith["election_years"] == [2022, 2024]
+        assert smith["party"] == "IND"
+        assert smith["name"] == "Jane Smith"
+        assert smith["district"] == "01"
+        # Columns the bulk file lacks are not written.
+        assert "first_file_date" not in smith
+
+    async def test_api_only_columns_survive_on_conflict(
+        self, tmp_path, mock_session, upserted
+    ):
+        _write_zip(tmp_path, "cn24.zip", CN24)
+
+        await BulkFileLoader(mock_session).load(tmp_path, ["candidates"])
+
+        row = upserted["candidates"][0]
+        service = CandidateService(db=mock_session)
+        stmt = service._on_conflict_update(insert(service.model).values([row]), row)
+        set_clause = str(stmt.compile(dialect=postgresql.dialect())).split("SET")[1]
+        assert "party = excluded.party" in set_clause
+        assert "party_full" not in set_clause
+        assert "last_file_date" not in set_clause
+
+    async def test_list_fields_union_with_stored_rows(
+        self, tmp_path, mock_session, upserted, stored_lists
+    ):
+        _write_zip(tmp_path, "cn24.zip", CN24)
+        stored_lists.return_value = rows_result([("H2CA01001", [2020, 2022], None)])
+
+        await BulkFileLoader(mock_session).load(tmp_path, ["candidates"])
+
+        by_id = {row["candidate_id"]: row for row in upserted["candidates"]}
+        assert by_id["H2CA01001"]["cycles"] == [2020, 2022, 2024]
+        assert by_id["H2CA01001"]["election_years"] == [2024]
+        assert by_id["S4TX00002"]["cycles"] == [2024]
+
+    async def test_committees_pick_up_linkages(self, tmp_path, mock_session, upserted):
+        _write_zip(tmp_path, "cm24.zip", CM24)
+        _write_zip(tmp_path, "ccl24.zip", CCL24)
+
+        await BulkFileLoader(mock_session).load(tmp_path, ["committees"])
+
+        by_id = {row["committee_id"]: row for row in upserted["committees"]}
+        assert by_id["C00000002"]["candidate_ids"] == ["S4TX00002"]
+        assert by_id["C00000001"]["affiliated_committee_name"] is None
+        assert set(by_id["C00000001"]) == set(by_id["C00000002"])
+
+    async def test_chunks_bulk_upserts(
+        self, tmp_path, mock_session, mocker, stored_lists
+    ):
+        _write_zip(tmp_path, "cn24.zip", CN24)
+        upsert = mocker.patch.object(
+            CandidateService,
+            "upsert_batch",
+            return_value={"inserted": 1, "updated": 0, "errors": 0},
+        )
+        loader = BulkFileLoader(mock_session)
+        loader.chunk_size = 1
+
+        stats = await loader.load_candidates(tmp_path)
+
+        assert upsert.await_count == 2
+        assert stats["inserted"] == 2
+
+    async def test_no_files_returns_none(self, tmp_path, mock_session):
+        assert await BulkFileLoader(mock_session).load_candidates(tmp_path) is None
+
+    async def test_rejects_unknown_entities(self, tmp_path, mock_session):
+        with pytest.raises(ValueError, match="Unknown bulk entities"):
+            await BulkFileLoader(mock_session).load(tmp_path, ["totals"])
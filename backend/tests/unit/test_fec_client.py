@@ -1,10 +1,15 @@
 import asyncio
+from datetime import date
 from unittest.mock import ANY, AsyncMock, Mock
 
 import httpx
 import pytest
 import respx
 
+from civic_lantern.services.data.page_dead_letter import PageDeadLetterService
+from civic_lantern.services.data.pagination_checkpoint import (
+    PaginationCheckpointService,
+)
 from civic_lantern.services.fec_exceptions import (
     FECNetworkError,
     FECNotFoundError,
@@ -145,8 +150,8 @@ class TestFECClientRateLimiting:
         )
         mock_hourly = AsyncMock()
         mock_minute = AsyncMock()
-        client.limiter = mock_hourly
-        client.minute_limiter = mock_minute
+        client.keys.slots[0].budget = mock_hourly
+        client.keys.slots[0].pacer = mock_minute
 
         await client.get_candidates(election_year=2024)
 
@@ -159,27 +164,13 @@ class TestFECClientRateLimiting:
 class TestFECClientPagination:
     """Test parallel pagination and concurrency control."""
 
-    async def test_safe_fetch_page_respects_semaphore(self, client, mocker):
-        """Ensure the worker actually uses the provided semaphore."""
-        sem = asyncio.Semaphore(1)
-        mock_fetch = mocker.patch.object(client, "_fetch_page", autospec=True)
-        mock_fetch.return_value = {"results": []}
-
-        spy_acquire = mocker.spy(sem, "acquire")
-
-        await client._safe_fetch_page("http://test", {}, 1, sem)
-
-        assert spy_acquire.called
-        mock_fetch.assert_awaited_once()
-
     async def test_safe_fetch_page_captures_exception(self, client, mocker):
         """Worker should return an Exception object instead of raising it."""
-        sem = asyncio.Semaphore(5)
         mocker.patch.object(
             client, "_fetch_page", side_effect=FECServerError("Boom"), autospec=True
         )
 
-        result = await client._safe_fetch_page("http://test", {}, 1, sem)
+        result = await client._safe_fetch_page("http://test", {}, 1)
 
         assert isinstance(result, FECServerError)
         assert str(result) == "Boom"
@@ -201,8 +192,8 @@ class TestFECClientPagination:
         assert mock_fetch.call_count == 1
         assert mock_safe_fetch.call_count == 2
 
-        mock_safe_fetch.assert_any_call(ANY, ANY, 2, ANY)
-        mock_safe_fetch.assert_any_call(ANY, ANY, 3, ANY)
+        mock_safe_fetch.assert_any_call(ANY, ANY, 2)
+        mock_safe_fetch.assert_any_call(ANY, ANY, 3)
 
     async def test_paginate_aggregates_successful_pages_only(self, client, mocker):
         """Orchestrator gracefully handles workers that return Exception objects."""
@@ -212,7 +203,7 @@ class TestFECClientPagination:
             return_value={"results": [{"id": 1}], "pagination": {"pages": 3}},
         )
 
-        async def mock_safe_fetch(url, params, page, sem):
+        async def mock_safe_fetch(url, params, page):
             if page == 2:
                 return FECServerError("Fail", status_code=500, response=mocker.Mock())
             return {"results": [{"id": 3}]}
@@ -256,3 +247,332 @@ class TestFECClientPagination:
 
         assert results == []
         spy_safe.assert_not_called()
+
+    async def test_iter_pages_yields_pages_in_order(self, client, mocker):
+        """Each page is yielded separately, in page order."""
+        mocker.patch.object(
+            client,
+            "_fetch_page",
+            return_value={"results": [{"id": 1}], "pagination": {"pages": 3}},
+        )
+
+        async def mock_safe_fetch(url, params, page):
+            return {"results": [{"id": page}]}
+
+        mocker.patch.object(client, "_safe_fetch_page", side_effect=mock_safe_fetch)
+
+        pages = [page async for page in client.iter_pages("http://test", {})]
+
+        assert pages == [[{"id": 1}], [{"id": 2}], [{"id": 3}]]
+
+    async def test_iter_pages_bounds_in_flight_requests(self, client, mocker):
+        """No more than `window` page tasks are in flight at any time."""
+        mocker.patch.object(
+            client,
+            "_fetch_page",
+            return_value={"results": [{"id": 1}], "pagination": {"pages": 20}},
+        )
+        in_flight = 0
+        peak = 0
+
+        async def mock_safe_fetch(url, params, page):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"results": [{"id": page}]}
+
+        mocker.patch.object(client, "_safe_fetch_page", side_effect=mock_safe_fetch)
+
+        records = [r async for r in client.iter_records("http://test", {}, window=3)]
+
+        assert len(records) == 20
+        assert 1 < peak <= 3
+
+    async def test_iter_pages_early_exit_cancels_pending(self, client, mocker):
+        """Closing the generator early cancels the remaining page tasks."""
+        mocker.patch.object(
+            client,
+            "_fetch_page",
+            return_value={"results": [{"id": 1}], "pagination": {"pages": 50}},
+        )
+        fetched = []
+
+        async def mock_safe_fetch(url, params, page):
+            fetched.append(page)
+            await asyncio.sleep(0)
+            return {"results": [{"id": page}]}
+
+        mocker.patch.object(client, "_safe_fetch_page", side_effect=mock_safe_fetch)
+
+        pages = client.iter_pages("http://test", {}, window=2)
+        async for page in pages:
+            if page[0]["id"] == 2:
+                break
+        await pages.aclose()
+        await asyncio.sleep(0)
+
+        assert max(fetched) < 50
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestFECClientCandidateLookup:
+    @respx.mock
+    async def test_get_candidates_by_ids_batches_ids(self, client):
+        """IDs are split into batches, each sent as a repeated candidate_id param."""
+        route = respx.get(url__startswith=client.candidate_url).mock(
+            side_effect=lambda request: httpx.Response(
+                200,
+                json={
+                    "results": [
+                        {"candidate_id": cid}
+                        for cid in request.url.params.get_list("candidate_id")
+                    ],
+                    "pagination": {"pages": 1},
+                },
+            )
+        )
+
+        ids = [f"H{i:03d}" for i in range(5)]
+        results = await client.get_candidates_by_ids(ids, batch_size=2)
+
+        assert len(route.calls) == 3
+        assert sorted(r["candidate_id"] for r in results) == ids
+
+
+def _keyset_page(ids, cursor):
+    return {
+        "results": [{"id": i} for i in ids],
+        "pagination": {"pages": 99, "last_indexes": cursor},
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestFECClientKeysetPagination:
+    """Test cursor (last_indexes) pagination and range splitting."""
+
+    async def test_follows_last_indexes_until_exhausted(self, client, mocker):
+        cursor = {"last_index": "2", "last_expenditure_date": "2024-01-02"}
+        fetch = mocker.patch.object(
+            client,
+            "_fetch_page",
+            side_effect=[_keyset_page([1, 2], cursor), _keyset_page([3], None)],
+        )
+
+        pages = [
+            page
+            async for page in client.iter_keyset_pages("http://test", {"per_page": 2})
+        ]
+
+        assert pages == [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+        assert fetch.await_args_list[1].args[1] == {"per_page": 2, **cursor}
+
+    async def test_paginate_switches_to_keyset_when_offered(self, client, mocker):
+        """A last_indexes cursor on page 1 replaces page-number requests."""
+        fetch = mocker.patch.object(
+            client,
+            "_fetch_page",
+            side_effect=[
+                _keyset_page([1], {"last_index": "1"}),
+                _keyset_page([2], {"last_index": "2"}),
+                _keyset_page([], None),
+            ],
+        )
+
+        records = await client._paginate("http://test", {})
+
+        assert [r["id"] for r in records] == [1, 2]
+        assert fetch.await_count == 3
+        assert all("page" not in call.args[1] for call in fetch.await_args_list[1:])
+
+    async def test_ranges_are_fetched_concurrently_and_merged(self, client, mocker):
+        in_flight = peak = 0
+
+        async def fetch(url, params):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if "last_index" in params:
+                return _keyset_page([], None)
+            return _keyset_page([params["min_date"]], {"last_index": "x"})
+
+        mocker.patch.object(client, "_fetch_page", side_effect=fetch)
+        ranges = client.split_date_range(date(2024, 1, 1), date(2024, 1, 3), 3)
+
+        pages = [
+            page async for page in client.iter_keyset_ranges("http://test", {}, ranges)
+        ]
+
+        assert sorted(p[0]["id"] for p in pages) == [
+            "2024-01-01",
+            "2024-01-02",
+            "2024-01-03",
+        ]
+        assert peak == 3
+
+    async def test_failed_range_does_not_stop_others(self, client, mocker):
+        async def fetch(url, params):
+            if params["min_date"] == "2024-01-01":
+                raise FECServerError("boom")
+            return _keyset_page([params["min_date"]], None)
+
+        mocker.patch.object(client, "_fetch_page", side_effect=fetch)
+        ranges = client.split_date_range(date(2024, 1, 1), date(2024, 1, 2), 2)
+
+        pages = [
+            page async for page in client.iter_keyset_ranges("http://test", {}, ranges)
+        ]
+
+        assert pages == [[{"id": "2024-01-02"}]]
+
+    async def test_failed_range_is_dead_lettered(self, client, mocker, mock_session):
+        async def fetch(url, params):
+            if params["min_date"] == "2024-01-01":
+                raise FECServerError("boom")
+            return _keyset_page([params["min_date"]], None)
+
+        mocker.patch.object(client, "_fetch_page", side_effect=fetch)
+        dead_letters = PageDeadLetterService(db=mock_session, entity="schedule_e")
+        record = mocker.spy(dead_letters, "record")
+        ranges = client.split_date_range(date(2024, 1, 1), date(2024, 1, 2), 2)
+
+        await client._collect(
+            client.iter_keyset_ranges(
+                "http://test", {}, ranges, dead_letters=dead_letters
+            )
+        )
+
+        record.assert_called_once()
+        _, params, page, _ = record.call_args.args
+        assert params == {"min_date": "2024-01-01", "max_date": "2024-01-01"}
+        assert page == 1
+
+    async def test_split_date_range_covers_range_without_overlap(self, client):
+        windows = client.split_date_range(date(2024, 1, 1), date(2024, 1, 10), 3)
+
+        assert windows == [
+            {"min_date": "2024-01-01", "max_date": "2024-01-04"},
+            {"min_date": "2024-01-05", "max_date": "2024-01-07"},
+            {"min_date": "2024-01-08", "max_date": "2024-01-10"},
+        ]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestFECClientPartitionedFetch:
+    """Test sharding one query into concurrently paginated partitions."""
+
+    async def test_partitions_by_office_and_dedups(self, client, mocker):
+        pages = {
+            "P": [{"candidate_id": "P1"}],
+            "S": [{"candidate_id": "S1"}, {"candidate_id": "P1"}],
+            "H": [{"candidate_id": "H1"}],
+        }
+
+        async def fetch(url, params):
+            return {"results": pages[params["office"]], "pagination": {"pages": 1}}
+
+        fetch_mock = mocker.patch.object(client, "_fetch_page", side_effect=fetch)
+
+        candidates = await client.get_candidates(partitions="office")
+
+        assert sorted(c["candidate_id"] for c in candidates) == ["H1", "P1", "S1"]
+        offices = sorted(call.args[1]["office"] for call in fetch_mock.await_args_list)
+        assert offices == ["H", "P", "S"]
+
+    async def test_failed_partition_does_not_stop_others(self, client, mocker):
+        async def fetch(url, params):
+            if params["committee_type"] == "O":
+                raise FECServerError("boom")
+            return {
+                "results": [{"committee_id": params["committee_type"]}],
+                "pagination": {"pages": 1},
+            }
+
+        mocker.patch.object(client, "_fetch_page", side_effect=fetch)
+
+        committees = await client.get_committees(
+            partitions=[{"committee_type": "O"}, {"committee_type": "Q"}]
+        )
+
+        assert committees == [{"committee_id": "Q"}]
+
+    async def test_failed_partition_is_dead_lettered(
+        self, client, mocker, mock_session
+    ):
+        async def fetch(url, params):
+            if params["committee_type"] == "O":
+                raise FECServerError("boom")
+            return {"results": [], "pagination": {"pages": 1}}
+
+        mocker.patch.object(client, "_fetch_page", side_effect=fetch)
+        dead_letters = PageDeadLetterService(db=mock_session, entity="committees")
+        record = mocker.spy(dead_letters, "record")
+
+        await client._collect(
+            client.iter_committees(
+                partitions=[{"committee_type": "O"}, {"committee_type": "Q"}],
+                dead_letters=dead_letters,
+            )
+        )
+
+        record.assert_called_once()
+        _, params, page, _ = record.call_args.args
+        assert params["committee_type"] == "O"
+        assert page == 1
+
+    async def test_early_exit_leaves_no_producer_running(self, client, mocker):
+        async def fetch(url, params):
+            return {
+                "results": [{"committee_id": f"{params['state']}{params['page']}"}],
+                "pagination": {"pages": 5},
+            }
+
+        mocker.patch.object(client, "_fetch_page", side_effect=fetch)
+        stream = client.iter_partitioned(
+            "http://test",
+            {},
+            [{"state": "CA"}, {"state": "NY"}],
+            key="committee_id",
+            concurrency=1,
+        )
+
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    async def test_unknown_partition_field_raises(self, client):
+        with pytest.raises(ValueError, match="Unknown partition field"):
+            client.resolve_partitions("party")
+
+    async def test_checkpoint_marks_follow_consumption(
+        self, client, mocker, mock_session
+    ):
+        """A partition's pages are only marked once the consumer receives them."""
+        checkpoints = PaginationCheckpointService(db=mock_session, run_id="run")
+        mocker.patch.object(checkpoints, "get_by_id", return_value=None)
+
+        async def fetch(url, params):
+            return {
+                "results": [{"committee_id": f"{params['state']}{params['page']}"}],
+                "pagination": {"pages": 2},
+            }
+
+        mocker.patch.object(client, "_fetch_page", side_effect=fetch)
+        stream = client.iter_committees(
+            partitions=[{"state": "CA"}, {"state": "NY"}], checkpoints=checkpoints
+        )
+
+        received = 0
+        async for _ in stream:
+            received += 1
+            assert checkpoints.position() == received
+
+        assert received == 4
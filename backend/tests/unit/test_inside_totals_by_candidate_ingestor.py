@@ -24,7 +24,9 @@ class TestInsideTotalsByCandidateIngestor:
         )
         result = await ingestor.fetch(cycle=2024)
 
-        mock_client.get_candidate_totals.assert_awaited_once_with(cycle=2024)
+        mock_client.get_candidate_totals.assert_awaited_once_with(
+            cycle=2024, dead_letters=None
+        )
         assert result == [{"candidate_id": "P001", "cycle": 2024}]
 
     async def test_fetch_default_cycle_is_2024(self, mock_client, mock_session):
@@ -36,7 +38,9 @@ class TestInsideTotalsByCandidateIngestor:
         )
         await ingestor.fetch()
 
-        mock_client.get_candidate_totals.assert_awaited_once_with(cycle=2024)
+        mock_client.get_candidate_totals.assert_awaited_once_with(
+            cycle=2024, dead_letters=None
+        )
 
     async def test_fetch_passes_explicit_cycle(self, mock_client, mock_session):
         """fetch() passes the provided cycle through to the client."""
@@ -47,7 +51,9 @@ class TestInsideTotalsByCandidateIngestor:
         )
         await ingestor.fetch(cycle=2022)
 
-        mock_client.get_candidate_totals.assert_awaited_once_with(cycle=2022)
+        mock_client.get_candidate_totals.assert_awaited_once_with(
+            cycle=2022, dead_letters=None
+        )
 
     @patch(
         "civic_lantern.jobs.ingestors.inside_totals_by_candidate.transform_inside_totals_by_candidate",
@@ -65,7 +71,9 @@ class TestInsideTotalsByCandidateIngestor:
         )
         result = ingestor.transform(raw)
 
-        mock_transform.assert_called_once_with(raw)
+        mock_transform.assert_called_once_with(
+            raw, columns=ingestor.create_service().columns
+        )
         assert result == ["validated"]
 
     async def test_create_service_returns_correct_type(self, mock_client, mock_session):
@@ -1,3 +1,6 @@
+import random
+from decimal import Decimal
+
 import pytest
 from pydantic import ValidationError
 
@@ -98,3 +101,61 @@ class TestTransformInsideTotalsByCandidate:
 
     def test_empty_input_returns_empty(self):
         assert transform_inside_totals_by_candidate([]) == []
+
+
+def float_inside_totals(raw_records):
+    """The float accumulation transform_inside_totals_by_candidate replaced."""
+    accumulated = {}
+    for item in raw_records:
+        key = (item["candidate_id"], item["cycle"])
+        sums = accumulated.setdefault(key, {"receipts": 0.0, "disbursements": 0.0})
+        sums["receipts"] += float(item.get("receipts") or 0)
+        sums["disbursements"] += float(item.get("disbursements") or 0)
+    return accumulated
+
+
+@pytest.mark.unit
+class TestInsideTotalsExactness:
+    def test_matches_float_accumulation_to_the_cent(self):
+        rng = random.Random(0)
+        raw = [
+            {
+                "candidate_id": f"P{rng.randrange(50):03d}",
+                "cycle": rng.choice((2022, 2024)),
+                "receipts": rng.randrange(-(10**6), 10**9) / 100,
+                "disbursements": rng.choice((None, rng.randrange(10**8) / 100)),
+            }
+            for _ in range(2000)
+        ]
+
+        results = transform_inside_totals_by_candidate(raw)
+        expected = float_inside_totals(raw)
+
+        assert len(results) == len(expected)
+        for record in results:
+            sums = expected[(record.candidate_id, record.cycle)]
+            assert record.receipts == round(Decimal(sums["receipts"]), 2)
+            assert record.disbursements == round(Decimal(sums["disbursements"]), 2)
+
+    def test_exact_where_floats_drift(self):
+        """Float sums near Numeric(15, 2)'s range lose whole cents."""
+        raw = [{**VALID_RAW, "receipts": 9e12}] + [
+            {**VALID_RAW, "receipts": 0.01} for _ in range(30)
+        ]
+
+        (record,) = transform_inside_totals_by_candidate(raw)
+
+        assert record.receipts == Decimal("9000000000000.30")
+        drifted = float_inside_totals(raw)[(VALID_RAW["candidate_id"], 2024)]
+        assert round(drifted["receipts"], 2) == 9000000000000.29
+
+    def test_totals_are_two_place_decimals(self):
+        raw = [
+            {**VALID_RAW, "receipts": 0.1, "disbursements": "0.20"},
+            {**VALID_RAW, "receipts": 0.2, "disbursements": None},
+        ]
+
+        (record,) = transform_inside_totals_by_candidate(raw)
+
+        assert str(record.receipts) == "0.30"
+        assert str(record.disbursements) == "0.20"
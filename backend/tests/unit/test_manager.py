@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -163,3 +164,230 @@ class TestIngestionManager:
                 await manager.ingest_batch()
 
         mock_refresh.assert_not_awaited()
+
+
+def _stub(name, events, *, depends_on=(), fail=False):
+    """Build a stub ingestor class that records start/finish into events."""
+
+    class Stub:
+        def __init__(self, **kwargs):
+            pass
+
+        async def run(self, *args, **kwargs):
+            events.append(f"start:{name}")
+            await asyncio.sleep(0)
+            events.append(f"end:{name}")
+            if fail:
+                raise RuntimeError(f"{name} failed")
+            return {"inserted": 1, "updated": 0, "errors": 0, "failed_ids": []}
+
+    Stub.depends_on = depends_on
+    return Stub
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("civic_lantern.jobs.manager.AsyncSessionLocal")
+class TestIngestionManagerDAG:
+    """Test dependency-aware scheduling in ingest_batch()."""
+
+    async def test_siblings_run_concurrently_after_parent(self, MockSession, manager):
+        """Two children of the same parent overlap once the parent finishes."""
+        events: list = []
+        registry = {
+            "parent": _stub("parent", events),
+            "child_a": _stub("child_a", events, depends_on=("parent",)),
+            "child_b": _stub("child_b", events, depends_on=("parent",)),
+        }
+        with patch("civic_lantern.jobs.manager.INGESTOR_REGISTRY", new=registry):
+            await manager.ingest_batch(max_concurrency=2)
+
+        assert events.index("end:parent") < events.index("start:child_a")
+        # Both children start before either finishes.
+        assert events.index("start:child_b") < events.index("end:child_a")
+
+    async def test_max_concurrency_limits_parallelism(self, MockSession, manager):
+        """With max_concurrency=1, independent ingestors run one at a time."""
+        events: list = []
+        registry = {
+            "a": _stub("a", events),
+            "b": _stub("b", events),
+        }
+        with patch("civic_lantern.jobs.manager.INGESTOR_REGISTRY", new=registry):
+            await manager.ingest_batch(max_concurrency=1)
+
+        assert events == ["start:a", "end:a", "start:b", "end:b"]
+
+    async def test_dependents_of_failed_parent_are_skipped(self, MockSession, manager):
+        """A failed parent skips its children but not unrelated ingestors."""
+        events: list = []
+        registry = {
+            "parent": _stub("parent", events, fail=True),
+            "other": _stub("other", events),
+            "child": _stub("child", events, depends_on=("parent",)),
+            "grandchild": _stub("grandchild", events, depends_on=("child",)),
+        }
+        with patch("civic_lantern.jobs.manager.INGESTOR_REGISTRY", new=registry):
+            results = await manager.ingest_batch()
+
+        assert "error" in results["parent"]
+        assert results["child"]["skipped"] is True
+        assert results["grandchild"]["skipped"] is True
+        assert results["other"]["inserted"] == 1
+        assert "start:child" not in events
+
+    async def test_unselected_parents_are_not_required(self, MockSession, manager):
+        """Selecting only a child runs it without its (unselected) parent."""
+        events: list = []
+        registry = {
+            "parent": _stub("parent", events),
+            "child": _stub("child", events, depends_on=("parent",)),
+        }
+        with patch("civic_lantern.jobs.manager.INGESTOR_REGISTRY", new=registry):
+            results = await manager.ingest_batch(["child"])
+
+        assert list(results) == ["child"]
+        assert events == ["start:child", "end:child"]
+
+    async def test_records_per_node_timings(self, MockSession, manager):
+        """Each node's start/finish time and status are recorded."""
+        events: list = []
+        registry = {
+            "ok": _stub("ok", events),
+            "bad": _stub("bad", events, fail=True),
+        }
+        with patch("civic_lantern.jobs.manager.INGESTOR_REGISTRY", new=registry):
+            await manager.ingest_batch()
+
+        timings = manager.last_run_timings
+        assert timings["ok"]["status"] == "ok"
+        assert timings["bad"]["status"] == "error"
+        assert timings["ok"]["started_at"] <= timings["ok"]["finished_at"]
+
+    async def test_dependency_cycle_raises(self, MockSession, manager):
+        events: list = []
+        registry = {
+            "a": _stub("a", events, depends_on=("b",)),
+            "b": _stub("b", events, depends_on=("a",)),
+        }
+        with patch("civic_lantern.jobs.manager.INGESTOR_REGISTRY", new=registry):
+            with pytest.raises(ValueError, match="cycle"):
+                await manager.ingest_batch()
+
+    async def test_unknown_entity_raises(self, MockSession, manager):
+        with pytest.raises(ValueError, match="Unknown entities"):
+            await manager.ingest_batch(["nope"])
+
+    async def test_registry_declares_candidate_dependencies(self, MockSession):
+        """Spending ingestors depend only on candidates, not on each other."""
+        from civic_lantern.jobs.ingestors import INGESTOR_REGISTRY
+
+        assert INGESTOR_REGISTRY["inside_totals_by_candidate"].depends_on == (
+            "candidates",
+        )
+        assert INGESTOR_REGISTRY["schedule_e_totals_by_candidate"].depends_on == (
+            "candidates",
+        )
+        assert INGESTOR_REGISTRY["candidates"].depends_on == ()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@patch("civic_lantern.jobs.manager.AsyncSessionLocal")
+class TestIngestionManagerCycles:
+    """Test multi-cycle fan-out in ingest_batch()."""
+
+    @staticmethod
+    def _cycle_stub(calls, fail_cycles=()):
+        class CycleStub:
+            cycle_scoped = True
+            depends_on = ()
+
+            def __init__(self, **kwargs):
+                pass
+
+            async def run(self, *args, cycle=None, **kwargs):
+                calls.append(cycle)
+                await asyncio.sleep(0)
+                if cycle in fail_cycles:
+                    raise RuntimeError(f"cycle {cycle} down")
+                return {"inserted": cycle, "updated": 1, "errors": 0, "failed_ids": []}
+
+        return CycleStub
+
+    async def test_fans_out_one_run_per_cycle(self, MockSession, manager):
+        calls: list = []
+        registry = {"inside_totals_by_candidate": self._cycle_stub(calls)}
+
+        with patch("civic_lantern.jobs.manager.INGESTOR_REGISTRY", new=registry):
+            with patch.object(
+                manager, "refresh_spending_stats", new_callable=AsyncMock
+            ):
+                results = await manager.ingest_batch(cycles=range(2020, 2026, 2))
+
+        assert sorted(calls) == [2020, 2022, 2024]
+        result = results["inside_totals_by_candidate"]
+        assert result["inserted"] == 2020 + 2022 + 2024
+        assert result["updated"] == 3
+        assert set(result["cycles"]) == {2020, 2022, 2024}
+        assert result["failed_cycles"] == []
+
+    async def test_non_cycle_scoped_runs_once(self, MockSession, manager):
+        events: list = []
+        registry = {"committees": _stub("committees", events)}
+
+        with patch("civic_lantern.jobs.manager.INGESTOR_REGISTRY", new=registry):
+            results = await manager.ingest_batch(cycles=[2022, 2024])
+
+        assert events == ["start:committees", "end:committees"]
+        assert "cycles" not in results["committees"]
+
+    async def test_mv_refresh_runs_once_after_all_cycles(self, MockSession, manager):
+        calls: list = []
+        registry = {
+            "inside_totals_by_candidate": self._cycle_stub(calls),
+            "schedule_e_totals_by_candidate": self._cycle_stub(calls),
+        }
+
+        with patch("civic_lantern.jobs.manager.INGESTOR_REGISTRY", new=registry):
+            with patch.object(
+                manager, "refresh_spending_stats", new_callable=AsyncMock
+            ) as mock_refresh:
+                await manager.ingest_batch(cycles=[2020, 2022, 2024])
+
+        assert len(calls) == 6
+        mock_refresh.assert_awaited_once()
+
+    async def test_partial_cycle_failure_is_reported(self, MockSession, manager):
+        calls: list = []
+        registry = {
+            "inside_totals_by_candidate": self._cycle_stub(calls, fail_cycles={2022})
+        }
+
+        with patch("civic_lantern.jobs.manager.INGESTOR_REGISTRY", new=registry):
+            with patch.object(
+                manager, "refresh_spending_stats", new_callable=AsyncMock
+            ):
+                results = await manager.ingest_batch(cycles=[2020, 2022])
+
+        result = results["inside_totals_by_candidate"]
+        assert "error" not in result
+        assert result["failed_cycles"] == [2022]
+        assert "error" in result["cycles"][2022]
+
+    async def test_all_cycles_failing_marks_entity_failed(self, MockSession, manager):
+        calls: list = []
+        registry = {
+            "inside_totals_by_candidate": self._cycle_stub(
+                calls, fail_cycles={2020, 2022}
+            )
+        }
+
+        with patch("civic_lantern.jobs.manager.INGESTOR_REGISTRY", new=registry):
+            with patch.object(
+                manager, "refresh_spending_stats", new_callable=AsyncMock
+            ) as mock_refresh:
+                results = await manager.ingest_batch(cycles=[2020, 2022])
+
+        assert "error" in results["inside_totals_by_candidate"]
+        mock_refresh.assert_not_awaited()
@@ -0,0 +1,206 @@
+from types import SimpleNamespace
+from typing import Dict
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from civic_lantern.services.data.page_dead_letter import PageDeadLetterService
+from civic_lantern.services.fec_exceptions import FECServerError
+
+URL = "https://api.open.fec.gov/v1/committees/"
+
+
+def _letter(id, page, entity="fake", fingerprint="fp-1", params=None):
+    return SimpleNamespace(
+        id=id,
+        entity=entity,
+        fingerprint=fingerprint,
+        endpoint=URL,
+        params=params or {"per_page": 100},
+        page=page,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPageDeadLetterService:
+    async def test_flush_writes_buffered_pages_in_one_statement(self, mock_session):
+        service = PageDeadLetterService(db=mock_session, entity="fake", run_id="r1")
+        service.record(URL, {"api_key": "secret", "page": 3}, 3, FECServerError("boom"))
+        service.record(URL, {"api_key": "secret", "page": 5}, 5, FECServerError("boom"))
+
+        written = await service.flush()
+
+        assert written == 2
+        mock_session.execute.assert_awaited_once()
+        mock_session.commit.assert_awaited_once()
+        params = mock_session.execute.await_args.args[0].compile().params
+        assert "secret" not in str(params)
+
+    async def test_flush_without_failures_is_noop(self, mock_session):
+        service = PageDeadLetterService(db=mock_session, entity="fake", run_id="r1")
+
+        assert await service.flush() == 0
+        mock_session.execute.assert_not_awaited()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestIterPagesSecondPass:
+    async def test_failed_page_is_retried_after_the_rest(self, client, mocker):
+        attempts: Dict[int, int] = {}
+
+        async def fetch(url, params):
+            page = params["page"]
+            attempts[page] = attempts.get(page, 0) + 1
+            if page == 2 and attempts[page] == 1:
+                raise FECServerError("flaky")
+            return {"results": [{"id": page}], "pagination": {"pages": 3}}
+
+        mocker.patch.object(client, "_fetch_page", side_effect=fetch)
+
+        records = await client._paginate(URL, {})
+
+        assert [r["id"] for r in records] == [1, 3, 2]
+        assert attempts[2] == 2
+
+    async def test_permanent_failure_is_dead_lettered(
+        self, client, mocker, mock_session
+    ):
+        async def fetch(url, params):
+            if params["page"] == 2:
+                raise FECServerError("down")
+            return {"results": [{"id": params["page"]}], "pagination": {"pages": 3}}
+
+        mocker.patch.object(client, "_fetch_page", side_effect=fetch)
+        dead_letters = PageDeadLetterService(db=mock_session, entity="fake")
+        record = mocker.spy(dead_letters, "record")
+
+        records = await client._paginate(URL, {}, dead_letters=dead_letters)
+
+        assert [r["id"] for r in records] == [1, 3]
+        record.assert_called_once()
+        assert record.call_args.args[2] == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRetryDeadLetters:
+    async def test_record_local_ingestor_replays_only_failed_pages(
+        self, mock_client, make_ingestor, mocker
+    ):
+        mock_client.get_page.side_effect = [[{"id": 4}], FECServerError("still down")]
+        resolved = mocker.patch.object(PageDeadLetterService, "mark_resolved")
+        record = mocker.patch.object(PageDeadLetterService, "record")
+        mocker.patch.object(PageDeadLetterService, "flush")
+        ingestor = make_ingestor(pipelined=True)
+        letters = [_letter(1, page=4), _letter(2, page=9)]
+
+        stats = await ingestor.retry_dead_letters(letters)
+
+        assert [c.args[2] for c in mock_client.get_page.await_args_list] == [4, 9]
+        assert ingestor.upserted == [{"id": 4}]
+        assert stats["inserted"] == 1
+        assert resolved.await_args.args[0] == [1]
+        assert record.call_args.args[2] == 9
+
+    async def test_whole_query_letter_is_rerun_in_full(
+        self, mock_client, make_ingestor, mocker
+    ):
+        mock_client._paginate.return_value = [{"id": 1}, {"id": 2}]
+        resolved = mocker.patch.object(PageDeadLetterService, "mark_resolved")
+        mocker.patch.object(PageDeadLetterService, "flush")
+        ingestor = make_ingestor(pipelined=True)
+
+        await ingestor.retry_dead_letters([_letter(1, page=1)])
+
+        mock_client._paginate.assert_awaited_once()
+        mock_client.get_page.assert_not_awaited()
+        assert ingestor.upserted == [{"id": 1}, {"id": 2}]
+        assert resolved.await_args.args[0] == [1]
+
+    async def test_aggregating_ingestor_reruns_whole_query(
+        self, mock_client, make_ingestor, mocker
+    ):
+        mock_client._paginate.return_value = [{"id": 1}, {"id": 2}]
+        resolved = mocker.patch.object(PageDeadLetterService, "mark_resolved")
+        mocker.patch.object(PageDeadLetterService, "flush")
+        ingestor = make_ingestor(pipelined=False)
+
+        await ingestor.retry_dead_letters([_letter(1, page=4), _letter(2, page=9)])
+
+        mock_client._paginate.assert_awaited_once()
+        mock_client.get_page.assert_not_awaited()
+        assert ingestor.upserted == [{"id": 1}, {"id": 2}]
+        assert resolved.await_args.args[0] == [1, 2]
+
+    async def test_aggregating_queries_fail_and_resolve_independently(
+        self, mock_client, make_ingestor, mocker
+    ):
+        mock_client._paginate.side_effect = [
+            FECServerError("still down"),
+            [{"id": 3}],
+        ]
+        resolved = mocker.patch.object(PageDeadLetterService, "mark_resolved")
+        record = mocker.patch.object(PageDeadLetterService, "record")
+        mocker.patch.object(PageDeadLetterService, "flush")
+        ingestor = make_ingestor(pipelined=False)
+        letters = [
+            _letter(1, page=2, fingerprint="fp-1"),
+            _letter(2, page=5, fingerprint="fp-2"),
+        ]
+
+        stats = await ingestor.retry_dead_letters(letters)
+
+        assert ingestor.upserted == [{"id": 3}]
+        assert stats["inserted"] == 1
+        assert [c.args[0] for c in resolved.await_args_list] == [[2]]
+        assert record.call_args.args[2] == 2
+
+    async def test_letters_stay_open_when_the_upsert_fails(
+        self, mock_client, make_ingestor, mocker
+    ):
+        mock_client._paginate.return_value = [{"id": 1}]
+        resolved = mocker.patch.object(PageDeadLetterService, "mark_resolved")
+        mocker.patch.object(PageDeadLetterService, "flush")
+        ingestor = make_ingestor(pipelined=False)
+        ingestor.service.upsert_batch.side_effect = RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            await ingestor.retry_dead_letters([_letter(1, page=4)])
+
+        resolved.assert_not_awaited()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestManagerRetryDeadLetters:
+    @patch("civic_lantern.jobs.manager.AsyncSessionLocal")
+    async def test_routes_letters_to_their_ingestors(self, MockSession, manager):
+        MockSession.return_value.__aenter__.return_value = AsyncMock()
+        letters = [_letter(1, 2, entity="alpha"), _letter(2, 7, entity="beta")]
+        received: Dict[str, list] = {}
+
+        def stub(name):
+            class Stub:
+                def __init__(self, **kwargs):
+                    pass
+
+                async def retry_dead_letters(self, group, bulk=False):
+                    received[name] = [letter.id for letter in group]
+                    return {"inserted": len(group)}
+
+            return Stub
+
+        registry = {"alpha": stub("alpha"), "beta": stub("beta")}
+        with (
+            patch("civic_lantern.jobs.manager.INGESTOR_REGISTRY", new=registry),
+            patch.object(
+                PageDeadLetterService, "get_unresolved", return_value=letters
+            ) as get_unresolved,
+        ):
+            results = await manager.retry_dead_letters(["alpha", "beta"])
+
+        get_unresolved.assert_awaited_once_with(["alpha", "beta"])
+        assert received == {"alpha": [1], "beta": [2]}
+        assert results == {"alpha": {"inserted": 1}, "beta": {"inserted": 1}}
@@ -0,0 +1,204 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, List
+
+import pytest
+
+from civic_lantern.services.data.pagination_checkpoint import (
+    PaginationCheckpointService,
+    query_fingerprint,
+)
+from tests.unit.conftest import PagedIngestor, scalars_first_result
+
+URL = "https://api.open.fec.gov/v1/committees/"
+
+
+def _checkpoint(pages, age=timedelta(minutes=5), last_index=None):
+    return SimpleNamespace(
+        run_id="old-run",
+        completed_pages=pages,
+        last_index=last_index,
+        updated_at=datetime.now(timezone.utc) - age,
+    )
+
+
+def _executed(mock_session, column: str) -> List[Any]:
+    """Values of `column` written by each checkpoint upsert, in order."""
+    values = []
+    for call in mock_session.execute.await_args_list:
+        params = call.args[0].compile().params
+        if "completed_pages" in params:
+            values.append(params[column])
+    return values
+
+
+def _executed_pages(mock_session) -> List[List[int]]:
+    return _executed(mock_session, "completed_pages")
+
+
+@pytest.mark.unit
+class TestQueryFingerprint:
+    def test_ignores_api_key_and_page(self):
+        a = query_fingerprint(URL, {"per_page": 100, "api_key": "a", "page": 1})
+        b = query_fingerprint(URL, {"page": 7, "api_key": "b", "per_page": 100})
+
+        assert a == b
+
+    def test_differs_by_query(self):
+        assert query_fingerprint(URL, {"cycle": 2022}) != query_fingerprint(
+            URL, {"cycle": 2024}
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPaginationCheckpointService:
+    async def test_open_resumes_from_fresh_checkpoint(self, mock_session):
+        mock_session.execute.return_value = scalars_first_result(_checkpoint([1, 2]))
+        service = PaginationCheckpointService(db=mock_session, run_id="run")
+
+        progress = await service.open(URL, {"per_page": 100})
+
+        assert progress.completed == {1, 2}
+        mock_session.commit.assert_not_awaited()
+
+    async def test_open_discards_stale_checkpoint(self, mock_session):
+        mock_session.execute.return_value = scalars_first_result(
+            _checkpoint([1, 2], age=timedelta(days=3))
+        )
+        service = PaginationCheckpointService(
+            db=mock_session, run_id="run", ttl=timedelta(hours=24)
+        )
+
+        progress = await service.open(URL, {"per_page": 100})
+
+        assert progress.completed == set()
+        assert mock_session.execute.await_count == 2  # lookup + delete
+        mock_session.commit.assert_awaited_once()
+
+    async def test_commit_persists_only_pages_up_to_position(self, mock_session):
+        mock_session.execute.return_value = scalars_first_result(None)
+        service = PaginationCheckpointService(db=mock_session, run_id="run")
+        progress = await service.open(URL, {})
+
+        service.mark(progress, 1)
+        service.mark(progress, 2)
+        upserted_through = service.position()
+        service.mark(progress, 3)
+
+        await service.commit(upto=upserted_through)
+        await service.commit()
+
+        assert _executed_pages(mock_session) == [[1, 2], [1, 2, 3]]
+
+    async def test_commit_persists_latest_keyset_cursor(self, mock_session):
+        mock_session.execute.return_value = scalars_first_result(None)
+        service = PaginationCheckpointService(db=mock_session, run_id="run")
+        progress = await service.open(URL, {})
+
+        service.mark_cursor(progress, {"last_index": "1"})
+        service.mark_cursor(progress, {"last_index": "2"})
+        await service.commit()
+
+        assert _executed(mock_session, "last_index") == [{"last_index": "2"}]
+        assert _executed_pages(mock_session) == [[]]
+
+    async def test_commit_without_new_pages_is_noop(self, mock_session):
+        service = PaginationCheckpointService(db=mock_session, run_id="run")
+
+        await service.commit()
+
+        mock_session.execute.assert_not_awaited()
+        mock_session.commit.assert_not_awaited()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestIterPagesResume:
+    async def test_skips_completed_pages_and_marks_the_rest(
+        self, client, mocker, mock_session
+    ):
+        checkpoints = PaginationCheckpointService(db=mock_session, run_id="run")
+        mocker.patch.object(
+            checkpoints, "get_by_id", return_value=_checkpoint([1, 2, 3])
+        )
+        fetched = []
+
+        async def fetch(url, params):
+            fetched.append(params["page"])
+            return {"results": [{"page": params["page"]}], "pagination": {"pages": 5}}
+
+        mocker.patch.object(client, "_fetch_page", side_effect=fetch)
+
+        records = await client._paginate(URL, {}, checkpoints=checkpoints)
+
+        assert fetched == [1, 4, 5]
+        assert records == [{"page": 4}, {"page": 5}]
+        assert checkpoints.position() == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestKeysetResume:
+    async def test_iter_pages_resumes_keyset_query_from_cursor(
+        self, client, mocker, mock_session
+    ):
+        checkpoints = PaginationCheckpointService(db=mock_session, run_id="run")
+        mocker.patch.object(
+            checkpoints,
+            "get_by_id",
+            return_value=_checkpoint([], last_index={"last_index": "40"}),
+        )
+        fetch = mocker.patch.object(
+            client,
+            "_fetch_page",
+            return_value={
+                "results": [{"id": 41}],
+                "pagination": {"last_indexes": None},
+            },
+        )
+
+        records = await client._paginate(
+            URL, {"sort": "-date"}, checkpoints=checkpoints
+        )
+
+        assert records == [{"id": 41}]
+        fetch.assert_awaited_once_with(URL, {"sort": "-date", "last_index": "40"})
+
+
+class CheckpointedIngestor(PagedIngestor):
+    pipeline_chunk_size = 2
+    pipeline_queue_size = 1
+
+    async def fetch_pages(self, **kwargs: Any):
+        progress = await self.checkpoints.open(URL, {})
+        for page in range(1, 5):
+            self.checkpoints.mark(progress, page)
+            yield [{"id": page}]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestPipelinedCheckpointing:
+    async def test_commits_after_each_upsert_then_clears(
+        self, make_ingestor, mock_session, mocker
+    ):
+        ingestor = make_ingestor(CheckpointedIngestor)
+        mocker.patch.object(PaginationCheckpointService, "get_by_id", return_value=None)
+        commit = mocker.spy(PaginationCheckpointService, "commit")
+        finish = mocker.patch.object(PaginationCheckpointService, "finish")
+
+        await ingestor.run(run_id="run-1")
+
+        assert ingestor.checkpoints.run_id == "run-1"
+        assert [c.kwargs["upto"] for c in commit.await_args_list] == [2, 4, 4]
+        assert _executed_pages(mock_session) == [[1, 2], [1, 2, 3, 4]]
+        finish.assert_awaited_once()
+
+    async def test_resume_false_disables_checkpoints(self, make_ingestor, mock_session):
+        ingestor = make_ingestor(pages=[[{"id": 1}]])
+
+        await ingestor.run(resume=False)
+
+        assert ingestor.checkpoints is None
+        mock_session.execute.assert_not_awaited()
@@ -0,0 +1,136 @@
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from civic_lantern.services.rate_limiter import AdaptivePacer, HourlyBudgetLimiter
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestHourlyBudgetLimiter:
+    async def test_headers_overwrite_local_budget(self):
+        limiter = HourlyBudgetLimiter(limit=1000, reserve=0)
+
+        limiter.observe(
+            200, {"X-RateLimit-Limit": "5000", "X-RateLimit-Remaining": "42"}
+        )
+
+        assert limiter.metrics() == {"hourly_limit": 5000, "budget_remaining": 42}
+
+    async def test_acquire_spends_budget(self):
+        limiter = HourlyBudgetLimiter(limit=1000, reserve=0)
+        limiter.observe(200, {"X-RateLimit-Remaining": "10"})
+
+        async with limiter:
+            pass
+
+        assert limiter.metrics()["budget_remaining"] == 9
+
+    async def test_waits_for_refill_when_budget_spent(self, mocker):
+        limiter = HourlyBudgetLimiter(limit=3600, reserve=0)
+        limiter.observe(429, {})
+        sleep = mocker.patch(
+            "civic_lantern.services.rate_limiter.asyncio.sleep",
+            side_effect=lambda s: limiter.observe(200, {"X-RateLimit-Remaining": "1"}),
+        )
+
+        async with limiter:
+            pass
+
+        # Refill is 1 req/sec at 3600/hour, so the deficit of one request ≈ 1s.
+        assert sleep.call_args.args[0] == pytest.approx(1, abs=0.01)
+
+    async def test_malformed_headers_are_ignored(self):
+        limiter = HourlyBudgetLimiter(limit=1000, reserve=0)
+
+        limiter.observe(200, {"X-RateLimit-Limit": "n/a", "X-RateLimit-Remaining": ""})
+
+        assert limiter.metrics()["hourly_limit"] == 1000
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestAdaptivePacer:
+    async def test_successes_increase_rate_and_concurrency(self):
+        pacer = AdaptivePacer(initial_rate=1.0, rate_step=0.5, initial_concurrency=2)
+
+        for _ in range(2):
+            pacer.observe(200, {})
+
+        assert pacer.rate == 2.0
+        assert pacer.concurrency == 3
+
+    async def test_429_halves_rate_and_concurrency(self):
+        pacer = AdaptivePacer(initial_rate=4.0, initial_concurrency=8)
+
+        pacer.observe(429, {})
+
+        assert pacer.rate == 2.0
+        assert pacer.concurrency == 4
+        assert pacer.metrics()["throttled"] == 1
+
+    async def test_bounds_are_respected(self):
+        pacer = AdaptivePacer(
+            initial_rate=0.3, min_rate=0.2, max_rate=0.35, initial_concurrency=1
+        )
+
+        pacer.observe(429, {})
+        assert pacer.rate == 0.2
+        assert pacer.concurrency == 1
+
+        for _ in range(10):
+            pacer.observe(200, {})
+        assert pacer.rate == 0.35
+
+    async def test_retry_after_pauses_next_request(self, mocker):
+        pacer = AdaptivePacer(initial_rate=1000.0)
+        pacer.observe(429, {"Retry-After": "30"})
+        sleep = mocker.patch("civic_lantern.services.rate_limiter.asyncio.sleep")
+
+        async with pacer:
+            pass
+
+        assert sleep.call_args.args[0] == pytest.approx(30, abs=0.5)
+
+    async def test_limits_in_flight_requests(self):
+        pacer = AdaptivePacer(initial_rate=1000.0, initial_concurrency=2)
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            async with pacer:
+                peak = max(peak, pacer.in_flight)
+                await asyncio.sleep(0.001)
+
+        await asyncio.gather(*(request() for _ in range(6)))
+
+        assert peak == 2
+        assert pacer.in_flight == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestFECClientAdaptiveLimiting:
+    @respx.mock
+    async def test_responses_feed_the_limiters(self, client):
+        slot = client.keys.slots[0]
+        slot.budget = HourlyBudgetLimiter(limit=1000, reserve=0)
+        slot.pacer = AdaptivePacer(initial_rate=5.0)
+        respx.get(url__startswith=client.candidate_url).mock(
+            return_value=httpx.Response(
+                200,
+                headers={"X-RateLimit-Limit": "1000", "X-RateLimit-Remaining": "500"},
+                json={
+                    "results": [{"candidate_id": "C001"}],
+                    "pagination": {"pages": 1},
+                },
+            )
+        )
+
+        await client.get_candidates()
+
+        metrics = client.rate_limit_metrics()[slot.label]
+        assert metrics["budget_remaining"] == 500
+        assert metrics["rate_per_sec"] > 5.0
@@ -0,0 +1,226 @@
+from datetime import date
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from civic_lantern.jobs.ingestors.inside_totals_by_candidate import (
+    InsideTotalsByCandidateIngestor,
+)
+from civic_lantern.services.data.raw_page import RawPageService
+from tests.unit.conftest import rows_result
+
+
+def _rows(*ids):
+    return [{"id": id} for id in ids]
+
+
+@pytest.fixture
+def make_landing(make_ingestor):
+    def make(**kwargs):
+        return make_ingestor(pipeline_chunk_size=2, **kwargs)
+
+    return make
+
+
+@pytest.fixture
+def landed(mocker):
+    """Capture landed pages instead of writing them."""
+    pages: List[List[Dict[str, Any]]] = []
+    mocker.patch.object(
+        RawPageService, "record", side_effect=lambda records: pages.append(records)
+    )
+    mocker.patch.object(RawPageService, "flush")
+    return pages
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLanding:
+    async def test_pipelined_run_lands_each_page(self, make_landing, landed):
+        pages = [_rows(1, 2), _rows(3)]
+        ingestor = make_landing(pages=pages, pipelined=True)
+
+        await ingestor.run(land=True, resume=False, run_id="r1")
+
+        assert landed == pages
+        assert ingestor.landing.run_id == "r1"
+        assert ingestor.landing.endpoint == "/fake/"
+
+    async def test_sequential_run_lands_in_chunks_before_transform(
+        self, make_landing, landed
+    ):
+        ingestor = make_landing(pages=[_rows(1, 2, 3)], pipelined=False)
+
+        await ingestor.run(land=True, cycle=2024)
+
+        assert landed == [_rows(1, 2), _rows(3)]
+        assert ingestor.landing.params == {"cycle": 2024}
+        RawPageService.flush.assert_awaited_once()
+
+    async def test_landing_is_off_by_default(self, make_landing, landed):
+        ingestor = make_landing(pages=[_rows(1)], pipelined=False)
+
+        await ingestor.run()
+
+        assert landed == []
+        assert ingestor.landing is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestRawPageService:
+    async def test_params_are_stored_json_safe(self, mock_session):
+        service = RawPageService(
+            db=mock_session, params={"since": date(2024, 1, 1), "api_key": "secret"}
+        )
+
+        assert service.params == {"since": "2024-01-01"}
+
+    async def test_flush_inserts_buffered_pages(self, mock_session):
+        service = RawPageService(db=mock_session, entity="fake", run_id="r1")
+        service.record(_rows(1, 2))
+        service.record([])
+
+        assert await service.flush() == 1
+        rows = mock_session.execute.await_args.args[1]
+        assert rows[0]["payload"] == _rows(1, 2)
+        assert rows[0]["record_count"] == 2
+        mock_session.commit.assert_awaited_once()
+
+    async def test_pages_are_read_back_with_their_params(self, mock_session):
+        mock_session.execute.side_effect = [
+            rows_result(
+                [
+                    SimpleNamespace(id=1, params={"cycle": 2022}, payload=_rows(1)),
+                    SimpleNamespace(id=2, params=None, payload=_rows(2)),
+                ]
+            ),
+            rows_result([]),
+        ]
+        service = RawPageService(db=mock_session)
+
+        batches = [batch async for batch in service.iter_pages("fake", "r1")]
+
+        assert batches == [[({"cycle": 2022}, _rows(1)), ({}, _rows(2))]]
+
+
+def _stream(*batches, params=None):
+    async def iter_pages(entity, run_id, batch_size=50):
+        for batch in batches:
+            yield [(params or {}, page) for page in batch]
+
+    return iter_pages
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReplay:
+    async def test_pipelined_replay_upserts_in_chunks_without_api(
+        self, make_landing, mock_client, mocker
+    ):
+        mocker.patch.object(RawPageService, "get_run_ids", return_value=["r1"])
+        mocker.patch.object(
+            RawPageService,
+            "iter_pages",
+            side_effect=_stream([_rows(1), _rows(2)], [_rows(3)]),
+        )
+        ingestor = make_landing(pages=[], pipelined=True)
+
+        stats = await ingestor.replay()
+
+        assert ingestor.transformed == [_rows(1, 2), _rows(3)]
+        assert stats["inserted"] == 3
+        assert not mock_client.mock_calls
+
+    async def test_aggregating_replay_transforms_each_run_whole(
+        self, make_landing, mocker
+    ):
+        mocker.patch.object(RawPageService, "get_run_ids", return_value=["old", "new"])
+        runs = {
+            "old": _stream([_rows(1), _rows(2), _rows(3)]),
+            "new": _stream([_rows(4)]),
+        }
+
+        def iter_pages(entity, run_id, batch_size=50):
+            return runs[run_id](entity, run_id, batch_size)
+
+        mocker.patch.object(RawPageService, "iter_pages", side_effect=iter_pages)
+        ingestor = make_landing(pages=[], pipelined=False)
+
+        await ingestor.replay()
+
+        assert ingestor.transformed == [_rows(1, 2, 3), _rows(4)]
+        assert ingestor.upserted == _rows(1, 2, 3, 4)
+
+    async def test_pages_replay_under_the_params_they_were_fetched_with(
+        self, make_landing, mocker
+    ):
+        # A manager batch lands every cycle's pages under one run_id.
+        mocker.patch.object(RawPageService, "get_run_ids", return_value=["r1"])
+
+        async def iter_pages(entity, run_id, batch_size=50):
+            yield [
+                ({"cycle": 2022}, _rows(1)),
+                ({"cycle": 2024}, _rows(2)),
+                ({"cycle": 2022}, _rows(3)),
+            ]
+
+        mocker.patch.object(RawPageService, "iter_pages", side_effect=iter_pages)
+        replayed: List[Dict[str, Any]] = []
+        ingestor = make_landing(pages=[], before_replay=replayed.append)
+
+        await ingestor.replay()
+
+        assert replayed == [{"cycle": 2022}, {"cycle": 2024}]
+        assert ingestor.transformed == [_rows(1, 3), _rows(2)]
+
+    async def test_nothing_landed_returns_none(self, make_landing, mocker):
+        mocker.patch.object(RawPageService, "get_run_ids", return_value=[])
+        ingestor = make_landing(pages=[], pipelined=True)
+
+        assert await ingestor.replay() is None
+
+    async def test_candidate_linked_replay_drops_instead_of_backfilling(
+        self, mock_client, mock_session, mocker
+    ):
+        mocker.patch.object(RawPageService, "iter_pages", side_effect=_stream())
+        ingestor = InsideTotalsByCandidateIngestor(mock_client, mock_session)
+
+        await ingestor.replay(run_id="r1")
+
+        assert ingestor.missing_candidate_policy == "drop"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestManagerReplay:
+    @patch("civic_lantern.jobs.manager.AsyncSessionLocal")
+    async def test_replays_in_registry_order(self, MockSession, manager):
+        MockSession.return_value.__aenter__.return_value = AsyncMock()
+        order: List[str] = []
+
+        def stub(name):
+            class Stub:
+                def __init__(self, **kwargs):
+                    pass
+
+                async def replay(self, run_id=None, bulk=False):
+                    order.append(name)
+                    if name == "beta":
+                        raise RuntimeError("bad payload")
+                    return {"inserted": 1}
+
+            return Stub
+
+        registry = {"alpha": stub("alpha"), "beta": stub("beta")}
+        with patch("civic_lantern.jobs.manager.INGESTOR_REGISTRY", new=registry):
+            results = await manager.replay(["beta", "alpha"])
+
+        assert order == ["alpha", "beta"]
+        assert results == {"alpha": {"inserted": 1}, "beta": {"error": "bad payload"}}
+
+    async def test_rejects_unknown_entities(self, manager):
+        with pytest.raises(ValueError, match="Unknown entities"):
+            await manager.replay(["nope"])
@@ -0,0 +1,148 @@
+import httpx
+import pytest
+import respx
+
+from civic_lantern.services.fec_client import FECClient
+from civic_lantern.services.response_cache import ResponseCache
+
+URL = "https://api.open.fec.gov/v1/candidates/"
+TOTALS_URL = "https://api.open.fec.gov/v1/candidates/totals/"
+
+
+def _body(n):
+    return {"results": [{"candidate_id": f"C{n:03}"}], "pagination": {"pages": 1}}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(tmp_path, default_ttl=60)
+    yield cache
+    cache.close()
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    def test_key_ignores_api_key(self):
+        assert ResponseCache.cache_key(
+            URL, {"page": 1, "api_key": "a"}
+        ) == ResponseCache.cache_key(URL, {"page": 1, "api_key": "b"})
+        assert ResponseCache.cache_key(URL, {"page": 1}) != ResponseCache.cache_key(
+            URL, {"page": 2}
+        )
+
+    def test_round_trip_counts_hits_and_misses(self, cache):
+        assert cache.get(URL, {"page": 1}) is None
+        cache.put(URL, {"page": 1, "api_key": "secret"}, _body(1))
+
+        entry = cache.get(URL, {"page": 1, "api_key": "other"})
+
+        assert entry.fresh and entry.body == _body(1)
+        assert cache.metrics() == {
+            "/v1/candidates/": {"hits": 1, "misses": 1, "revalidated": 0}
+        }
+
+    def test_expired_entry_without_validators_is_a_miss(self, cache, mocker):
+        cache.put(URL, {"page": 1}, _body(1))
+        mocker.patch("time.time", return_value=10**12)
+
+        assert cache.get(URL, {"page": 1}) is None
+
+    def test_expired_entry_with_etag_is_kept_for_revalidation(self, cache, mocker):
+        cache.put(URL, {"page": 1}, _body(1), {"ETag": '"v1"'})
+        mocker.patch("time.time", return_value=10**12)
+
+        entry = cache.get(URL, {"page": 1})
+
+        assert not entry.fresh
+        assert entry.validators == {"If-None-Match": '"v1"'}
+
+    def test_ttl_uses_longest_matching_prefix(self, tmp_path):
+        cache = ResponseCache(
+            tmp_path,
+            default_ttl=100,
+            ttls={"/v1/candidates/": 50, "/v1/candidates/totals/": 10},
+        )
+
+        assert cache.ttl_for(TOTALS_URL) == 10
+        assert cache.ttl_for(URL) == 50
+        assert cache.ttl_for("https://api.open.fec.gov/v1/committees/") == 100
+        cache.close()
+
+    def test_evicts_least_recently_used_over_max_bytes(self, tmp_path, mocker):
+        clock = mocker.patch("time.time", return_value=1000.0)
+        cache = ResponseCache(tmp_path)
+        cache.put(URL, {"page": 1}, _body(1))
+        (size,) = cache._db.execute("SELECT size FROM responses").fetchone()
+        cache.max_bytes = int(size * 2.5)
+        clock.return_value += 1
+        cache.put(URL, {"page": 2}, _body(2))
+        clock.return_value += 1
+        cache.get(URL, {"page": 1})
+        clock.return_value += 1
+
+        cache.put(URL, {"page": 3}, _body(3))
+
+        assert cache.get(URL, {"page": 2}) is None
+        assert cache.get(URL, {"page": 1}) is not None
+        assert cache.get(URL, {"page": 3}) is not None
+        cache.close()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestFECClientCaching:
+    @respx.mock
+    async def test_fresh_hit_skips_the_network(self, client, cache):
+        client.cache = cache
+        route = respx.get(url__startswith=URL).mock(
+            return_value=httpx.Response(200, json=_body(1))
+        )
+
+        first = await client._fetch_page(URL, {"page": 1})
+        second = await client._fetch_page(URL, {"page": 1})
+
+        assert first == second == _body(1)
+        assert len(route.calls) == 1
+        assert client.cache_metrics()["/v1/candidates/"]["hits"] == 1
+
+    @respx.mock
+    async def test_304_revalidates_expired_entry(self, client, cache, mocker):
+        client.cache = cache
+        cache.put(URL, {"page": 1}, _body(1), {"ETag": '"v1"'})
+        mocker.patch("time.time", return_value=10**12)
+        route = respx.get(url__startswith=URL).mock(
+            return_value=httpx.Response(304, headers={"ETag": '"v1"'})
+        )
+
+        body = await client._fetch_page(URL, {"page": 1})
+
+        assert body == _body(1)
+        assert route.calls[0].request.headers["If-None-Match"] == '"v1"'
+        assert cache.metrics()["/v1/candidates/"]["revalidated"] == 1
+
+    @respx.mock
+    async def test_changed_response_replaces_entry(self, client, cache, mocker):
+        client.cache = cache
+        cache.put(URL, {"page": 1}, _body(1), {"ETag": '"v1"'})
+        mocker.patch("time.time", return_value=10**12)
+        respx.get(url__startswith=URL).mock(
+            return_value=httpx.Response(200, json=_body(2), headers={"ETag": '"v2"'})
+        )
+
+        body = await client._fetch_page(URL, {"page": 1})
+
+        assert body == _body(2)
+        entry = cache.get(URL, {"page": 1})
+        assert entry.body == _body(2) and entry.etag == '"v2"'
+
+    async def test_cache_is_off_by_default(self, client):
+        assert client.cache is None
+        assert client.cache_metrics() == {}
+
+    async def test_uses_cache_dir_from_settings(self, tmp_path, mocker):
+        mocker.patch(
+            "civic_lantern.services.fec_client.settings.FEC_CACHE_DIR", str(tmp_path)
+        )
+
+        async with FECClient(api_keys=[]) as client:
+            assert client.cache.ttl_for(TOTALS_URL) == 6 * 3600
@@ -0,0 +1,231 @@
+from datetime import date
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from civic_lantern.jobs.ingestors.schedule_e_itemized import ScheduleEItemizedIngestor
+from civic_lantern.services.data.raw_page import RawPageService
+from civic_lantern.services.data.schedule_e_itemized import ScheduleEItemizedService
+from civic_lantern.services.data.sync_watermark import SyncWatermarkService
+from civic_lantern.services.fec_client import FECClient
+from civic_lantern.utils.transformers import transform_schedule_e_itemized
+from tests.unit.conftest import mappings_result
+
+RAW = {
+    "sub_id": 4123456789012345678,
+    "two_year_transaction_period": 2024,
+    "committee_id": "C00000001",
+    "candidate_id": "P00000001",
+    "support_oppose_indicator": "o",
+    "expenditure_date": "2024-10-01T00:00:00",
+    "dissemination_date": "",
+    "expenditure_amount": 1250.5,
+    "memoed_subtotal": False,
+    "image_number": 202410019000000001,
+}
+
+
+@pytest.mark.unit
+class TestScheduleEItemizedTransform:
+    def test_normalizes_api_row(self):
+        (record,) = transform_schedule_e_itemized([RAW])
+
+        assert record.sub_id == "4123456789012345678"
+        assert record.cycle == 2024
+        assert record.support_oppose_indicator.value == "O"
+        assert record.expenditure_date == date(2024, 10, 1)
+        assert record.dissemination_date is None
+        assert record.image_number == "202410019000000001"
+        assert record.expenditure_amount == Decimal("1250.50")
+
+    def test_float_amounts_keep_exact_cents(self):
+        (record,) = transform_schedule_e_itemized(
+            [{**RAW, "expenditure_amount": 0.1 + 0.2}]
+        )
+
+        assert str(record.expenditure_amount) == "0.30"
+
+    def test_queried_cycle_fills_missing_period(self):
+        raw = {**RAW, "two_year_transaction_period": None}
+
+        (record,) = transform_schedule_e_itemized([raw], cycle=2022)
+
+        assert record.cycle == 2022
+
+    def test_skips_rows_without_cycle(self, caplog):
+        raw = {**RAW, "two_year_transaction_period": None}
+
+        assert transform_schedule_e_itemized([raw]) == []
+        assert "Dropped 1 schedule E expenditure(s)" in caplog.text
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestIterScheduleE:
+    async def test_single_cursor_chain_by_default(self, mocker):
+        client = FECClient(api_keys=["k"])
+        pages = mocker.patch.object(client, "iter_keyset_pages")
+
+        client.iter_schedule_e(cycle=2024, since=date(2024, 6, 1))
+
+        url, params = pages.call_args.args
+        assert url == client.schedule_e_url
+        assert params == {
+            "two_year_transaction_period": 2024,
+            "per_page": 100,
+            "min_date": "2024-06-01",
+        }
+        await client.close()
+
+    async def test_windows_split_the_cycle_dates(self, mocker):
+        client = FECClient(api_keys=["k"])
+        ranges = mocker.patch.object(client, "iter_keyset_ranges")
+
+        client.iter_schedule_e(cycle=2024, windows=2)
+
+        windows = ranges.call_args.args[2]
+        assert windows[0]["min_date"] == "2023-01-01"
+        assert windows[-1]["max_date"] == "2024-12-31"
+        assert len(windows) == 2
+        await client.close()
+
+
+async def _pages(*pages):
+    for page in pages:
+        yield page
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestScheduleEItemizedIngestor:
+    async def test_bulk_loads_into_cycle_partitions(
+        self, mock_client, mock_session, mocker
+    ):
+        mock_client.iter_schedule_e = MagicMock(
+            return_value=_pages([RAW], [{**RAW, "sub_id": 2}])
+        )
+        ensure = mocker.patch.object(ScheduleEItemizedService, "ensure_partitions")
+        upsert = mocker.patch.object(
+            ScheduleEItemizedService,
+            "upsert_batch",
+            return_value={"inserted": 1, "updated": 0, "errors": 0},
+        )
+        ingestor = ScheduleEItemizedIngestor(mock_client, mock_session)
+
+        await ingestor.run(cycle=2024, windows=4, resume=False)
+
+        assert mock_client.iter_schedule_e.call_args.kwargs["windows"] == 4
+        ensure.assert_awaited_once_with({2024})
+        assert upsert.await_args.kwargs == {"bulk": True, "workers": 1}
+
+    async def test_replay_assigns_each_page_its_landed_cycle(
+        self, mock_client, mock_session, mocker
+    ):
+        # One manager batch run_id covers both cycles' pages.
+        mocker.patch.object(RawPageService, "get_run_ids", return_value=["r1"])
+        undated = {**RAW, "two_year_transaction_period": None}
+
+        async def iter_pages(entity, run_id, batch_size=50):
+            yield [
+                ({"cycle": 2022}, [{**undated, "sub_id": 1}]),
+                ({"cycle": 2024}, [{**undated, "sub_id": 2}]),
+            ]
+
+        mocker.patch.object(RawPageService, "iter_pages", side_effect=iter_pages)
+        ensure = mocker.patch.object(ScheduleEItemizedService, "ensure_partitions")
+        upsert = mocker.patch.object(
+            ScheduleEItemizedService,
+            "upsert_batch",
+            return_value={"inserted": 1, "updated": 0, "errors": 0},
+        )
+        ingestor = ScheduleEItemizedIngestor(mock_client, mock_session)
+
+        await ingestor.replay()
+
+        assert [c.args for c in ensure.await_args_list] == [({2022},), ({2024},)]
+        rows = [row for c in upsert.await_args_list for row in c.args[0]]
+        assert [(row["sub_id"], row["cycle"]) for row in rows] == [
+            ("1", 2022),
+            ("2", 2024),
+        ]
+
+    async def test_incremental_watermark_is_per_cycle(
+        self, mock_client, mock_session, mocker
+    ):
+        mock_client.iter_schedule_e = MagicMock(return_value=_pages([RAW]))
+        get = mocker.patch.object(
+            SyncWatermarkService, "get_high_water", return_value=date(2024, 9, 1)
+        )
+        advance = mocker.patch.object(SyncWatermarkService, "advance")
+        mocker.patch.object(ScheduleEItemizedService, "ensure_partitions")
+        mocker.patch.object(
+            ScheduleEItemizedService,
+            "upsert_batch",
+            return_value={"inserted": 1, "updated": 0, "errors": 0},
+        )
+        ingestor = ScheduleEItemizedIngestor(mock_client, mock_session)
+
+        await ingestor.run(cycle=2024, incremental=True, resume=False, run_id="r1")
+
+        get.assert_awaited_once_with("schedule_e_itemized:2024")
+        assert mock_client.iter_schedule_e.call_args.kwargs["since"] == date(2024, 9, 1)
+        advance.assert_awaited_once_with(
+            "schedule_e_itemized:2024", "expenditure_date", date(2024, 10, 1), "r1"
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestScheduleEItemizedService:
+    async def test_ensure_partitions_creates_one_per_cycle(self, mock_session):
+        await ScheduleEItemizedService(db=mock_session).ensure_partitions(
+            [2024, 2022, 2024]
+        )
+
+        statements = [
+            str(call.args[0]) for call in mock_session.execute.await_args_list
+        ]
+        assert statements == [
+            "CREATE TABLE IF NOT EXISTS schedule_e_itemized_2022 "
+            "PARTITION OF schedule_e_itemized FOR VALUES IN (2022)",
+            "CREATE TABLE IF NOT EXISTS schedule_e_itemized_2024 "
+            "PARTITION OF schedule_e_itemized FOR VALUES IN (2024)",
+        ]
+        mock_session.commit.assert_awaited_once()
+
+    async def test_reconcile_full_joins_against_aggregates(self):
+        mismatch = {
+            "candidate_id": "P00000001",
+            "support_oppose_indicator": "O",
+            "itemized_total": 1250.5,
+            "aggregate_total": None,
+        }
+        session = AsyncMock()
+        session.execute.return_value = mappings_result([mismatch])
+
+        result = await ScheduleEItemizedService(db=session).reconcile_totals(2024)
+
+        assert result == [mismatch]
+        sql = str(
+            session.execute.await_args.args[0].compile(dialect=postgresql.dialect())
+        )
+        assert "FULL OUTER JOIN" in sql
+        assert "schedule_e_totals_by_candidate" in sql
+        assert "memo_code" in sql
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestManagerReconcile:
+    async def test_reconcile_schedule_e(self, manager, mocker):
+        session = AsyncMock()
+        factory = mocker.patch("civic_lantern.jobs.manager.AsyncSessionLocal")
+        factory.return_value.__aenter__.return_value = session
+        reconcile = mocker.patch.object(
+            ScheduleEItemizedService, "reconcile_totals", return_value=[]
+        )
+
+        assert await manager.reconcile_schedule_e(2024, tolerance=5) == []
+        reconcile.assert_awaited_once_with(2024, 5)
@@ -31,7 +31,9 @@ class TestScheduleETotalsByCandidateIngestor:
         )
         result = await ingestor.fetch(cycle=2024)
 
-        mock_client.get_candidate_schedule_e_totals.assert_awaited_once_with(cycle=2024)
+        mock_client.get_candidate_schedule_e_totals.assert_awaited_once_with(
+            cycle=2024, dead_letters=None
+        )
         assert len(result) == 1
 
     async def test_fetch_strips_date_kwargs(self, mock_client, mock_session):
@@ -43,7 +45,9 @@ class TestScheduleETotalsByCandidateIngestor:
         )
         await ingestor.fetch(cycle=2024, start_date="2024-01-01", end_date="2024-12-31")
 
-        mock_client.get_candidate_schedule_e_totals.assert_awaited_once_with(cycle=2024)
+        mock_client.get_candidate_schedule_e_totals.assert_awaited_once_with(
+            cycle=2024, dead_letters=None
+        )
 
     async def test_fetch_default_cycle_is_2024(self, mock_client, mock_session):
         mock_client.get_candidate_schedule_e_totals.return_value = []
@@ -53,7 +57,9 @@ class TestScheduleETotalsByCandidateIngestor:
         )
         await ingestor.fetch()
 
-        mock_client.get_candidate_schedule_e_totals.assert_awaited_once_with(cycle=2024)
+        mock_client.get_candidate_schedule_e_totals.assert_awaited_once_with(
+            cycle=2024, dead_letters=None
+        )
 
     @patch(
         "civic_lantern.jobs.ingestors.schedule_e_totals_by_candidate"
@@ -71,7 +77,9 @@ class TestScheduleETotalsByCandidateIngestor:
         )
         result = ingestor.transform(raw)
 
-        mock_transform.assert_called_once_with(raw)
+        mock_transform.assert_called_once_with(
+            raw, columns=ingestor.create_service().columns
+        )
         assert result == ["validated"]
 
     async def test_create_service_returns_correct_type(self, mock_client, mock_session):
@@ -0,0 +1,172 @@
+from datetime import date
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from civic_lantern.jobs.ingestors.candidates import CandidateIngestor
+from civic_lantern.services.data.sync_watermark import SyncWatermarkService
+from civic_lantern.services.fec_exceptions import FECServerError
+from tests.unit.conftest import PagedIngestor
+
+
+class WatermarkedIngestor(PagedIngestor):
+    watermark_field = "last_file_date"
+    since = "unset"
+
+    async def fetch(self, since=None, **kwargs: Any) -> list:
+        self.since = since
+        return await super().fetch(**kwargs)
+
+    async def fetch_pages(self, since=None, **kwargs: Any):
+        self.since = since
+        async for page in self._until_watermark(self._stream(), since):
+            yield page
+
+    def _stream(self):
+        return super().fetch_pages()
+
+    def transform(self, raw_data: List[Dict[str, Any]]) -> list:
+        return [
+            SimpleNamespace(
+                id=record["id"],
+                last_file_date=date.fromisoformat(record["last_file_date"]),
+            )
+            for record in raw_data
+        ]
+
+
+def _upserted_ids(ingestor):
+    return [record.id for record in ingestor.upserted]
+
+
+def _page(*rows):
+    return [{"id": id, "last_file_date": filed} for id, filed in rows]
+
+
+@pytest.fixture
+def watermarks(mocker):
+    get = mocker.patch.object(SyncWatermarkService, "get_high_water")
+    advance = mocker.patch.object(SyncWatermarkService, "advance")
+    return SimpleNamespace(get=get, advance=advance)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestIncrementalSync:
+    async def test_advances_watermark_to_newest_upserted_date(
+        self, make_ingestor, watermarks
+    ):
+        watermarks.get.return_value = date(2024, 1, 1)
+        ingestor = make_ingestor(
+            WatermarkedIngestor,
+            pages=[_page((1, "2024-03-02"), (2, "2024-02-01"))],
+        )
+
+        await ingestor.run(incremental=True, resume=False, run_id="r1")
+
+        assert ingestor.since == date(2024, 1, 1)
+        watermarks.advance.assert_awaited_once_with(
+            "fake", "last_file_date", date(2024, 3, 2), "r1"
+        )
+
+    async def test_first_sync_is_a_full_pull(self, make_ingestor, watermarks):
+        watermarks.get.return_value = None
+        ingestor = make_ingestor(WatermarkedIngestor, pages=[_page((1, "2020-05-05"))])
+
+        await ingestor.run(incremental=True, resume=False, run_id="r1")
+
+        assert ingestor.since is None
+        assert _upserted_ids(ingestor) == [1]
+        watermarks.advance.assert_awaited_once()
+
+    async def test_stops_at_already_synced_page(self, make_ingestor, watermarks):
+        watermarks.get.return_value = date(2024, 1, 1)
+        ingestor = make_ingestor(
+            WatermarkedIngestor,
+            pages=[
+                _page((1, "2024-02-01"), (2, "2023-12-30")),
+                _page((3, "2023-12-01")),
+                _page((4, "2024-06-01")),
+            ],
+        )
+
+        await ingestor.run(incremental=True, resume=False, run_id="r1")
+
+        assert _upserted_ids(ingestor) == [1, 2]
+
+    async def test_row_errors_keep_the_old_watermark(self, make_ingestor, watermarks):
+        watermarks.get.return_value = date(2024, 1, 1)
+        ingestor = make_ingestor(
+            WatermarkedIngestor,
+            pages=[_page((1, "2024-03-02"))],
+            errors=1,
+            pipelined=False,
+        )
+
+        await ingestor.run(incremental=True, run_id="r1")
+
+        watermarks.advance.assert_not_awaited()
+
+    async def test_dead_lettered_page_keeps_the_old_watermark(
+        self, make_ingestor, watermarks
+    ):
+        watermarks.get.return_value = date(2024, 1, 1)
+        ingestor = make_ingestor(WatermarkedIngestor, pages=[_page((1, "2024-03-02"))])
+        stream = ingestor._stream
+
+        async def stream_then_fail():
+            async for page in stream():
+                yield page
+            ingestor.dead_letters.record("http://test", {}, 2, FECServerError("down"))
+
+        ingestor._stream = stream_then_fail
+
+        stats = await ingestor.run(incremental=True, resume=False, run_id="r1")
+
+        assert _upserted_ids(ingestor) == [1]
+        assert stats["dead_lettered"] == 1
+        watermarks.advance.assert_not_awaited()
+
+    async def test_full_run_leaves_watermark_alone(self, make_ingestor, watermarks):
+        ingestor = make_ingestor(WatermarkedIngestor, pages=[_page((1, "2024-03-02"))])
+
+        await ingestor.run(resume=False)
+
+        watermarks.get.assert_not_awaited()
+        watermarks.advance.assert_not_awaited()
+
+    async def test_rejects_ingestor_without_watermark_field(self, make_ingestor):
+        ingestor = make_ingestor(WatermarkedIngestor, pages=[])
+        ingestor.watermark_field = None
+
+        with pytest.raises(ValueError, match="incremental"):
+            await ingestor.run(incremental=True)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestIncrementalParams:
+    async def test_since_requests_changes_newest_first(self, mock_client, mock_session):
+        ingestor = CandidateIngestor(mock_client, mock_session)
+
+        await ingestor.fetch(since=date(2024, 1, 1))
+
+        mock_client.get_candidates.assert_awaited_once_with(
+            dead_letters=None,
+            min_last_file_date="2024-01-01",
+            sort="-last_file_date",
+        )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSyncWatermarkService:
+    async def test_advance_never_moves_the_mark_back(self, mock_session):
+        service = SyncWatermarkService(db=mock_session)
+
+        await service.advance("candidates", "last_file_date", date(2024, 3, 2), "r1")
+
+        sql = str(mock_session.execute.await_args.args[0])
+        assert "greatest" in sql.lower()
+        mock_session.commit.assert_awaited_once()
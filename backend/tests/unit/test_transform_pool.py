@@ -0,0 +1,149 @@
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from civic_lantern.jobs.ingestors.candidates import CandidateIngestor
+from civic_lantern.jobs.ingestors.inside_totals_by_candidate import (
+    InsideTotalsByCandidateIngestor,
+)
+from civic_lantern.jobs.ingestors.schedule_e_itemized import ScheduleEItemizedIngestor
+from civic_lantern.jobs.transform_pool import TransformPool
+from civic_lantern.schemas.candidate import CandidateIn
+from civic_lantern.services.data.candidate import CandidateService
+from civic_lantern.utils.transformers import transform_candidates
+
+COLUMNS = CandidateService(db=None).columns
+
+RAW = [
+    {"candidate_id": "H001", "name": "SMITH, JANE", "office": "h", "district": "9"},
+    {"candidate_id": "S002", "name": "   "},
+    {"candidate_id": "P003", "name": "DOE, JOHN JR", "cycles": [2024]},
+]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestTransformPool:
+    async def test_small_inputs_stay_in_process(self):
+        pool = TransformPool(workers=2, min_records=10)
+        transformer = MagicMock(return_value=["ok"])
+
+        assert await pool.run(transformer, RAW, cycle=2024) == ["ok"]
+        transformer.assert_called_once_with(RAW, cycle=2024)
+        assert pool._executor is None
+
+    async def test_zero_workers_disables_the_pool(self):
+        pool = TransformPool(workers=0, min_records=0)
+
+        records = await pool.run(transform_candidates, RAW)
+
+        assert [r.candidate_id for r in records] == ["H001", "P003"]
+        assert pool._executor is None
+
+    async def test_workers_match_in_process_results_and_logs(self, caplog):
+        caplog.set_level(logging.INFO)
+        pool = TransformPool(workers=2, min_records=1)
+        try:
+            records = await pool.run(transform_candidates, RAW)
+        finally:
+            pool.close()
+
+        assert records == transform_candidates(RAW)
+        assert all(isinstance(record, CandidateIn) for record in records)
+        skipped = [r for r in caplog.records if r.message.startswith("Skipping")]
+        # Once from the worker, once from the in-process comparison above.
+        assert len(skipped) == 2
+        assert skipped[0].name == "civic_lantern.utils.transformers"
+        assert skipped[0].levelno == logging.WARNING
+
+    async def test_row_output_is_passed_through(self):
+        pool = TransformPool(workers=2, min_records=1)
+        try:
+            rows = await pool.run(transform_candidates, RAW, columns=COLUMNS)
+        finally:
+            pool.close()
+
+        assert rows == transform_candidates(RAW, columns=COLUMNS)
+        assert all(isinstance(row, dict) for row in rows)
+
+
+def _pool(records):
+    pool = AsyncMock(spec=TransformPool)
+    pool.run.return_value = records
+    return pool
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestIngestorTransformPool:
+    async def test_record_local_transform_is_split_and_deduped(
+        self, mock_client, mock_session
+    ):
+        older = {"candidate_id": "H001", "name": "Older"}
+        newer = {"candidate_id": "H001", "name": "Newer"}
+        pool = _pool([older, newer])
+        ingestor = CandidateIngestor(mock_client, mock_session, transform_pool=pool)
+
+        records = await ingestor._transform(RAW)
+
+        assert records == [newer]
+        pool.run.assert_awaited_once_with(
+            transform_candidates, RAW, split=True, columns=COLUMNS
+        )
+
+    async def test_aggregating_transform_runs_whole(self, mock_client, mock_session):
+        pool = _pool([])
+        ingestor = InsideTotalsByCandidateIngestor(
+            mock_client, mock_session, transform_pool=pool
+        )
+
+        await ingestor._transform(RAW)
+
+        assert pool.run.await_args.kwargs["split"] is False
+
+    async def test_transformer_kwargs_reach_the_pool(self, mock_client, mock_session):
+        pool = _pool([])
+        ingestor = ScheduleEItemizedIngestor(
+            mock_client, mock_session, transform_pool=pool
+        )
+        ingestor.cycle = 2022
+
+        await ingestor._transform(RAW)
+
+        kwargs = pool.run.await_args.kwargs
+        assert kwargs["split"] is True
+        assert kwargs["cycle"] == 2022
+        assert "sub_id" in kwargs["columns"]
+
+    async def test_default_pipelined_chunks_reach_the_pool(self, make_ingestor):
+        pages = [
+            [
+                {"candidate_id": f"H{page:02}{n:03}", "name": "SMITH, JANE"}
+                for n in range(250)
+            ]
+            for page in range(4)
+        ]
+        pool = TransformPool(workers=2)
+        ingestor = make_ingestor(
+            pages=pages, transformer=transform_candidates, transform_pool=pool
+        )
+        ingestor.service.columns = COLUMNS
+        ingestor.service.index_elements = ["candidate_id"]
+        try:
+            await ingestor.run()
+            assert pool._executor is not None
+        finally:
+            pool.close()
+
+        assert ingestor.pipeline_chunk_size >= pool.min_records
+        assert len(ingestor.upserted) == 1000
+
+    async def test_without_pool_transform_runs_in_process(
+        self, mock_client, mock_session
+    ):
+        ingestor = CandidateIngestor(mock_client, mock_session)
+
+        records = await ingestor._transform(RAW)
+
+        assert [r["candidate_id"] for r in records] == ["H001", "P003"]
@@ -1,7 +1,10 @@
+import logging
+
 import pytest
 from pydantic import ValidationError
 
 from civic_lantern.schemas.candidate import CandidateIn
+from civic_lantern.utils import transformers
 from civic_lantern.utils.transformers import transform_candidates
 
 
@@ -91,3 +94,60 @@ class TestCandidateValidation:
         raw = {"candidate_id": "C001", "name": input_name}
         result = CandidateIn.model_validate(raw)
         assert result.name == expected
+
+
+@pytest.mark.unit
+class TestTransformDedupe:
+    def test_last_valid_duplicate_wins(self, caplog):
+        caplog.set_level(logging.INFO)
+        raw_list = [
+            {"candidate_id": "C001", "name": "FIRST, ONE"},
+            {"candidate_id": "C002", "name": "OTHER, TWO"},
+            {"candidate_id": "C001", "name": "LATEST, ONE"},
+        ]
+
+        results = transform_candidates(raw_list)
+
+        assert [r.name for r in results] == ["One Latest", "Two Other"]
+        assert "Dropped 1 duplicate candidate_id(s)." in caplog.text
+        assert "Successfully transformed 2/3 records." in caplog.text
+
+    def test_invalid_last_duplicate_keeps_earlier_valid_one(self):
+        raw_list = [
+            {"candidate_id": "C001", "name": "SMITH, JANE"},
+            {"candidate_id": "C001", "name": "   "},
+        ]
+
+        results = transform_candidates(raw_list)
+
+        assert [(r.candidate_id, r.name) for r in results] == [("C001", "Jane Smith")]
+
+    def test_falls_back_to_latest_valid_earlier_duplicate(self):
+        raw_list = [
+            {"candidate_id": "C001", "name": "FIRST, ONE"},
+            {"candidate_id": "C001", "name": "SECOND, ONE"},
+            {"candidate_id": "C001", "name": ""},
+        ]
+
+        results = transform_candidates(raw_list)
+
+        assert [r.name for r in results] == ["One Second"]
+
+    def test_duplicates_are_validated_once(self, mocker):
+        validate = mocker.spy(transformers, "_validate_chunk")
+        raw_list = [
+            {"candidate_id": "C001", "name": "FIRST, ONE"},
+            {"candidate_id": "C002", "name": "OTHER, TWO"},
+            {"candidate_id": " C001 ", "name": "LATEST, ONE"},
+        ]
+
+        transform_candidates(raw_list)
+
+        (chunk, _), _ = validate.call_args
+        assert [raw["name"] for raw in chunk] == ["LATEST, ONE", "OTHER, TWO"]
+
+    def test_records_without_an_id_fail_individually(self, caplog):
+        results = transform_candidates([{"name": "SMITH, JANE"}, {"name": "DOE, JOHN"}])
+
+        assert results == []
+        assert caplog.text.count("Skipping candidate index") == 2